@@ -1 +1,2 @@
 from .sistema import SistemaAnaliseEngajamento
+from .sistema_particionado import SistemaAnaliseParticionado
@@ -0,0 +1,158 @@
+"""
+Linha de comando não interativa: carrega um ou mais CSVs, gera os relatórios pedidos e termina.
+
+Os arquivos podem ser caminhos, diretórios (todos os *.csv, comprimidos ou não) ou padrões glob entre aspas ("exportacoes/*.csv"),
+lidos por threads concorrentes e aplicados na ordem informada (ver analise.ingestao_arquivos).
+
+Sem menus, entradas ou limpeza de tela, para uso em scripts, cron e pipelines. Os relatórios vão para a saída padrão
+(ou, com --saida DIRETORIO, um arquivo por relatório); mensagens de progresso e erros de leitura vão para stderr.
+Na saída padrão, vários relatórios em json formam um único objeto {nome do relatório: relatório}; em csv, mais de um
+relatório exige --saida.
+
+Uso (a partir da raiz do projeto):
+    python -m analise interacoes_globo.csv [outro.csv diretorio/ "padrao*.csv" ...] [--modo streaming] [--leitores 4]
+        [--relatorios atividade_usuarios,secoes_analiticas] [--top-n 10] [--formato texto|csv|json] [--saida DIRETORIO] [--inicio 2024-10-20] [--fim 2024-10-21]
+        [--colunar] [--motor vetorizado] [--estrito] [--instrumentacao [ARQUIVO_JSON]] [--silencioso]
+
+Códigos de saída:
+    0  sucesso;
+    1  algum arquivo não pôde ser lido (os relatórios usam os demais; se nenhum foi lido, não são gerados);
+    2  argumentos inválidos;
+    3  com --estrito, alguma linha foi rejeitada (os relatórios são gerados mesmo assim).
+"""
+import argparse
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from analise.ingestao_arquivos import NUM_LEITORES_PADRAO, ResultadoArquivo
+from analise.instrumentacao import exibir_instrumentacao
+from analise.renderizacao import FORMATOS, RELATORIOS, renderizar, renderizar_json_combinado
+from analise.sistema import MODOS_PROCESSAMENTO, MOTORES_RELATORIO, TAMANHO_LOTE_PADRAO, SistemaAnaliseEngajamento
+
+SAIDA_SUCESSO = 0
+SAIDA_ERRO_LEITURA = 1
+SAIDA_ARGUMENTOS_INVALIDOS = 2
+SAIDA_LINHAS_REJEITADAS = 3
+
+# Relatórios que aceitam --top-n
+RELATORIOS_COM_TOP_N = ("atividade_usuarios", "engajamento_conteudos")
+
+EXTENSOES = {"texto": "txt", "csv": "csv", "json": "json"}
+
+
+def ler_argumentos(argumentos: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m analise", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("arquivos", nargs="+", help="CSVs, diretórios ou padrões glob, processados na ordem informada")
+    parser.add_argument("--modo", default="fila", choices=MODOS_PROCESSAMENTO, help="modo de processamento do CSV")
+    parser.add_argument("--tamanho-lote", type=int, default=TAMANHO_LOTE_PADRAO)
+    parser.add_argument("--processos", type=int, default=None, help="processos do modo paralelo (padrão: CPUs)")
+    parser.add_argument("--leitores", type=int, default=None,
+                        help=f"arquivos lidos ao mesmo tempo nos modos fila e streaming (padrão: {NUM_LEITORES_PADRAO})")
+    parser.add_argument("--relatorios", default="secoes_analiticas",
+                        help=f"relatórios separados por vírgula, 'todos' ou '' (nenhum): {', '.join(RELATORIOS)}")
+    parser.add_argument("--top-n", type=int, default=None, help=f"limite de linhas de {', '.join(RELATORIOS_COM_TOP_N)}")
+    parser.add_argument("--formato", default="texto", choices=FORMATOS)
+    parser.add_argument("--saida", default=None, help="diretório onde cada relatório é gravado (padrão: saída padrão)")
+    parser.add_argument("--inicio", type=datetime.fromisoformat, default=None, help="início da janela (ISO 8601)")
+    parser.add_argument("--fim", type=datetime.fromisoformat, default=None, help="fim da janela, exclusivo (ISO 8601)")
+    parser.add_argument("--colunar", action="store_true", help="usa o armazenamento colunar")
+    parser.add_argument("--motor", default="python", choices=MOTORES_RELATORIO, help="motor de secoes_analiticas")
+    parser.add_argument("--estrito", action="store_true", help="termina com código 3 se alguma linha for rejeitada")
+    parser.add_argument("--instrumentacao", nargs="?", const="", metavar="ARQUIVO_JSON",
+                        help="mede as fases da execução; o resumo vai para ARQUIVO_JSON ou, sem ele, para stderr")
+    parser.add_argument("--silencioso", action="store_true", help="não escreve o progresso em stderr")
+    args = parser.parse_args(argumentos)
+
+    if args.relatorios.strip() == "todos":
+        args.relatorios = list(RELATORIOS)
+    else:
+        args.relatorios = [nome.strip() for nome in args.relatorios.split(",") if nome.strip()]
+    invalidos = [nome for nome in args.relatorios if nome not in RELATORIOS]
+    if invalidos:
+        parser.error(f"relatórios inválidos: {', '.join(invalidos)}. Permitidos: {', '.join(RELATORIOS)}")
+    if args.top_n is not None and args.top_n < 0:
+        parser.error("--top-n deve ser um inteiro não negativo")
+    if args.formato == "csv" and args.saida is None and len(args.relatorios) > 1:
+        parser.error("mais de um relatório em csv requer --saida (um arquivo por relatório)")
+    if args.motor == "vetorizado" and not args.colunar:
+        parser.error("--motor vetorizado requer --colunar")
+    return args
+
+
+# Parâmetros do método calcular_<nome> correspondentes aos argumentos da linha de comando
+def parametros_relatorio(nome: str, args: argparse.Namespace) -> dict:
+    parametros = {"inicio": args.inicio, "fim": args.fim}
+    if nome in RELATORIOS_COM_TOP_N:
+        parametros["top_n"] = args.top_n
+    if nome == "secoes_analiticas":
+        parametros["motor"] = args.motor
+    return parametros
+
+
+def main(argumentos: list[str] | None = None) -> int:
+    args = ler_argumentos(argumentos)
+
+    def informar(mensagem: str) -> None:
+        if not args.silencioso:
+            print(mensagem, file=sys.stderr)
+
+    sistema = SistemaAnaliseEngajamento(armazenamento_colunar=args.colunar,
+                                        instrumentacao=args.instrumentacao is not None)
+
+    def exibir_progresso(resultado: ResultadoArquivo, posicao: int, total: int) -> None:
+        if resultado.erro is not None:
+            print(f"[{posicao}/{total}] {resultado.arquivo}: ERRO após {resultado.linhas} linhas - {resultado.erro}",
+                  file=sys.stderr)
+        else:
+            informar(f"[{posicao}/{total}] {resultado.arquivo}: {resultado.linhas} linhas em {resultado.segundos:.3f} s")
+
+    # As mensagens do sistema durante a leitura (linha inválida) vão para stderr,
+    # para não se misturarem aos relatórios na saída padrão
+    inicio = time.perf_counter()
+    with redirect_stdout(sys.stderr):
+        lidas = sistema.processar_interacoes_csv(args.arquivos, modo=args.modo, tamanho_lote=args.tamanho_lote,
+                                                 num_processos=args.processos, num_leitores=args.leitores,
+                                                 progresso=exibir_progresso)
+        sistema.processar_interacoes_da_fila()
+    segundos = time.perf_counter() - inicio
+
+    if lidas is None:
+        return SAIDA_ERRO_LEITURA
+    falhas = sum(resultado.erro is not None for resultado in sistema.resultados_ingestao)
+    informar(f"Total: {lidas} linhas de {len(sistema.resultados_ingestao) - falhas} arquivos em {segundos:.3f} s "
+             f"({lidas / max(segundos, 1e-9):,.0f} linhas/s), {sistema.linhas_rejeitadas} linhas rejeitadas, "
+             f"{falhas} arquivos com erro")
+
+    if args.saida is not None:
+        os.makedirs(args.saida, exist_ok=True)
+    if args.formato == "json" and args.saida is None and len(args.relatorios) > 1:
+        # Um único documento na saída padrão, em vez de vários objetos JSON concatenados
+        renderizar_json_combinado({nome: getattr(sistema, f"calcular_{nome}")(**parametros_relatorio(nome, args))
+                                   for nome in args.relatorios})
+    else:
+        for nome in args.relatorios:
+            resultado = getattr(sistema, f"calcular_{nome}")(**parametros_relatorio(nome, args))
+            destino = None
+            if args.saida is not None:
+                destino = os.path.join(args.saida, f"{nome}.{EXTENSOES[args.formato]}")
+            renderizar(nome, resultado, formato=args.formato, destino=destino)
+
+    if sistema.instrumentacao is not None:
+        if args.instrumentacao:
+            exibir_instrumentacao(sistema.instrumentacao.resumo(), formato="json", destino=args.instrumentacao)
+        else:
+            exibir_instrumentacao(sistema.instrumentacao.resumo(), destino=sys.stderr)
+
+    if falhas:
+        return SAIDA_ERRO_LEITURA
+    if args.estrito and sistema.linhas_rejeitadas > 0:
+        return SAIDA_LINHAS_REJEITADAS
+    return SAIDA_SUCESSO
+
+
+if __name__ == "__main__":
+    sys.exit(main())
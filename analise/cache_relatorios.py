@@ -0,0 +1,130 @@
+"""
+Cache dos resultados dos relatórios (métodos calcular_*) do SistemaAnaliseEngajamento.
+
+Cada resultado é guardado pela chave (nome do relatório, parâmetros), com os parâmetros normalizados pela assinatura
+do método: `calcular_atividade_usuarios(5)` e `calcular_atividade_usuarios(top_n=5)` são o mesmo relatório.
+O sistema mantém um contador de versão dos dados, incrementado a cada linha aplicada nas árvores; quando a versão
+muda, todo o cache é descartado. O tamanho é limitado por 'capacidade', descartando o relatório usado há mais tempo (LRU).
+
+Os gerar_relatorio_* chamam os calcular_*, então repetir um relatório sem dados novos só refaz a impressão.
+Cada chamada recebe a sua própria cópia das listas e dicionários do resultado (as tuplas e os valores imutáveis
+são compartilhados), então alterar o que foi devolvido não afeta as consultas seguintes.
+"""
+import functools
+import inspect
+from collections import OrderedDict
+
+# Quantidade de relatórios (nome + parâmetros) guardados por padrão
+CAPACIDADE_PADRAO = 128
+
+
+class CacheRelatorios:
+    def __init__(self, capacidade: int = CAPACIDADE_PADRAO) -> None:
+        if capacidade < 0:
+            raise ValueError("A capacidade do cache deve ser um inteiro não negativo.")
+
+        self._capacidade = capacidade
+        self._resultados: OrderedDict = OrderedDict()  # do usado há mais tempo para o mais recente
+        self._versao_dados: int | None = None
+
+        self._acertos = 0
+        self._falhas = 0
+        self._invalidacoes = 0
+        self._descartes = 0
+
+    @property
+    def capacidade(self) -> int:
+        return self._capacidade
+
+    # Contadores de uso: acertos, falhas, invalidações (cache descartado por dados novos),
+    # descartes (entradas removidas pelo limite de capacidade) e o tamanho atual
+    @property
+    def estatisticas(self) -> dict[str, int]:
+        return {
+            "acertos": self._acertos,
+            "falhas": self._falhas,
+            "invalidacoes": self._invalidacoes,
+            "descartes": self._descartes,
+            "tamanho": len(self._resultados),
+            "capacidade": self._capacidade,
+        }
+
+    # Complexidade:
+    # Pior caso:   O(r) + custo de 'calcular' - relatório ainda não guardado para esta versão dos dados.
+    # Melhor caso: Ω(r) - acerto: consulta e reordenação no OrderedDict, mais a cópia dos r itens do resultado.
+    # Caso médio:  Θ(r) nos acertos; nas falhas, o custo do próprio relatório.
+    # --------------------------------------------------------------------------------------------
+    # Devolve uma cópia do resultado guardado para 'chave' ou o calcula (e guarda) com 'calcular()'.
+    def obter(self, chave, versao_dados: int, calcular):
+        if versao_dados != self._versao_dados:
+            if self._resultados:
+                self._invalidacoes += 1
+                self._resultados.clear()
+            self._versao_dados = versao_dados
+
+        try:
+            resultado = self._resultados[chave]
+        except KeyError:
+            pass
+        except TypeError:
+            # Parâmetro não hashable: o relatório é calculado sem passar pelo cache
+            self._falhas += 1
+            return calcular()
+        else:
+            self._resultados.move_to_end(chave)
+            self._acertos += 1
+            return _copiar_resultado(resultado)
+
+        self._falhas += 1
+        resultado = calcular()
+        if self._capacidade > 0:
+            self._resultados[chave] = resultado
+            if len(self._resultados) > self._capacidade:
+                self._resultados.popitem(last=False)
+                self._descartes += 1
+            return _copiar_resultado(resultado)
+        return resultado
+
+    # Descarta todos os resultados guardados (as estatísticas continuam)
+    def limpar(self) -> None:
+        self._resultados.clear()
+        self._versao_dados = None
+
+    def __len__(self) -> int:
+        return len(self._resultados)
+
+
+# Complexidade: O(r) - copia as listas e dicionários do resultado (também os aninhados em tuplas, como os
+# comentários de calcular_comentarios_por_conteudo); tuplas sem containers e valores imutáveis são reaproveitados.
+def _copiar_resultado(valor):
+    if isinstance(valor, list):
+        return [_copiar_resultado(item) for item in valor]
+    if isinstance(valor, dict):
+        return {chave: _copiar_resultado(item) for chave, item in valor.items()}
+    if isinstance(valor, tuple) and any(isinstance(item, (list, dict)) for item in valor):
+        return tuple(_copiar_resultado(item) for item in valor)
+    return valor
+
+
+"""
+Decorador dos métodos calcular_* do sistema: consulta `self._cache_relatorios` com a versão `self._versao_dados`.
+Com a instrumentação ligada (`self._instrumentacao`), a duração de cada chamada, com ou sem acerto no cache,
+vai para o histograma "relatorio.<nome do método>".
+
+- Complexidade: O(p) por chamada para normalizar os p parâmetros, mais o custo de CacheRelatorios.obter.
+"""
+def relatorio_em_cache(metodo):
+    assinatura = inspect.signature(metodo)
+
+    @functools.wraps(metodo)
+    def calcular_com_cache(self, *args, **kwargs):
+        argumentos = assinatura.bind(self, *args, **kwargs)
+        argumentos.apply_defaults()
+        chave = (metodo.__name__, tuple(argumentos.arguments.items())[1:])
+        calcular = lambda: metodo(self, *args, **kwargs)
+        if self._instrumentacao is None:
+            return self._cache_relatorios.obter(chave, self._versao_dados, calcular)
+        with self._instrumentacao.medir(f"relatorio.{metodo.__name__}"):
+            return self._cache_relatorios.obter(chave, self._versao_dados, calcular)
+
+    return calcular_com_cache
@@ -0,0 +1,187 @@
+"""
+Ingestão de vários arquivos CSV (lista de caminhos, diretório ou padrão glob) com leitores concorrentes.
+
+Cada arquivo é lido por uma thread de um ThreadPoolExecutor, que entrega lotes de linhas (dicionários, como os do
+csv.DictReader) em uma Fila limitada própria do arquivo. O consumidor (a thread que chamou processar_interacoes_csv)
+aplica os arquivos na ordem em que foram informados: enquanto ele processa um arquivo, os seguintes já estão sendo
+lidos, e a leitura/decodificação de disco se sobrepõe ao processamento. Como a ordem de aplicação é a da lista,
+o resultado é o mesmo de processar os arquivos um após o outro.
+
+A memória fica limitada a `num_leitores` arquivos em leitura, com até LOTES_A_FRENTE lotes pendentes cada.
+A conversão das linhas em Python continua sujeita ao GIL; o ganho vem das esperas de E/S (e, nos arquivos
+comprimidos, da descompressão, que libera o GIL) sobrepostas ao trabalho do consumidor.
+
+Um erro de leitura (arquivo ausente, sem permissão, conteúdo inválido) encerra apenas o arquivo em que ocorreu;
+as linhas dele já aplicadas permanecem, como na leitura de um único arquivo, e os demais arquivos seguem normalmente.
+
+Arquivos comprimidos (.csv.gz, .csv.bz2, .csv.xz) são descomprimidos em fluxo, sem arquivo temporário em disco:
+o formato vem da extensão ou, sem extensão conhecida, dos bytes mágicos do início do arquivo (ver abrir_csv).
+"""
+import bz2
+import csv
+import glob
+import gzip
+import io
+import lzma
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import NamedTuple
+
+from estruturas_dados.fila import Fila
+
+# Leitores simultâneos por padrão (limitado pela quantidade de arquivos)
+NUM_LEITORES_PADRAO = 4
+
+# Lotes que cada leitor pode ter lido à frente do consumidor
+LOTES_A_FRENTE = 4
+
+# Buffer de leitura dos CSVs: leituras grandes reduzem as chamadas ao sistema e ao descompressor
+TAMANHO_BUFFER_LEITURA = 1024 * 1024
+
+# Formato de compressão -> (bytes mágicos do início do arquivo, função que abre o arquivo em modo binário)
+COMPRESSOES = {
+    "gzip": (b"\x1f\x8b", gzip.open),
+    "bz2": (b"BZh", bz2.open),
+    "xz": (b"\xfd7zXZ\x00", lzma.open),
+}
+EXTENSOES_COMPRESSAO = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+# Extensões procuradas nos diretórios
+EXTENSOES_CSV = (".csv", *(".csv" + extensao for extensao in EXTENSOES_COMPRESSAO))
+
+
+class ResultadoArquivo(NamedTuple):
+    arquivo: str
+    linhas: int            # linhas de dados lidas (mesmo se o arquivo falhou no meio)
+    erro: str | None       # mensagem do erro de leitura, ou None se o arquivo foi lido até o fim
+    segundos: float
+
+
+# Complexidade: O(1) - consulta à extensão e, se ela não for conhecida, leitura dos primeiros bytes.
+# Formato de compressão do arquivo ("gzip", "bz2", "xz") ou None se for texto puro; lança OSError se não puder abri-lo.
+def detectar_compressao(caminho_arquivo: str) -> str | None:
+    extensao = os.path.splitext(os.fspath(caminho_arquivo))[1].lower()
+    if extensao in EXTENSOES_COMPRESSAO:
+        return EXTENSOES_COMPRESSAO[extensao]
+
+    with open(caminho_arquivo, mode="rb") as arquivo:
+        inicio = arquivo.read(max(len(magicos) for magicos, _ in COMPRESSOES.values()))
+    for formato, (magicos, _) in COMPRESSOES.items():
+        if inicio.startswith(magicos):
+            return formato
+    return None
+
+
+"""
+Abre um CSV (comprimido ou não) para leitura em modo texto UTF-8, com newline="" (as quebras de linha ficam a cargo
+do csv.reader, como nos modos paralelo e particionado); os formatos comprimidos são descomprimidos em fluxo,
+à medida que as linhas são lidas.
+
+- Complexidade: O(1) para abrir; a leitura custa O(b) para os b bytes descomprimidos.
+"""
+def abrir_csv(caminho_arquivo: str, tamanho_buffer: int = TAMANHO_BUFFER_LEITURA):
+    formato = detectar_compressao(caminho_arquivo)
+    if formato is None:
+        return open(caminho_arquivo, mode="r", encoding="utf-8", newline="", buffering=tamanho_buffer)
+
+    binario = COMPRESSOES[formato][1](caminho_arquivo, mode="rb")
+    return io.TextIOWrapper(io.BufferedReader(binario, buffer_size=tamanho_buffer), encoding="utf-8", newline="")
+
+
+"""
+Expande a entrada de processar_interacoes_csv em uma lista de caminhos de arquivo.
+
+Aceita um caminho ou uma lista de caminhos; cada item pode ser um arquivo, um diretório (todos os *.csv, *.csv.gz,
+*.csv.bz2 e *.csv.xz dele, em ordem alfabética) ou um padrão glob (as correspondências, em ordem alfabética;
+'**' percorre subdiretórios).
+Um padrão sem correspondências é mantido como caminho, para que o erro apareça no resultado desse item.
+
+- Complexidade: O(m log m) para as m correspondências dos diretórios e padrões.
+"""
+def resolver_arquivos(entrada) -> list[str]:
+    itens = [entrada] if isinstance(entrada, (str, os.PathLike)) else list(entrada)
+
+    arquivos = []
+    for item in itens:
+        item = os.fspath(item)
+        if os.path.isdir(item):
+            arquivos.extend(sorted(
+                caminho for caminho in glob.glob(os.path.join(glob.escape(item), "*"))
+                if caminho.lower().endswith(EXTENSOES_CSV) and os.path.isfile(caminho)
+            ))
+        elif glob.has_magic(item):
+            correspondencias = sorted(glob.glob(item, recursive=True))
+            arquivos.extend(correspondencias or [item])
+        else:
+            arquivos.append(item)
+    return arquivos
+
+
+# Executada nas threads leitoras: enfileira os lotes do arquivo e, se a leitura falhar, a exceção.
+# A fila é sempre fechada ao final; se o consumidor a fechou antes (desistiu da leitura), o leitor só termina.
+def _ler_arquivo(caminho_arquivo: str, fila: Fila, tamanho_lote: int) -> None:
+    try:
+        try:
+            with abrir_csv(caminho_arquivo) as arquivo_csv:
+                leitor_csv = csv.DictReader(arquivo_csv)
+                while True:
+                    lote = list(islice(leitor_csv, tamanho_lote))
+                    if not lote:
+                        break
+                    fila.enfileirar(lote)
+        except Exception as erro:
+            if not fila.fechada:
+                fila.enfileirar(erro)
+    finally:
+        fila.fechar()
+
+
+def _lotes_da_fila(fila: Fila):
+    for item in fila.drenar(bloquear=True):
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+"""
+Lê os arquivos com 'num_leitores' threads e entrega, na ordem de 'arquivos', pares (caminho, lotes).
+
+'lotes' é um iterador de listas de até 'tamanho_lote' linhas; se a leitura do arquivo falhar, a iteração lança
+a exceção original depois dos lotes lidos antes do erro. Cada iterador deve ser consumido (ou abandonado) antes
+de avançar para o próximo arquivo.
+
+- Complexidade: O(n) para as n linhas, com memória O(num_leitores * LOTES_A_FRENTE * tamanho_lote).
+"""
+def ler_arquivos_em_paralelo(arquivos: list[str], tamanho_lote: int, num_leitores: int | None = None):
+    if tamanho_lote < 1:
+        raise ValueError("O tamanho do lote deve ser um inteiro positivo.")
+    if num_leitores is not None and num_leitores < 1:
+        raise ValueError("O número de leitores deve ser um inteiro positivo.")
+    if not arquivos:
+        return
+
+    filas = [Fila(LOTES_A_FRENTE) for _ in arquivos]
+    executor = ThreadPoolExecutor(min(num_leitores or NUM_LEITORES_PADRAO, len(arquivos)),
+                                  thread_name_prefix="leitor-csv")
+    try:
+        # As tarefas são atendidas em ordem: quando o consumidor espera pelo arquivo i, o leitor dele
+        # já terminou ou está rodando, pois todos os anteriores já foram consumidos até o fim
+        for caminho_arquivo, fila in zip(arquivos, filas):
+            executor.submit(_ler_arquivo, caminho_arquivo, fila, tamanho_lote)
+
+        for caminho_arquivo, fila in zip(arquivos, filas):
+            yield caminho_arquivo, _lotes_da_fila(fila)
+    finally:
+        # Consumo interrompido: libera leitores bloqueados em filas cheias e descarta os que nem começaram
+        for fila in filas:
+            fila.fechar()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Progresso padrão da ingestão de vários arquivos: uma linha por arquivo concluído
+def exibir_progresso_arquivo(resultado: ResultadoArquivo, posicao: int, total: int) -> None:
+    if resultado.erro is None:
+        print(f"[{posicao}/{total}] {resultado.arquivo}: {resultado.linhas} linhas em {resultado.segundos:.2f} s")
+    else:
+        print(f"[{posicao}/{total}] {resultado.arquivo}: ERRO após {resultado.linhas} linhas - {resultado.erro}")
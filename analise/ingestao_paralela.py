@@ -0,0 +1,115 @@
+"""
+Leitura paralela de arquivos CSV de interações.
+
+O arquivo é dividido em intervalos de bytes alinhados em quebras de linha; cada intervalo é lido,
+convertido e validado (timestamp, int(), tipo de interação) por um processo do
+ProcessPoolExecutor. Os resultados voltam como tuplas compactas, na mesma ordem do arquivo,
+e só então são aplicados às árvores pelo processo principal — por isso o estado final é idêntico
+ao do processamento serial.
+
+Premissa: nenhum campo do CSV contém quebra de linha dentro de aspas (como nas exportações atuais).
+"""
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from analise.sistema import converter_linha_csv
+from estruturas_dados.tabela_simbolos import TabelaSimbolos
+
+# Tamanho alvo de cada intervalo enviado a um processo. Intervalos pequenos mantêm a memória
+# do processo principal limitada (poucos resultados em trânsito) e equilibram a carga entre processos.
+TAMANHO_INTERVALO_PADRAO = 8 * 1024 * 1024
+
+
+# Complexidade: O(p) leituras de linha, onde p é o número de intervalos.
+# Retorna o cabeçalho do CSV e a lista de intervalos (inicio, fim) em bytes, cobrindo o arquivo após o cabeçalho.
+def dividir_em_intervalos(caminho_arquivo: str, tamanho_intervalo: int = TAMANHO_INTERVALO_PADRAO):
+    tamanho_arquivo = os.path.getsize(caminho_arquivo)
+
+    with open(caminho_arquivo, mode="rb") as arquivo:
+        linha_cabecalho = arquivo.readline()
+        cabecalho = next(csv.reader([linha_cabecalho.decode("utf-8")]), [])
+
+        intervalos = []
+        inicio = arquivo.tell()
+        while inicio < tamanho_arquivo:
+            alvo = inicio + tamanho_intervalo
+            if alvo >= tamanho_arquivo:
+                fim = tamanho_arquivo
+            else:
+                # Avança até o fim da linha em que o alvo caiu, para nunca cortar uma linha ao meio
+                arquivo.seek(alvo)
+                arquivo.readline()
+                fim = arquivo.tell()
+            intervalos.append((inicio, fim))
+            inicio = fim
+
+    return cabecalho, intervalos
+
+
+# Executado nos processos filhos.
+# Retorna, na ordem do arquivo, uma tupla convertida por linha válida ou a mensagem de erro da linha inválida.
+def _converter_intervalo(caminho_arquivo: str, inicio: int, fim: int, cabecalho: list) -> list:
+    with open(caminho_arquivo, mode="rb") as arquivo:
+        arquivo.seek(inicio)
+        dados = arquivo.read(fim - inicio)
+
+    # Strings repetidas (nome do conteúdo, plataforma, comentário) passam a ser o mesmo objeto,
+    # o que faz o pickle enviá-las uma única vez por intervalo e reduz o volume devolvido ao processo principal.
+    # O tipo de interação já é um membro de TipoInteracao (um objeto único por tipo).
+    simbolos = TabelaSimbolos()
+
+    # O csv.reader separa os registros como a leitura serial (só em \r e \n); str.splitlines() também quebraria
+    # em \x0c, \x1c, \x85, \u2028 etc., que podem aparecer dentro de um comentário
+    resultados = []
+    for valores in csv.reader(io.StringIO(dados.decode("utf-8"), newline="")):
+        if not valores:
+            continue
+        try:
+            (id_conteudo, nome_conteudo, id_usuario, timestamp_interacao,
+             nome_plataforma, tipo_interacao, duracao, comentario) = converter_linha_csv(dict(zip(cabecalho, valores)))
+        except Exception as e:
+            resultados.append(f"Erro ao criar interação: {e}")
+            continue
+
+        resultados.append((
+            id_conteudo,
+            simbolos.internar(nome_conteudo),
+            id_usuario,
+            timestamp_interacao,
+            simbolos.internar(nome_plataforma),
+            tipo_interacao,
+            duracao,
+            simbolos.internar(comentario),
+        ))
+    return resultados
+
+
+"""
+Converte o arquivo em paralelo e entrega os resultados em ordem, intervalo por intervalo.
+
+- Melhor caso (Ω): O(n / p), com n linhas e p processos, se a conversão dominar o custo.
+- Caso médio (Θ): O(n / p + n·c), onde c é o custo (serial) de aplicar cada tupla nas árvores.
+- Pior caso (O): O(n), com um único processo.
+
+Justificativa: no máximo 2·p intervalos ficam em trânsito ao mesmo tempo, então a memória extra
+é proporcional a p · tamanho_intervalo, e não ao tamanho do arquivo.
+"""
+def converter_csv_em_paralelo(caminho_arquivo: str, num_processos: int | None = None,
+                              tamanho_intervalo: int = TAMANHO_INTERVALO_PADRAO):
+    num_processos = num_processos or os.cpu_count() or 1
+    cabecalho, intervalos = dividir_em_intervalos(caminho_arquivo, tamanho_intervalo)
+
+    with ProcessPoolExecutor(max_workers=num_processos) as executor:
+        pendentes = deque()
+
+        # Mantém a janela de tarefas cheia e consome os resultados na ordem do arquivo
+        for inicio, fim in intervalos:
+            pendentes.append(executor.submit(_converter_intervalo, caminho_arquivo, inicio, fim, cabecalho))
+            if len(pendentes) >= 2 * num_processos:
+                yield pendentes.popleft().result()
+
+        while pendentes:
+            yield pendentes.popleft().result()
@@ -0,0 +1,157 @@
+"""
+Instrumentação do SistemaAnaliseEngajamento: contadores e histogramas de latência por fase.
+
+Com `SistemaAnaliseEngajamento(instrumentacao=True)` (ou `sistema.ativar_instrumentacao()`), o sistema registra:
+    - contadores: linhas lidas e rejeitadas, acertos e falhas nas árvores de conteúdos e de usuários;
+    - histogramas de latência (em nanossegundos): leitura do CSV, conversão de cada linha, aplicação de cada
+      registro (Interacao, árvores e plataforma), processamento da fila e cada relatório calcular_*;
+    - histograma de tamanhos das seleções de ranking dos relatórios ("ordenacao.tamanho").
+
+Desligada (o padrão), a instrumentação é apenas um `None`: o sistema testa `self._instrumentacao is not None`
+por lote, por relatório ou por consulta pública, nunca por linha, e segue pelo caminho sem medições.
+
+Os histogramas usam baldes em potências de 2 (o balde de v é v.bit_length()), então ocupam memória constante
+e os percentis são aproximados pelo limite superior do balde.
+"""
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+# Percentis incluídos no resumo de cada histograma
+PERCENTIS = (50, 90, 99)
+
+
+class Histograma:
+    def __init__(self) -> None:
+        self._baldes: dict[int, int] = {}
+        self._quantidade = 0
+        self._soma = 0
+        self._minimo: int | None = None
+        self._maximo: int | None = None
+
+    # Complexidade: Θ(1) - uma atualização no dicionário de baldes.
+    def registrar(self, valor: int) -> None:
+        valor = max(0, int(valor))
+        balde = valor.bit_length()
+        self._baldes[balde] = self._baldes.get(balde, 0) + 1
+        self._quantidade += 1
+        self._soma += valor
+        if self._minimo is None or valor < self._minimo:
+            self._minimo = valor
+        if self._maximo is None or valor > self._maximo:
+            self._maximo = valor
+
+    @property
+    def quantidade(self) -> int:
+        return self._quantidade
+
+    # Complexidade: O(b) - percorre os b baldes (no máximo ~64) em ordem.
+    # Limite superior do balde que contém o percentil 'p' (0 a 100), limitado ao máximo observado.
+    def percentil(self, p: float) -> int | None:
+        if self._quantidade == 0:
+            return None
+        alvo = max(1, -(-self._quantidade * p // 100))
+        acumulado = 0
+        for balde in sorted(self._baldes):
+            acumulado += self._baldes[balde]
+            if acumulado >= alvo:
+                return min((1 << balde) - 1, self._maximo)
+        return self._maximo
+
+    def resumo(self) -> dict:
+        resumo = {
+            "quantidade": self._quantidade,
+            "soma": self._soma,
+            "minimo": self._minimo,
+            "maximo": self._maximo,
+            "media": self._soma / self._quantidade if self._quantidade else None,
+        }
+        for p in PERCENTIS:
+            resumo[f"p{p}"] = self.percentil(p)
+        return resumo
+
+
+class Instrumentacao:
+    def __init__(self) -> None:
+        self._contadores: dict[str, int] = {}
+        self._histogramas: dict[str, Histograma] = {}
+
+    # Complexidade: Θ(1)
+    def contar(self, nome: str, quantidade: int = 1) -> None:
+        self._contadores[nome] = self._contadores.get(nome, 0) + quantidade
+
+    # Complexidade: Θ(1)
+    def registrar(self, nome: str, valor: int) -> None:
+        histograma = self._histogramas.get(nome)
+        if histograma is None:
+            histograma = self._histogramas[nome] = Histograma()
+        histograma.registrar(valor)
+
+    # Registra a duração (em nanossegundos) do bloco 'with' no histograma 'fase', inclusive se ele lançar exceção
+    @contextmanager
+    def medir(self, fase: str):
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.registrar(fase, time.perf_counter_ns() - inicio)
+
+    def contador(self, nome: str) -> int:
+        return self._contadores.get(nome, 0)
+
+    def histograma(self, nome: str) -> Histograma | None:
+        return self._histogramas.get(nome)
+
+    # Contadores e resumos dos histogramas (quantidade, soma, mínimo, máximo, média e percentis), em ordem de nome
+    def resumo(self) -> dict:
+        return {
+            "contadores": {nome: self._contadores[nome] for nome in sorted(self._contadores)},
+            "histogramas": {nome: self._histogramas[nome].resumo() for nome in sorted(self._histogramas)},
+        }
+
+    def zerar(self) -> None:
+        self._contadores.clear()
+        self._histogramas.clear()
+
+
+def _texto_valor(valor) -> str:
+    if valor is None:
+        return "-"
+    if isinstance(valor, float):
+        return f"{valor:.1f}"
+    return str(valor)
+
+
+"""
+Escreve o resumo da instrumentação como texto (tabelas de contadores e de histogramas) ou JSON.
+
+Args:
+    resumo (dict): o retorno de Instrumentacao.resumo().
+    formato (str): "texto" ou "json".
+    destino: arquivo já aberto em modo texto, ou caminho de um arquivo a ser (re)escrito; None usa sys.stdout.
+"""
+def exibir_instrumentacao(resumo: dict, formato: str = "texto", destino=None) -> None:
+    if formato == "json":
+        texto = json.dumps(resumo, ensure_ascii=False, indent=2) + "\n"
+    elif formato == "texto":
+        linhas = ["\n--- Instrumentação: Contadores ---"]
+        linhas.extend(f"{nome:<48}{valor:>14}" for nome, valor in resumo["contadores"].items())
+        linhas.append("\n--- Instrumentação: Histogramas (latências em ns; ordenacao.tamanho em elementos) ---")
+        colunas = ("quantidade", "media", *(f"p{p}" for p in PERCENTIS), "maximo")
+        linhas.append(f"{'fase':<48}" + "".join(f"{coluna:>12}" for coluna in colunas))
+        linhas.extend(
+            f"{nome:<48}" + "".join(f"{_texto_valor(histograma[coluna]):>12}" for coluna in colunas)
+            for nome, histograma in resumo["histogramas"].items()
+        )
+        texto = "\n".join(linhas) + "\n"
+    else:
+        raise ValueError(f"Formato '{formato}' inválido. Permitidos: ('texto', 'json')")
+
+    if destino is None:
+        destino = sys.stdout
+    if isinstance(destino, str):
+        with open(destino, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+    else:
+        destino.write(texto)
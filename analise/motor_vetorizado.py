@@ -0,0 +1,203 @@
+"""
+Motor vetorizado do relatório analítico.
+
+Calcula as sete seções de `SistemaAnaliseEngajamento.gerar_relatorio_analitico` em uma única passada
+sobre as colunas inteiras do ArmazenamentoColunar, usando agrupamentos do NumPy (searchsorted, bincount,
+partition/lexsort) em vez de laços Python por interação. NumPy é uma dependência opcional:
+só é necessária para este motor.
+"""
+from array import array
+from collections import defaultdict
+
+from entidades.tipo_interacao import TIPOS_ENGAJAMENTO, TipoInteracao
+from estruturas_dados.selecao_top_k import selecionar_top_k
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+CODIGOS_ENGAJAMENTO = [int(tipo) for tipo in TIPOS_ENGAJAMENTO]
+CODIGO_COMENTARIO = int(TipoInteracao.COMMENT)
+
+
+class MotorRelatoriosVetorizado:
+    def __init__(self, sistema) -> None:
+        if np is None:
+            raise ImportError(
+                "O motor vetorizado requer NumPy. Instale com: pip install numpy"
+            )
+        if sistema.armazenamento_colunar is None:
+            raise ValueError(
+                "O motor vetorizado requer o sistema criado com armazenamento_colunar=True."
+            )
+        self._sistema = sistema
+        self._armazenamento = sistema.armazenamento_colunar
+
+    """
+    Calcula todas as seções do relatório analítico.
+
+    - Melhor caso (Ω): O(n + m log m), onde n é o número de interações e m o de entidades.
+    - Caso médio (Θ): O(n log m), cada coluna de IDs é mapeada para a posição da entidade com searchsorted.
+    - Pior caso (O): O(n log m), idem; todos os laços sobre n acontecem dentro do NumPy.
+
+    Justificativa: as colunas são lidas sem cópia (np.frombuffer) e agrupadas com bincount;
+    só os 10 primeiros de cada ranking voltam a ser objetos Python.
+
+    Com 'inicio'/'fim' (epochs), só as linhas com inicio <= timestamp < fim entram nos agrupamentos (máscara O(n)),
+    e cada seção considera apenas as entidades com interações na janela, como no motor Python.
+    """
+    def calcular_secoes_analiticas(self, inicio: int | None = None, fim: int | None = None) -> dict:
+        armazenamento = self._armazenamento
+        ids_conteudo = _coluna(armazenamento.ids_conteudo)
+        ids_usuario = _coluna(armazenamento.ids_usuario)
+        codigos_plataforma = _coluna(armazenamento.codigos_plataforma)
+        codigos_tipo = _coluna(armazenamento.codigos_tipo)
+        duracoes = _coluna(armazenamento.duracoes)
+
+        # Entidades na mesma ordem que o motor Python usa (percurso em ordem de ID)
+        conteudos = self._sistema.percurso_in_order()
+        usuarios = self._sistema.percurso_em_ordem()
+        plataformas = sorted(self._sistema._plataformas_registradas.values(), key=lambda p: p.id_plataforma)
+
+        com_janela = inicio is not None or fim is not None
+        if com_janela:
+            timestamps = _coluna(armazenamento.timestamps)
+            na_janela = np.ones(len(timestamps), dtype=bool)
+            if inicio is not None:
+                na_janela &= timestamps >= inicio
+            if fim is not None:
+                na_janela &= timestamps < fim
+            ids_conteudo, ids_usuario = ids_conteudo[na_janela], ids_usuario[na_janela]
+            codigos_plataforma, codigos_tipo = codigos_plataforma[na_janela], codigos_tipo[na_janela]
+            duracoes = duracoes[na_janela]
+
+        posicao_conteudo, linhas_conteudo = _posicoes(ids_conteudo, [c.id_conteudo for c in conteudos])
+        posicao_usuario, linhas_usuario = _posicoes(ids_usuario, [u.id_usuario for u in usuarios])
+
+        eh_comentario = codigos_tipo == CODIGO_COMENTARIO
+        eh_engajamento = np.isin(codigos_tipo, CODIGOS_ENGAJAMENTO)
+
+        # Agrupamentos por conteúdo
+        tempo_conteudo = _somar_por_grupo(posicao_conteudo, duracoes[linhas_conteudo], len(conteudos))
+        interacoes_conteudo = np.bincount(posicao_conteudo, minlength=len(conteudos))
+        comentarios_conteudo = np.bincount(
+            posicao_conteudo[eh_comentario[linhas_conteudo]], minlength=len(conteudos)
+        )
+
+        # Agrupamentos por usuário
+        tempo_usuario = _somar_por_grupo(posicao_usuario, duracoes[linhas_usuario], len(usuarios))
+
+        if com_janela:
+            # Mantém apenas as entidades com alguma interação na janela
+            ativos = np.nonzero(interacoes_conteudo > 0)[0]
+            conteudos = [conteudos[i] for i in ativos.tolist()]
+            tempo_conteudo, interacoes_conteudo = tempo_conteudo[ativos], interacoes_conteudo[ativos]
+            comentarios_conteudo = comentarios_conteudo[ativos]
+
+            ativos = np.nonzero(np.bincount(posicao_usuario, minlength=len(usuarios)) > 0)[0]
+            usuarios = [usuarios[i] for i in ativos.tolist()]
+            tempo_usuario = tempo_usuario[ativos]
+
+        # Agrupamentos por plataforma (o código da plataforma é o seu id, começando em 1)
+        tamanho_plataformas = len(plataformas) + 1
+        engajamento_plataforma = np.bincount(codigos_plataforma[eh_engajamento], minlength=tamanho_plataformas)
+        tempo_plataforma = _somar_por_grupo(codigos_plataforma, duracoes, tamanho_plataformas)
+        interacoes_plataforma = np.bincount(codigos_plataforma, minlength=tamanho_plataformas)
+        if com_janela:
+            plataformas = [p for p in plataformas if interacoes_plataforma[p.id_plataforma] > 0]
+
+        # 1. Conteúdos mais consumidos
+        ranking_conteudos = [
+            (conteudos[i], int(tempo_conteudo[i])) for i in _top_k_posicoes(tempo_conteudo, 10)
+        ]
+
+        # 2. Usuários com maior tempo de consumo
+        ranking_usuarios = [
+            (usuarios[i], int(tempo_usuario[i])) for i in _top_k_posicoes(tempo_usuario, 10)
+        ]
+
+        # 3. Plataformas com maior engajamento (apenas as que tiveram algum engajamento)
+        ids_plataforma = np.asarray([p.id_plataforma for p in plataformas], dtype=np.int64)
+        engajamento_por_id = engajamento_plataforma[ids_plataforma]
+        com_engajamento = np.nonzero(engajamento_por_id > 0)[0]
+        ranking_engajamento = [
+            (plataformas[com_engajamento[i]].nome_plataforma, int(engajamento_por_id[com_engajamento[i]]))
+            for i in _top_k_posicoes(engajamento_por_id[com_engajamento], 10)
+        ]
+
+        # 4. Conteúdos mais comentados
+        ranking_comentados = [
+            (conteudos[i], int(comentarios_conteudo[i])) for i in _top_k_posicoes(comentarios_conteudo, 10)
+        ]
+
+        # 5. Total de interações por tipo (classe) de conteúdo
+        interacoes_por_tipo = defaultdict(int)
+        for conteudo, total in zip(conteudos, interacoes_conteudo.tolist()):
+            interacoes_por_tipo[type(conteudo).__name__] += total
+        ranking_interacoes = selecionar_top_k(list(interacoes_por_tipo.items()), key=lambda x: x[1])
+
+        # 6. Tempo médio de consumo por plataforma (divisão inteira, como no motor Python)
+        media_por_plataforma = []
+        for p in plataformas:
+            qtd = int(interacoes_plataforma[p.id_plataforma])
+            total = int(tempo_plataforma[p.id_plataforma])
+            media_por_plataforma.append((p.nome_plataforma, total // qtd if qtd > 0 else 0))
+
+        # 7. Comentários por conteúdo, em ordem de ID
+        comentarios_por_conteudo = list(zip(conteudos, comentarios_conteudo.tolist()))
+
+        return {
+            "conteudos_mais_consumidos": ranking_conteudos,
+            "usuarios_mais_ativos": ranking_usuarios,
+            "engajamento_plataformas": ranking_engajamento,
+            "conteudos_mais_comentados": ranking_comentados,
+            "interacoes_por_tipo_conteudo": ranking_interacoes,
+            "media_por_plataforma": media_por_plataforma,
+            "comentarios_por_conteudo": comentarios_por_conteudo,
+        }
+
+
+# Lê uma coluna (array do módulo 'array' ou memoryview de um snapshot) como ndarray, sem copiar os dados
+def _coluna(dados):
+    tipo = np.dtype(dados.typecode if isinstance(dados, array) else dados.format)
+    if len(dados) == 0:
+        return np.zeros(0, dtype=tipo)
+    return np.frombuffer(dados, dtype=tipo)
+
+
+# Complexidade: O(n log m) - busca binária vetorizada de cada ID na lista ordenada de IDs das entidades.
+# Retorna a posição da entidade de cada linha e a máscara das linhas cuja entidade existe na árvore
+# (linhas de entidades removidas da árvore são ignoradas, como no motor Python).
+def _posicoes(ids_linhas, ids_entidades: list):
+    ids_entidades = np.asarray(ids_entidades, dtype=np.int64)
+    if len(ids_entidades) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(len(ids_linhas), dtype=bool)
+
+    posicoes = np.searchsorted(ids_entidades, ids_linhas)
+    posicoes_validas = np.minimum(posicoes, len(ids_entidades) - 1)
+    encontradas = ids_entidades[posicoes_validas] == ids_linhas
+    return posicoes_validas[encontradas], encontradas
+
+
+# Complexidade: O(n) - soma por grupo com bincount ponderado.
+# Os pesos são somados em float64, que representa inteiros exatamente até 2**53 segundos; o resultado volta para int64.
+def _somar_por_grupo(grupos, valores, tamanho: int):
+    return np.bincount(grupos, weights=valores, minlength=tamanho).astype(np.int64)
+
+
+# Complexidade: O(m + c log c) - np.partition encontra o k-ésimo maior valor em O(m) e só os c candidatos
+# (valores >= limiar, incluindo empates) são ordenados. O desempate é pela menor posição, igual a selecionar_top_k.
+def _top_k_posicoes(valores, k: int) -> list:
+    quantidade = len(valores)
+    if quantidade == 0 or k <= 0:
+        return []
+
+    if quantidade > k:
+        limiar = np.partition(valores, quantidade - k)[quantidade - k]
+        candidatos = np.nonzero(valores >= limiar)[0]
+    else:
+        candidatos = np.arange(quantidade)
+
+    ordem = np.lexsort((candidatos, -valores[candidatos]))
+    return candidatos[ordem][:k].tolist()
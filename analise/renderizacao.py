@@ -0,0 +1,277 @@
+"""
+Camada de renderização dos relatórios.
+
+Os métodos calcular_* (de SistemaAnaliseEngajamento ou SistemaAnaliseParticionado) devolvem listas de tuplas simples;
+aqui elas são formatadas como texto (a saída de console), CSV ou JSON. O texto inteiro é montado em memória e
+escrito no destino com uma única chamada a write, em vez de um print por linha; assim o cálculo e a renderização
+podem ser medidos separadamente:
+
+    resultado = sistema.calcular_atividade_usuarios(top_n=10)           # cálculo
+    renderizar("atividade_usuarios", resultado, formato="json", destino="usuarios.json")  # renderização
+
+Os nomes dos relatórios são os mesmos do protocolo do servidor de ingestão (ver RELATORIOS).
+"""
+import csv
+import io
+import json
+import sys
+from datetime import datetime
+from typing import NamedTuple
+
+FORMATOS = ("texto", "csv", "json")
+
+# Separador dos textos de comentários em uma célula CSV
+SEPARADOR_COMENTARIOS = " | "
+
+
+class SecaoRelatorio(NamedTuple):
+    nome: str
+    titulo: str
+    colunas: tuple[str, ...]
+    linhas: list[tuple]
+
+
+def formatar_tempo(segundos: int) -> str:
+    """
+    Formata o tempo em segundos para o formato HH:MM:SS.
+    - Calcula as horas, minutos e segundos a partir dos segundos.
+    """
+    horas, resto = divmod(segundos, 3600)
+    minutos, segundos_restantes = divmod(resto, 60)
+
+    return f"{horas:02}:{minutos:02}:{segundos_restantes:02}"
+
+
+# -------- Texto (console) --------
+# Cada função devolve as linhas do relatório, exatamente como eram impressas uma a uma.
+
+def _texto_atividade_usuarios(usuarios_consumo: list[tuple[int, int]]) -> list[str]:
+    linhas = ["\n--- Relatório: Usuários com Maior Tempo Total de Consumo ---"]
+    linhas.extend(
+        f"Usuário ID {id_usuario} - Tempo Total: {formatar_tempo(tempo)}" for id_usuario, tempo in usuarios_consumo
+    )
+    return linhas
+
+
+def _texto_secoes_analiticas(secoes: dict) -> list[str]:
+    linhas = ["\n===== RELATÓRIOS ANALÍTICOS DE ENGAJAMENTO ====="]
+
+    linhas.append("\n--- Conteúdos Mais Consumidos (por tempo total) ---")
+    linhas.extend(
+        f"Conteúdo ID {id_conteudo} - Tipo: {tipo} - Tempo: {formatar_tempo(tempo)}"
+        for id_conteudo, tipo, tempo in secoes["conteudos_mais_consumidos"]
+    )
+
+    linhas.append("\n--- Usuários com Maior Tempo de Consumo ---")
+    linhas.extend(
+        f"Usuário ID {id_usuario} - Tempo: {formatar_tempo(tempo)}" for id_usuario, tempo in secoes["usuarios_mais_ativos"]
+    )
+
+    linhas.append("\n--- Plataforma com Maior Engajamento ---")
+    linhas.extend(
+        f"Plataforma {plataforma} - Engajamento: {engajamento}"
+        for plataforma, engajamento in secoes["engajamento_plataformas"]
+    )
+
+    linhas.append("\n--- Conteúdos Mais Comentados ---")
+    linhas.extend(
+        f"Conteúdo ID {id_conteudo} - Tipo: {tipo} - Comentarios: {comentarios}"
+        for id_conteudo, tipo, comentarios in secoes["conteudos_mais_comentados"]
+    )
+
+    linhas.append("\n--- Total de Interações por Tipo de Conteúdo ---")
+    linhas.extend(
+        f"Tipo: {tipo} - Quantidade de Interações: {interacoes}" for tipo, interacoes in secoes["interacoes_por_tipo_conteudo"]
+    )
+
+    linhas.append("\n--- Tempo Médio de Consumo por Plataforma ---")
+    linhas.extend(f"{plataforma} - Média: {formatar_tempo(media)}" for plataforma, media in secoes["media_por_plataforma"])
+
+    linhas.append("\n--- Comentários por Conteúdo ---")
+    linhas.extend(
+        f"Conteúdo ID {id_conteudo} - Comentários: {comentarios}"
+        for id_conteudo, comentarios in secoes["comentarios_por_conteudo"]
+    )
+    return linhas
+
+
+def _texto_conteudos_mais_engajados(engajamento: list[tuple]) -> list[str]:
+    linhas = ["\n--- Conteúdos Mais Engajados ---"]
+    linhas.extend(
+        f"Conteúdo ID {id_conteudo} - {nome} | Engajamento Total: {total}\n👍 {likes}\n🔄 {shares}\n💬 {comments}\n"
+        for id_conteudo, nome, total, likes, shares, comments in engajamento
+    )
+    return linhas
+
+
+def _texto_comentarios_por_conteudo(conteudos: list[tuple[int, str, list[str]]]) -> list[str]:
+    linhas = ["\n--- Comentários por Conteúdo ---"]
+    for id_conteudo, nome, comentarios in conteudos:
+        linhas.append(f"Conteúdo ID {id_conteudo} - {nome} | 💬 Comentários: {len(comentarios)}")
+        linhas.extend(f"  - {texto}" for texto in comentarios)
+        linhas.append("")
+    return linhas
+
+
+def _texto_engajamento_conteudos(engajamento_conteudos: list[tuple[int, str, int]]) -> list[str]:
+    linhas = ["\n--- Relatório: Conteúdos com Maior Engajamento ---"]
+    linhas.extend(
+        f"Conteúdo ID {id_conteudo} - Nome: {nome} - Total de Interações: {total}"
+        for id_conteudo, nome, total in engajamento_conteudos
+    )
+    return linhas
+
+
+def _texto_tempo_por_plataforma_por_hora(tempos: list[tuple[datetime, str, int]]) -> list[str]:
+    linhas = ["\n--- Tempo de Consumo por Plataforma por Hora ---"]
+    linhas.extend(f"{hora:%Y-%m-%d %H:00} | {nome} - Tempo: {formatar_tempo(tempo)}" for hora, nome, tempo in tempos)
+    return linhas
+
+
+# -------- Estrutura (colunas) de cada relatório, usada pelos formatos CSV e JSON --------
+
+# Nome da seção -> (título, colunas), na ordem do relatório analítico
+SECOES_ANALITICAS = {
+    "conteudos_mais_consumidos": ("Conteúdos Mais Consumidos", ("id_conteudo", "tipo_conteudo", "tempo")),
+    "usuarios_mais_ativos": ("Usuários com Maior Tempo de Consumo", ("id_usuario", "tempo")),
+    "engajamento_plataformas": ("Plataforma com Maior Engajamento", ("nome_plataforma", "engajamentos")),
+    "conteudos_mais_comentados": ("Conteúdos Mais Comentados", ("id_conteudo", "tipo_conteudo", "comentarios")),
+    "interacoes_por_tipo_conteudo": ("Total de Interações por Tipo de Conteúdo", ("tipo_conteudo", "interacoes")),
+    "media_por_plataforma": ("Tempo Médio de Consumo por Plataforma", ("nome_plataforma", "media")),
+    "comentarios_por_conteudo": ("Comentários por Conteúdo", ("id_conteudo", "comentarios")),
+}
+
+# Nome do relatório -> (título, colunas, função do formato texto); o relatório analítico tem várias seções
+RELATORIOS = {
+    "atividade_usuarios": (
+        "Usuários com Maior Tempo Total de Consumo", ("id_usuario", "tempo_total"), _texto_atividade_usuarios,
+    ),
+    "engajamento_conteudos": (
+        "Conteúdos com Maior Engajamento", ("id_conteudo", "nome_conteudo", "total_interacoes"),
+        _texto_engajamento_conteudos,
+    ),
+    "conteudos_mais_engajados": (
+        "Conteúdos Mais Engajados", ("id_conteudo", "nome_conteudo", "total", "likes", "shares", "comments"),
+        _texto_conteudos_mais_engajados,
+    ),
+    "comentarios_por_conteudo": (
+        "Comentários por Conteúdo", ("id_conteudo", "nome_conteudo", "comentarios"), _texto_comentarios_por_conteudo,
+    ),
+    "tempo_por_plataforma_por_hora": (
+        "Tempo de Consumo por Plataforma por Hora", ("hora", "nome_plataforma", "tempo"),
+        _texto_tempo_por_plataforma_por_hora,
+    ),
+    "secoes_analiticas": ("Relatórios Analíticos de Engajamento", None, _texto_secoes_analiticas),
+}
+
+
+"""
+Organiza o resultado de um relatório em seções com nome, título e colunas.
+
+- Complexidade: O(1) - as listas de linhas não são copiadas.
+"""
+def estruturar(nome: str, resultado) -> list[SecaoRelatorio]:
+    if nome not in RELATORIOS:
+        raise ValueError(f"Relatório '{nome}' inválido. Permitidos: {tuple(RELATORIOS)}")
+
+    titulo, colunas, _ = RELATORIOS[nome]
+    if colunas is None:
+        return [
+            SecaoRelatorio(secao, titulo_secao, colunas_secao, resultado[secao])
+            for secao, (titulo_secao, colunas_secao) in SECOES_ANALITICAS.items()
+        ]
+    return [SecaoRelatorio(nome, titulo, colunas, resultado)]
+
+
+def _valor_serializavel(valor):
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    return valor
+
+
+def _valor_csv(valor):
+    if isinstance(valor, list):
+        return SEPARADOR_COMENTARIOS.join(valor)
+    return _valor_serializavel(valor)
+
+
+def _gerar_csv(secoes: list[SecaoRelatorio]) -> str:
+    saida = io.StringIO()
+    escritor = csv.writer(saida, lineterminator="\n")
+    if len(secoes) == 1:
+        secao = secoes[0]
+        escritor.writerow(secao.colunas)
+        escritor.writerows([_valor_csv(valor) for valor in linha] for linha in secao.linhas)
+        return saida.getvalue()
+
+    # Várias seções: um bloco por seção (cabeçalho próprio, primeira coluna com o nome da seção), separados por uma linha vazia
+    for posicao, secao in enumerate(secoes):
+        if posicao > 0:
+            saida.write("\n")
+        escritor.writerow(("secao", *secao.colunas))
+        escritor.writerows([secao.nome, *(_valor_csv(valor) for valor in linha)] for linha in secao.linhas)
+    return saida.getvalue()
+
+
+def _documento_json(secoes: list[SecaoRelatorio]) -> dict:
+    return {
+        secao.nome: [
+            {coluna: _valor_serializavel(valor) for coluna, valor in zip(secao.colunas, linha)} for linha in secao.linhas
+        ]
+        for secao in secoes
+    }
+
+
+def _gerar_json(secoes: list[SecaoRelatorio]) -> str:
+    return json.dumps(_documento_json(secoes), ensure_ascii=False, indent=2) + "\n"
+
+
+def _escrever(texto: str, destino) -> None:
+    if destino is None:
+        destino = sys.stdout
+    if isinstance(destino, str):
+        with open(destino, "w", encoding="utf-8", newline="") as arquivo:
+            arquivo.write(texto)
+    else:
+        destino.write(texto)
+
+
+"""
+Formata o resultado de um relatório (a saída do calcular_* correspondente) e o escreve de uma só vez.
+
+Args:
+    nome (str): nome do relatório (ver RELATORIOS).
+    resultado: a lista (ou, para "secoes_analiticas", o dicionário) devolvida pelo método calcular_*.
+    formato (str): "texto" (como no console), "csv" ou "json".
+    destino: arquivo já aberto em modo texto, ou caminho de um arquivo a ser (re)escrito; None usa sys.stdout.
+
+- Complexidade: O(n) para as n linhas do relatório, com uma única escrita no destino.
+"""
+def renderizar(nome: str, resultado, formato: str = "texto", destino=None) -> None:
+    if nome not in RELATORIOS:
+        raise ValueError(f"Relatório '{nome}' inválido. Permitidos: {tuple(RELATORIOS)}")
+
+    if formato == "texto":
+        texto = "\n".join(RELATORIOS[nome][2](resultado)) + "\n"
+    elif formato == "csv":
+        texto = _gerar_csv(estruturar(nome, resultado))
+    elif formato == "json":
+        texto = _gerar_json(estruturar(nome, resultado))
+    else:
+        raise ValueError(f"Formato '{formato}' inválido. Permitidos: {FORMATOS}")
+    _escrever(texto, destino)
+
+
+"""
+Escreve vários relatórios como um único documento JSON, {nome do relatório: documento de renderizar(..., "json")},
+para que a saída continue sendo um JSON válido quando todos vão para o mesmo destino.
+
+Args:
+    resultados (dict): nome do relatório (ver RELATORIOS) -> resultado do método calcular_* correspondente.
+    destino: como em renderizar.
+
+- Complexidade: O(n) para as n linhas somadas dos relatórios, com uma única escrita no destino.
+"""
+def renderizar_json_combinado(resultados: dict, destino=None) -> None:
+    documento = {nome: _documento_json(estruturar(nome, resultado)) for nome, resultado in resultados.items()}
+    _escrever(json.dumps(documento, ensure_ascii=False, indent=2) + "\n", destino)
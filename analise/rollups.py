@@ -0,0 +1,183 @@
+"""
+Rollups temporais das interações (cubos pré-agregados por minuto, hora e dia).
+
+Para cada dimensão (conteúdo, plataforma, usuário) e cada entidade, guarda baldes de tempo com a contagem
+de interações por tipo e a soma de watch_duration_seconds. Os baldes são atualizados a cada linha aplicada,
+então séries de tendência são lidas direto dos baldes, sem percorrer as interações.
+
+Para limitar a memória, cada granularidade fina tem uma retenção relativa ao maior timestamp já visto
+(a marca d'água): baldes de minuto mais antigos que a retenção são compactados (somados) em baldes de hora,
+e baldes de hora antigos em baldes de dia. Linhas que já chegam mais antigas que a retenção vão direto
+para a granularidade mais grossa que ainda as guarda. Consequência: períodos antigos só estão disponíveis
+na resolução mais grossa.
+"""
+from heapq import heappop, heappush
+
+from estruturas_dados.armazenamento_colunar import TIPOS_INTERACAO
+
+GRANULARIDADES = ("minuto", "hora", "dia")
+SEGUNDOS_POR_GRANULARIDADE = {"minuto": 60, "hora": 3600, "dia": 86400}
+DIMENSOES = ("conteudo", "plataforma", "usuario")
+
+# Por quanto tempo (em segundos, antes da marca d'água) cada granularidade fina é mantida; "dia" não expira
+RETENCAO_PADRAO = {"minuto": 6 * 3600, "hora": 14 * 86400}
+
+# Cada balde é uma lista [contagem de cada tipo (na ordem de TIPOS_INTERACAO)..., tempo total]
+POSICAO_TEMPO = len(TIPOS_INTERACAO)
+
+
+class CuboRollups:
+    def __init__(self, retencao: dict[str, int] | None = None) -> None:
+        self._retencao = {**RETENCAO_PADRAO, **(retencao or {})}
+
+        # granularidade -> dimensão -> id da entidade -> início do balde (epoch) -> valores
+        self._baldes = {g: {d: {} for d in DIMENSOES} for g in GRANULARIDADES}
+
+        # Para compactar sem varrer todas as entidades: por granularidade fina, as entidades que têm cada
+        # balde e um heap com os inícios de balde existentes (o mais antigo no topo)
+        self._entidades_por_balde: dict[str, dict[int, list]] = {g: {} for g in GRANULARIDADES[:-1]}
+        self._heap_baldes = {g: [] for g in GRANULARIDADES[:-1]}
+
+        self._marca_dagua: int | None = None
+        self._proxima_compactacao: int | None = None
+
+    @property
+    def marca_dagua(self) -> int | None:
+        return self._marca_dagua
+
+    # Complexidade:
+    # Pior caso:   O(log b) - um novo início de balde entra no heap de compactação (b = inícios de balde distintos).
+    # Melhor caso: Ω(1) - os três baldes (conteúdo, plataforma, usuário) já existem; só somas em listas.
+    # Caso médio:  Θ(1) - idem; a compactação roda no máximo uma vez por hora de dados e é amortizada.
+    def registrar(self, epoch: int, id_conteudo: int, id_plataforma: int, id_usuario: int,
+                  codigo_tipo: int, duracao: int) -> None:
+        if self._marca_dagua is None or epoch > self._marca_dagua:
+            self._marca_dagua = epoch
+            if self._proxima_compactacao is None:
+                self._proxima_compactacao = epoch + SEGUNDOS_POR_GRANULARIDADE["hora"]
+            elif epoch >= self._proxima_compactacao:
+                self.compactar()
+
+        granularidade = self._granularidade_para(epoch)
+        balde = epoch - epoch % SEGUNDOS_POR_GRANULARIDADE[granularidade]
+        baldes = self._baldes[granularidade]
+
+        for dimensao, chave in (("conteudo", id_conteudo), ("plataforma", id_plataforma), ("usuario", id_usuario)):
+            por_dimensao = baldes[dimensao]
+            por_entidade = por_dimensao.get(chave)
+            if por_entidade is None:
+                por_entidade = por_dimensao[chave] = {}
+
+            valores = por_entidade.get(balde)
+            if valores is None:
+                valores = por_entidade[balde] = [0] * (POSICAO_TEMPO + 1)
+                if granularidade != "dia":
+                    self._rastrear_balde(granularidade, balde, dimensao, chave)
+
+            valores[codigo_tipo] += 1
+            valores[POSICAO_TEMPO] += duracao
+
+    # Avança a marca d'água até 'epoch' (sem registrar interações) e compacta os baldes que saíram da retenção.
+    # Usado para alinhar cubos que recebem partes diferentes do mesmo fluxo (ver analise.sistema_particionado).
+    def avancar_marca_dagua(self, epoch: int) -> None:
+        if self._marca_dagua is not None and epoch <= self._marca_dagua:
+            return
+        self._marca_dagua = epoch
+        self.compactar()
+
+    # Granularidade mais fina cuja retenção ainda cobre o epoch
+    def _granularidade_para(self, epoch: int) -> str:
+        for granularidade in GRANULARIDADES[:-1]:
+            if epoch >= self._marca_dagua - self._retencao[granularidade]:
+                return granularidade
+        return GRANULARIDADES[-1]
+
+    # Registra que a entidade tem um balde iniciado em 'balde' (apenas granularidades que expiram)
+    def _rastrear_balde(self, granularidade: str, balde: int, dimensao: str, chave: int) -> None:
+        entidades = self._entidades_por_balde[granularidade]
+        lista = entidades.get(balde)
+        if lista is None:
+            lista = entidades[balde] = []
+            heappush(self._heap_baldes[granularidade], balde)
+        lista.append((dimensao, chave))
+
+    """
+    Move os baldes finos mais antigos que a retenção para a granularidade seguinte (minuto -> hora -> dia).
+
+    - Melhor caso (Ω): O(1), nenhum balde expirou.
+    - Caso médio (Θ): O(m log b), onde m é o número de baldes compactados e b o de inícios de balde distintos.
+    - Pior caso (O): O(m log b), idem.
+
+    Justificativa: o heap entrega os inícios de balde expirados em ordem, e cada um sabe quais entidades
+    o possuem, então nenhuma entidade sem baldes expirados é visitada. Chamada automaticamente por 'registrar'.
+    """
+    def compactar(self) -> None:
+        if self._marca_dagua is None:
+            return
+
+        for fina, grossa in zip(GRANULARIDADES, GRANULARIDADES[1:]):
+            limite = self._marca_dagua - self._retencao[fina]
+            tamanho_grossa = SEGUNDOS_POR_GRANULARIDADE[grossa]
+            heap = self._heap_baldes[fina]
+            entidades = self._entidades_por_balde[fina]
+
+            while heap and heap[0] < limite:
+                balde = heappop(heap)
+                balde_grosso = balde - balde % tamanho_grossa
+
+                for dimensao, chave in entidades.pop(balde):
+                    por_entidade = self._baldes[fina][dimensao][chave]
+                    valores = por_entidade.pop(balde)
+                    if not por_entidade:
+                        del self._baldes[fina][dimensao][chave]
+
+                    destino = self._baldes[grossa][dimensao].setdefault(chave, {})
+                    acumulado = destino.get(balde_grosso)
+                    if acumulado is None:
+                        destino[balde_grosso] = valores
+                        if grossa != "dia":
+                            self._rastrear_balde(grossa, balde_grosso, dimensao, chave)
+                    else:
+                        for posicao, valor in enumerate(valores):
+                            acumulado[posicao] += valor
+
+        self._proxima_compactacao = self._marca_dagua + SEGUNDOS_POR_GRANULARIDADE["hora"]
+
+    """
+    Série temporal de uma entidade: lista ordenada de (início do balde em epoch, valores), com
+    valores = [contagem de cada tipo na ordem de TIPOS_INTERACAO..., tempo total].
+
+    Os baldes da granularidade pedida são somados aos das granularidades mais finas (reagrupados);
+    períodos que só existem em granularidade mais grossa (já compactados) não aparecem.
+
+    - Complexidade: O(b + r log r), onde b é o número de baldes da entidade e r o de baldes devolvidos.
+    """
+    def serie(self, dimensao: str, chave: int, granularidade: str = "hora",
+              inicio: int | None = None, fim: int | None = None) -> list[tuple[int, list]]:
+        if dimensao not in DIMENSOES:
+            raise ValueError(f"Dimensão '{dimensao}' inválida. Permitidas: {DIMENSOES}")
+        if granularidade not in GRANULARIDADES:
+            raise ValueError(f"Granularidade '{granularidade}' inválida. Permitidas: {GRANULARIDADES}")
+
+        tamanho = SEGUNDOS_POR_GRANULARIDADE[granularidade]
+        resultado: dict[int, list] = {}
+
+        for nivel in GRANULARIDADES[:GRANULARIDADES.index(granularidade) + 1]:
+            for balde, valores in self._baldes[nivel][dimensao].get(chave, {}).items():
+                if (inicio is not None and balde < inicio) or (fim is not None and balde >= fim):
+                    continue
+                destino = resultado.get(balde - balde % tamanho)
+                if destino is None:
+                    resultado[balde - balde % tamanho] = list(valores)
+                else:
+                    for posicao, valor in enumerate(valores):
+                        destino[posicao] += valor
+
+        return sorted(resultado.items())
+
+    # Quantidade de baldes guardados em cada granularidade (útil para acompanhar o uso de memória)
+    def quantidade_baldes(self) -> dict[str, int]:
+        return {
+            granularidade: sum(len(por_entidade) for dimensao in por_dimensao.values() for por_entidade in dimensao.values())
+            for granularidade, por_dimensao in self._baldes.items()
+        }
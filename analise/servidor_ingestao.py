@@ -0,0 +1,341 @@
+"""
+Servidor local de ingestão (asyncio) que alimenta a Fila do SistemaAnaliseEngajamento em tempo real.
+
+Escuta em TCP ou em um socket Unix e aceita várias conexões ao mesmo tempo. Cada linha recebida é uma de:
+    - um evento em JSON, com os mesmos campos do CSV:
+        {"id_conteudo": 1, "nome_conteudo": "...", "id_usuario": 7, "timestamp_interacao": "2024-01-01T10:00:00", ...}
+    - uma linha CSV; a primeira linha CSV de cada conexão é o cabeçalho (como no arquivo interacoes_globo.csv);
+    - um pedido de relatório em JSON, com a chave "relatorio" (ver RELATORIOS), por exemplo:
+        {"relatorio": "atividade_usuarios", "top_n": 5, "inicio": "2024-01-01T00:00:00"}
+      A resposta é uma linha JSON {"relatorio": ..., "resultado": ...} ou {"erro": ...}.
+Linhas que não são UTF-8 válido ou JSON válido recebem {"erro": ...} e a conexão continua.
+
+Os eventos entram em uma Fila limitada ('capacidade_fila'); com a fila cheia, a conexão deixa de ser lida até haver
+espaço, e o controle de fluxo do TCP segura o cliente (backpressure). Uma thread consumidora retira os eventos em
+lotes, os enfileira na Fila do sistema e chama processar_interacoes_da_fila.
+
+Os relatórios são calculados em outra thread auxiliar. Uma trava garante que as árvores nunca são lidas e alteradas
+ao mesmo tempo, e o laço de eventos continua livre para aceitar e ler conexões enquanto lotes e relatórios rodam.
+Um relatório pedido por uma conexão só é calculado depois de aplicados todos os eventos recebidos antes dele;
+se isso não acontecer em 'tempo_maximo_relatorio' segundos (ou se a thread consumidora tiver parado), a resposta
+é um {"erro": ...}. Eventos inválidos são descartados e contados em `eventos_rejeitados`, sem parar o consumo.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from estruturas_dados.fila import Fila
+from analise.sistema import SistemaAnaliseEngajamento, TAMANHO_LOTE_PADRAO
+
+# Nome do relatório no protocolo -> método calcular_* do sistema
+RELATORIOS = {
+    "atividade_usuarios": "calcular_atividade_usuarios",
+    "engajamento_conteudos": "calcular_engajamento_conteudos",
+    "conteudos_mais_engajados": "calcular_conteudos_mais_engajados",
+    "comentarios_por_conteudo": "calcular_comentarios_por_conteudo",
+    "tempo_por_plataforma_por_hora": "calcular_tempo_por_plataforma_por_hora",
+    "secoes_analiticas": "calcular_secoes_analiticas",
+    "agregados_plataformas": "calcular_agregados_plataformas",
+}
+
+# Quantidade máxima de eventos aguardando processamento
+CAPACIDADE_FILA_PADRAO = 100_000
+
+# Tamanho máximo de uma linha recebida (bytes)
+TAMANHO_MAXIMO_LINHA = 1024 * 1024
+
+# Espera máxima (segundos) para um relatório alcançar os eventos recebidos antes dele
+TEMPO_MAXIMO_RELATORIO_PADRAO = 60.0
+
+
+class ServidorIngestao:
+    """
+    Args:
+        sistema (SistemaAnaliseEngajamento): sistema cujas árvores recebem os eventos.
+        host, porta: endereço TCP (porta 0 escolhe uma porta livre; ver `endereco`).
+        caminho_unix (str, opcional): se informado, escuta neste socket Unix em vez de TCP.
+        tamanho_lote (int): máximo de eventos aplicados de uma vez.
+        capacidade_fila (int): máximo de eventos aguardando processamento.
+        tempo_maximo_relatorio (float): segundos que um relatório espera pelos eventos recebidos antes dele.
+    """
+    def __init__(self, sistema: SistemaAnaliseEngajamento, host: str = "127.0.0.1", porta: int = 0,
+                 caminho_unix: str | None = None, tamanho_lote: int = TAMANHO_LOTE_PADRAO,
+                 capacidade_fila: int = CAPACIDADE_FILA_PADRAO,
+                 tempo_maximo_relatorio: float = TEMPO_MAXIMO_RELATORIO_PADRAO):
+        if tamanho_lote < 1:
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo.")
+        if capacidade_fila < 1:
+            raise ValueError("A capacidade da fila deve ser um inteiro positivo.")
+        if tempo_maximo_relatorio <= 0:
+            raise ValueError("O tempo máximo de espera dos relatórios deve ser positivo.")
+
+        self._sistema = sistema
+        self._host = host
+        self._porta = porta
+        self._caminho_unix = caminho_unix
+        self._tamanho_lote = tamanho_lote
+        self._capacidade_fila = capacidade_fila
+        self._tempo_maximo_relatorio = tempo_maximo_relatorio
+
+        self._servidor: asyncio.AbstractServer | None = None
+        self._fila: Fila | None = None
+        self._consumidor: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Adquirida para aplicar um lote ou calcular um relatório
+        self._trava_sistema = threading.Lock()
+
+        # Eventos já recebidos / já aplicados; os relatórios esperam 'aplicados' alcançar 'recebidos'
+        self._recebidos = 0
+        self._aplicados = 0
+        self._rejeitados = 0
+        self._consumidor_ativo = False
+        self._lote_aplicado = threading.Condition()
+
+    @property
+    def endereco(self):
+        if self._servidor is None:
+            return None
+        return self._servidor.sockets[0].getsockname()
+
+    @property
+    def eventos_recebidos(self) -> int:
+        return self._recebidos
+
+    # Eventos processados, inclusive os rejeitados
+    @property
+    def eventos_aplicados(self) -> int:
+        return self._aplicados
+
+    # Eventos descartados por serem inválidos (ou por falharem ao ser aplicados)
+    @property
+    def eventos_rejeitados(self) -> int:
+        return self._rejeitados
+
+    async def iniciar(self) -> None:
+        self._fila = Fila(self._capacidade_fila)
+        self._consumidor_ativo = True
+        self._consumidor = threading.Thread(target=self._consumir_fila, name="consumidor-fila", daemon=True)
+        self._consumidor.start()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="relatorios")
+
+        if self._caminho_unix is not None:
+            self._servidor = await asyncio.start_unix_server(
+                self._atender_conexao, path=self._caminho_unix, limit=TAMANHO_MAXIMO_LINHA
+            )
+        else:
+            self._servidor = await asyncio.start_server(
+                self._atender_conexao, self._host, self._porta, limit=TAMANHO_MAXIMO_LINHA
+            )
+
+    async def servir_para_sempre(self) -> None:
+        if self._servidor is None:
+            await self.iniciar()
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.encerrar()
+
+    # Para de aceitar conexões, aplica os eventos que ainda estão na fila e libera a thread auxiliar
+    async def encerrar(self) -> None:
+        if self._servidor is None:
+            return
+        self._servidor.close()
+        await self._servidor.wait_closed()
+        self._servidor = None
+
+        # A thread consumidora termina depois de aplicar o que ainda estiver na fila
+        self._fila.fechar()
+        await asyncio.get_running_loop().run_in_executor(None, self._consumidor.join)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "ServidorIngestao":
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.encerrar()
+
+    # -------- Conexões --------
+
+    async def _atender_conexao(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        cabecalho_csv: list[str] | None = None
+        try:
+            while True:
+                try:
+                    dados = await leitor.readline()
+                except ValueError:
+                    # Linha maior que TAMANHO_MAXIMO_LINHA: o fluxo não pode mais ser sincronizado
+                    await self._responder(escritor, {"erro": "Linha excede o tamanho máximo permitido."})
+                    break
+                if not dados:
+                    break
+
+                try:
+                    linha = dados.decode("utf-8").strip()
+                except UnicodeDecodeError as e:
+                    await self._responder(escritor, {"erro": f"Linha com UTF-8 inválido: {e}"})
+                    continue
+                if not linha:
+                    continue
+
+                if linha.startswith("{"):
+                    try:
+                        mensagem = json.loads(linha)
+                    except json.JSONDecodeError as e:
+                        await self._responder(escritor, {"erro": f"JSON inválido: {e}"})
+                        continue
+                    if not isinstance(mensagem, dict):
+                        await self._responder(escritor, {"erro": "A mensagem JSON deve ser um objeto."})
+                    elif "relatorio" in mensagem:
+                        await self._responder(escritor, await self._atender_relatorio(mensagem))
+                    else:
+                        await self._receber_evento(mensagem)
+                    continue
+
+                valores = next(csv.reader([linha]))
+                if cabecalho_csv is None:
+                    cabecalho_csv = valores
+                else:
+                    await self._receber_evento(dict(zip(cabecalho_csv, valores)))
+        except (ConnectionError, ValueError):
+            # ValueError: o servidor foi encerrado e a fila fechada com a conexão ainda aberta
+            pass
+        finally:
+            escritor.close()
+
+    # Aguarda espaço na fila: enquanto ela estiver cheia, esta conexão não é mais lida (backpressure)
+    async def _receber_evento(self, evento: dict) -> None:
+        await self._fila.enfileirar_async(evento)
+        self._recebidos += 1
+
+    @staticmethod
+    async def _responder(escritor: asyncio.StreamWriter, resposta: dict) -> None:
+        escritor.write(json.dumps(resposta, ensure_ascii=False, default=_serializar).encode("utf-8") + b"\n")
+        await escritor.drain()
+
+    # -------- Processamento --------
+
+    """
+    Retira os eventos da fila em lotes e os aplica nas árvores (executado na thread consumidora).
+
+    - Melhor caso (Ω): O(k) por lote de k eventos, com conteúdos e usuários já existentes.
+    - Caso médio (Θ): O(k) por lote, as buscas nas árvores são O(1) em média.
+    - Pior caso (O): O(k log n) por lote, quando chaves novas fora de ordem precisam ser posicionadas nos blocos
+      ordenados de IDs (na próxima consulta ordenada).
+
+    Justificativa: um lote é formado com o que já estiver na fila (sem esperar completá-lo), então sob carga baixa
+    cada evento é aplicado logo, e sob carga alta o custo da trava é dividido entre até 'tamanho_lote' eventos.
+    Um evento inválido é rejeitado pelo sistema (linhas_rejeitadas) e o lote continua; uma falha inesperada
+    do lote é informada em stderr, sem encerrar a thread.
+    """
+    def _consumir_fila(self) -> None:
+        try:
+            for lote in self._fila.drenar_lotes(self._tamanho_lote, bloquear=True):
+                rejeitados = 0
+                try:
+                    with self._trava_sistema:
+                        rejeitadas_antes = self._sistema.linhas_rejeitadas
+                        try:
+                            self._sistema.enfileirar_interacoes(lote)
+                            self._sistema.processar_interacoes_da_fila()
+                        finally:
+                            rejeitados = self._sistema.linhas_rejeitadas - rejeitadas_antes
+                except Exception as e:
+                    print(f"Erro ao aplicar lote de eventos: {e}", file=sys.stderr)
+                finally:
+                    with self._lote_aplicado:
+                        self._aplicados += len(lote)
+                        self._rejeitados += rejeitados
+                        self._lote_aplicado.notify_all()
+        finally:
+            # Relatórios à espera não podem mais ser atendidos: acorda-os para que respondam com erro
+            with self._lote_aplicado:
+                self._consumidor_ativo = False
+                self._lote_aplicado.notify_all()
+
+    async def _atender_relatorio(self, pedido: dict) -> dict:
+        nome = pedido["relatorio"]
+        metodo = RELATORIOS.get(nome)
+        if metodo is None:
+            return {"erro": f"Relatório '{nome}' inválido. Permitidos: {tuple(RELATORIOS)}"}
+
+        try:
+            parametros = {chave: valor for chave, valor in pedido.items() if chave != "relatorio"}
+            for chave in ("inicio", "fim"):
+                if parametros.get(chave) is not None:
+                    parametros[chave] = datetime.fromisoformat(parametros[chave])
+
+            resultado = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._calcular_relatorio, self._recebidos, metodo, parametros
+            )
+        except (TypeError, ValueError, TimeoutError, RuntimeError) as e:
+            return {"erro": str(e)}
+
+        return {"relatorio": nome, "resultado": resultado}
+
+    # Executado na thread de relatórios: espera aplicar os 'alvo' primeiros eventos recebidos
+    # (inclusive os da conexão que pediu o relatório) e calcula o relatório com a trava do sistema.
+    # Lança TimeoutError se eles não forem aplicados a tempo e RuntimeError se a thread consumidora parou.
+    def _calcular_relatorio(self, alvo: int, metodo: str, parametros: dict):
+        with self._lote_aplicado:
+            self._lote_aplicado.wait_for(
+                lambda: self._aplicados >= alvo or not self._consumidor_ativo, timeout=self._tempo_maximo_relatorio
+            )
+            if self._aplicados < alvo:
+                if not self._consumidor_ativo:
+                    raise RuntimeError("A thread consumidora de eventos parou; o relatório não pode ser calculado.")
+                raise TimeoutError(f"Os eventos anteriores ao relatório não foram aplicados em "
+                                   f"{self._tempo_maximo_relatorio:g} s; tente novamente.")
+        with self._trava_sistema:
+            return getattr(self._sistema, metodo)(**parametros)
+
+
+def _serializar(valor):
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    raise TypeError(f"Valor do tipo {type(valor).__name__} não é serializável em JSON.")
+
+
+# Executa o servidor até ser interrompido (Ctrl+C)
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor local de ingestão de interações (JSON ou CSV por linha).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--unix", dest="caminho_unix", default=None, help="caminho de um socket Unix (em vez de TCP)")
+    parser.add_argument("--tamanho-lote", type=int, default=TAMANHO_LOTE_PADRAO)
+    parser.add_argument("--capacidade-fila", type=int, default=CAPACIDADE_FILA_PADRAO)
+    parser.add_argument("--tempo-maximo-relatorio", type=float, default=TEMPO_MAXIMO_RELATORIO_PADRAO,
+                        help="segundos que um relatório espera pelos eventos recebidos antes dele")
+    parser.add_argument("--colunar", action="store_true", help="usa o armazenamento colunar")
+    argumentos = parser.parse_args()
+
+    sistema = SistemaAnaliseEngajamento(armazenamento_colunar=argumentos.colunar)
+    servidor = ServidorIngestao(
+        sistema,
+        host=argumentos.host,
+        porta=argumentos.porta,
+        caminho_unix=argumentos.caminho_unix,
+        tamanho_lote=argumentos.tamanho_lote,
+        capacidade_fila=argumentos.capacidade_fila,
+        tempo_maximo_relatorio=argumentos.tempo_maximo_relatorio,
+    )
+
+    async def executar():
+        await servidor.iniciar()
+        print(f"Servidor de ingestão escutando em {servidor.endereco}")
+        await servidor.servir_para_sempre()
+
+    try:
+        asyncio.run(executar())
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,166 @@
 import csv
+import os
+import time
 
 from estruturas_dados.fila import Fila
-from estruturas_dados.algoritmos_ordenacao import quick_sort 
+from estruturas_dados.selecao_top_k import selecionar_top_k
 
 from estruturas_dados.arvore_binaria_busca import ArvoreBinariaBusca
+from estruturas_dados.indice_temporal import IndiceTemporal
+from estruturas_dados.tabela_simbolos import TabelaSimbolos
+from estruturas_dados.conversor_timestamp import timestamp_para_epoch
+from estruturas_dados.armazenamento_colunar import (
+    ArmazenamentoColunar,
+    VisaoInteracoes,
+    TIPOS_INTERACAO,
+    datetime_para_epoch,
+    epoch_para_datetime,
+)
+from analise.rollups import CuboRollups
+from analise.cache_relatorios import CAPACIDADE_PADRAO, CacheRelatorios, relatorio_em_cache
+from analise.renderizacao import formatar_tempo, renderizar
+from analise.instrumentacao import Instrumentacao
+from analise.ingestao_arquivos import (
+    ResultadoArquivo,
+    abrir_csv,
+    detectar_compressao,
+    exibir_progresso_arquivo,
+    ler_arquivos_em_paralelo,
+    resolver_arquivos,
+)
 from entidades.plataforma import Plataforma
 from entidades.conteudo import Conteudo
 from entidades.usuario import Usuario
 from entidades.interacao import Interacao
+from entidades.tipo_interacao import TIPOS_ENGAJAMENTO, TipoInteracao
 
 from collections import defaultdict
+from datetime import datetime
+from itertools import islice
+
+# Quantidade de linhas lidas/aplicadas por vez no modo "streaming"
+TAMANHO_LOTE_PADRAO = 10_000
+MODOS_PROCESSAMENTO = ("fila", "streaming", "paralelo", "incremental")
+MOTORES_RELATORIO = ("python", "vetorizado")
+
+# Faixas aceitas por converter_linha_csv: IDs e durações cabem nas colunas int64 (array "q") do índice temporal e
+# do armazenamento colunar, e o timestamp fica no intervalo representável por datetime (epoch_para_datetime)
+MENOR_INTEIRO_64 = -2**63
+MAIOR_INTEIRO_64 = 2**63 - 1
+MENOR_EPOCH = datetime_para_epoch(datetime.min)
+MAIOR_EPOCH = datetime_para_epoch(datetime.max)
 
 class SistemaAnaliseEngajamento:
-    def __init__(self):
-        self._fila_interacoes_brutas: Fila = Fila()
+    """
+    Args:
+        armazenamento_colunar (bool): se True, as interações são guardadas em arrays tipados
+            (ArmazenamentoColunar) em vez de um objeto Interacao por linha, e Usuario/Conteudo
+            passam a expor visões sobre essas colunas. Os relatórios funcionam igual nos dois modos.
+        rollups (bool): se True, mantém cubos pré-agregados por minuto/hora/dia (analise.rollups.CuboRollups),
+            atualizados a cada linha aplicada e consultados com `serie_temporal`.
+        capacidade_fila (int, opcional): limite de linhas brutas na fila. Com limite, a leitura do CSV espera por espaço,
+            então a fila precisa ser consumida em outra thread (processar_interacoes_da_fila(bloquear=True)).
+        capacidade_cache_relatorios (int): quantos resultados de relatório (nome + parâmetros) ficam em cache
+            até a próxima linha aplicada (ver analise.cache_relatorios); 0 desliga o cache.
+        instrumentacao (bool): se True, registra contadores e histogramas de latência por fase (ver analise.instrumentacao);
+            também pode ser ligada depois, com ativar_instrumentacao().
+    """
+    def __init__(self, armazenamento_colunar: bool = False, rollups: bool = False, capacidade_fila: int | None = None,
+                 capacidade_cache_relatorios: int = CAPACIDADE_PADRAO, instrumentacao: bool = False):
+        self._fila_interacoes_brutas: Fila = Fila(capacidade_fila)
         self._arvore_conteudos: ArvoreBinariaBusca = ArvoreBinariaBusca()
         self._arvore_usuarios: ArvoreBinariaBusca = ArvoreBinariaBusca()
         self._plataformas_registradas: dict[str, Plataforma] = {}
+        self._plataformas_por_id: dict[int, Plataforma] = {}
+        self._armazenamento: ArmazenamentoColunar | None = ArmazenamentoColunar() if armazenamento_colunar else None
+        # Textos de comentário internados no modo de objetos (cada texto distinto guardado uma única vez)
+        self._textos_comentario: TabelaSimbolos = TabelaSimbolos()
+
+        # Preenchidos por carregar_snapshot: o mmap precisa continuar aberto enquanto as colunas forem usadas
+        self._mapa_snapshot = None
+        self._metadados_snapshot: dict | None = None
+
+        # Marcas d'água da ingestão incremental, por caminho absoluto do arquivo (ver _processar_interacoes_csv_incremental)
+        self._marcas_ingestao: dict[str, dict] = {}
+
+        # Índice temporal global: referencia objetos Interacao ou, no modo colunar, índices de linha do armazenamento
+        # (nesse modo ele é completado sob demanda a partir da coluna de timestamps; ver _obter_indice_temporal)
+        self._indice_temporal: IndiceTemporal = IndiceTemporal("q" if armazenamento_colunar else None)
+        # Índices temporais por conteúdo/usuário, criados na primeira consulta: (tipo, id) -> (entidade, índice)
+        self._indices_temporais_entidades: dict[tuple[str, int], tuple] = {}
+
+        self._rollups: CuboRollups | None = CuboRollups() if rollups else None
+
+        # Linhas descartadas por serem inválidas (em qualquer modo de processamento)
+        self._linhas_rejeitadas: int = 0
+        self._resultados_ingestao: list[ResultadoArquivo] = []
+
+        # Incrementado a cada alteração dos dados (linha aplicada, entidade inserida/removida); invalida o cache
+        self._versao_dados: int = 0
+        self._cache_relatorios: CacheRelatorios = CacheRelatorios(capacidade_cache_relatorios)
+
+        # None quando desligada: os pontos de medição só testam este atributo (por lote, nunca por linha)
+        self._instrumentacao: Instrumentacao | None = Instrumentacao() if instrumentacao else None
+
+    @property
+    def marcas_ingestao(self) -> dict[str, dict]:
+        return {caminho: dict(marca) for caminho, marca in self._marcas_ingestao.items()}
+
+    @property
+    def armazenamento_colunar(self) -> ArmazenamentoColunar | None:
+        return self._armazenamento
+
+    @property
+    def rollups(self) -> CuboRollups | None:
+        return self._rollups
+
+    @property
+    def linhas_rejeitadas(self) -> int:
+        return self._linhas_rejeitadas
+
+    @property
+    def versao_dados(self) -> int:
+        return self._versao_dados
+
+    # Cache dos relatórios calcular_* (acertos/falhas em cache_relatorios.estatisticas)
+    @property
+    def cache_relatorios(self) -> CacheRelatorios:
+        return self._cache_relatorios
+
+    # Contadores e histogramas por fase, ou None se a instrumentação estiver desligada
+    @property
+    def instrumentacao(self) -> Instrumentacao | None:
+        return self._instrumentacao
+
+    # Liga a instrumentação (mantendo as medições já feitas, se já estiver ligada) e a devolve
+    def ativar_instrumentacao(self) -> Instrumentacao:
+        if self._instrumentacao is None:
+            self._instrumentacao = Instrumentacao()
+        return self._instrumentacao
+
+    def desativar_instrumentacao(self) -> None:
+        self._instrumentacao = None
+
+    # selecionar_top_k dos rankings dos relatórios, registrando o tamanho de cada seleção na instrumentação
+    def _selecionar_top_k(self, elementos: list, k: int | None = None, key=lambda x: x) -> list:
+        if self._instrumentacao is not None:
+            self._instrumentacao.registrar("ordenacao.tamanho", len(elementos))
+        return selecionar_top_k(elementos, k, key=key)
 
     # -------- Métodos da árvore de conteúdos --------
     def inserir_conteudo(self, conteudo: Conteudo) -> None:
         self._arvore_conteudos.inserir_elemento(conteudo.id_conteudo, conteudo)
+        self._versao_dados += 1
 
     def buscar_conteudo(self, id_conteudo: int) -> Conteudo | None:
-        return self._arvore_conteudos.buscar_elemento(id_conteudo)
+        conteudo = self._arvore_conteudos.buscar_elemento(id_conteudo)
+        if self._instrumentacao is not None:
+            self._instrumentacao.contar("arvore_conteudos.falhas" if conteudo is None else "arvore_conteudos.acertos")
+        return conteudo
 
     def remover_conteudo(self, id_conteudo: int) -> None:
         self._arvore_conteudos.remover_elemento(id_conteudo)
+        self._versao_dados += 1
 
     def percurso_in_order(self) -> list:
         return self._arvore_conteudos.percurso_in_order()
@@ -34,16 +168,85 @@ class SistemaAnaliseEngajamento:
         # -------- Métodos da árvore de usuário --------
     def inserir_usuario(self, usuario: Usuario) -> None:
         self._arvore_usuarios.inserir_elemento(usuario.id_usuario, usuario)
+        self._versao_dados += 1
 
     def buscar_usuario(self, id_usuario: int) -> Usuario | None:
-        return self._arvore_usuarios.buscar_elemento(id_usuario)
+        usuario = self._arvore_usuarios.buscar_elemento(id_usuario)
+        if self._instrumentacao is not None:
+            self._instrumentacao.contar("arvore_usuarios.falhas" if usuario is None else "arvore_usuarios.acertos")
+        return usuario
 
     def remover_usuario(self, id_usuario: int) -> None:
         self._arvore_usuarios.remover_elemento(id_usuario)
+        self._versao_dados += 1
 
     def percurso_em_ordem(self) -> list:
         return self._arvore_usuarios.percurso_in_order()
 
+    # -------- Consultas por faixa de IDs --------
+    """
+    Consultas por faixa de IDs nas árvores de conteúdos e usuários, sem percorrer nem copiar a árvore inteira.
+
+    - Melhor caso (Ω): O(log n), faixa vazia ou consulta de piso/teto.
+    - Caso médio (Θ): O(log n + k), onde k é a quantidade de entidades devolvidas.
+    - Pior caso (O): O(log n + k + m (log n + CARGA_BLOCO)), com m inserções fora de ordem ou remoções feitas
+      desde a consulta anterior; com mais de n / FRACAO_RECONSTRUCAO delas, os blocos são reconstruídos em O(n log n),
+      o que amortiza em O(log n) por alteração.
+
+    Justificativa: o início da faixa é localizado por busca binária nos blocos ordenados de IDs da ArvoreBinariaBusca;
+    'conteudos_no_intervalo'/'usuarios_no_intervalo' são geradores, e as páginas usam o último ID como cursor.
+    """
+    def conteudos_no_intervalo(self, id_inicio: int | None = None, id_fim: int | None = None):
+        return self._arvore_conteudos.intervalo(id_inicio, id_fim)
+
+    def conteudo_piso(self, id_conteudo: int) -> Conteudo | None:
+        return self._arvore_conteudos.piso(id_conteudo)
+
+    def conteudo_teto(self, id_conteudo: int) -> Conteudo | None:
+        return self._arvore_conteudos.teto(id_conteudo)
+
+    def pagina_conteudos(self, apos_id: int | None = None, limite: int = 100) -> tuple[list, int | None]:
+        return self._arvore_conteudos.pagina(apos_id, limite)
+
+    def usuarios_no_intervalo(self, id_inicio: int | None = None, id_fim: int | None = None):
+        return self._arvore_usuarios.intervalo(id_inicio, id_fim)
+
+    def usuario_piso(self, id_usuario: int) -> Usuario | None:
+        return self._arvore_usuarios.piso(id_usuario)
+
+    def usuario_teto(self, id_usuario: int) -> Usuario | None:
+        return self._arvore_usuarios.teto(id_usuario)
+
+    def pagina_usuarios(self, apos_id: int | None = None, limite: int = 100) -> tuple[list, int | None]:
+        return self._arvore_usuarios.pagina(apos_id, limite)
+
+    # -------- Métodos de snapshot binário --------
+    """
+    Salva o estado processado (usuários, conteúdos, plataformas e colunas de interações) em um snapshot binário.
+    Se 'caminho_arquivo_origem' for informado, o checksum SHA-256 do CSV é gravado junto.
+    Ver analise.snapshot para o formato.
+
+    - Complexidade: O(n + m), onde n é o número de interações e m o de entidades.
+    """
+    def salvar_snapshot(self, caminho: str, caminho_arquivo_origem: str | None = None) -> None:
+        from analise.snapshot import salvar_snapshot
+        salvar_snapshot(self, caminho, caminho_arquivo_origem, {"marcas_ingestao": self._marcas_ingestao})
+
+    """
+    Carrega um snapshot salvo com `salvar_snapshot`, devolvendo um sistema em modo colunar cujas colunas
+    são lidas diretamente do arquivo mapeado em memória. Se 'caminho_arquivo_origem' for informado e o CSV
+    tiver mudado desde o snapshot, lança analise.snapshot.SnapshotInvalidoError.
+
+    - Complexidade: O(m), onde m é o número de entidades; as interações não são reprocessadas.
+    """
+    @classmethod
+    def carregar_snapshot(cls, caminho: str, caminho_arquivo_origem: str | None = None) -> "SistemaAnaliseEngajamento":
+        from analise.snapshot import carregar_snapshot
+        sistema = carregar_snapshot(caminho, caminho_arquivo_origem)
+        # Permite continuar a ingestão incremental de onde o processo que salvou o snapshot parou
+        sistema._marcas_ingestao = sistema._metadados_snapshot["extras"].get("marcas_ingestao", {})
+        return sistema
+
     # -------- Métodos de processamento do arquivo csv --------
     """
     Lê o arquivo CSV e enfileira cada linha na estrutura de fila.
@@ -53,26 +256,379 @@ class SistemaAnaliseEngajamento:
     - Pior caso (O): O(n), leitura sequencial e enfileiramento de n itens.
 
     Justificativa: a operação principal aqui é iterar sobre todas as linhas do CSV e armazená-las na fila.
+
+    Modos disponíveis:
+    - "fila" (padrão): apenas enfileira as linhas brutas; o processamento acontece em `processar_interacoes_da_fila`.
+    - "streaming": lê, valida e aplica as linhas nas árvores em lotes de `tamanho_lote`, sem passar pela fila.
+      A memória de pico fica limitada ao tamanho do lote, e não ao tamanho do arquivo.
+    - "paralelo": divide o arquivo em intervalos de bytes e converte/valida as linhas em `num_processos`
+      processos (padrão: número de CPUs); as tuplas resultantes são aplicadas nas árvores na ordem do arquivo,
+      então o resultado é idêntico ao do processamento serial.
+    - "incremental": lê apenas as linhas acrescentadas desde a última chamada para o mesmo arquivo, usando a marca
+      d'água (offset em bytes e último timestamp processado) guardada em `marcas_ingestao`. Sem dados novos, custa O(1).
+
+    Arquivos comprimidos (gzip, bz2 ou xz, pela extensão ou pelos bytes mágicos) são descomprimidos em fluxo
+    (ver analise.ingestao_arquivos.abrir_csv). O modo "paralelo" os lê como o "streaming", pois não há como
+    dividir um fluxo comprimido em intervalos de bytes, e o modo "incremental" não os aceita.
+
+    'caminho_arquivo' também pode ser um diretório (todos os *.csv e *.csv.gz/.bz2/.xz dele), um padrão glob ou uma lista desses itens
+    (ver analise.ingestao_arquivos.resolver_arquivos). Com vários arquivos:
+    - nos modos "fila" e "streaming", até `num_leitores` arquivos são lidos ao mesmo tempo por threads, enquanto
+      as linhas já lidas são enfileiradas/aplicadas na ordem dos arquivos (o resultado é o da leitura sequencial);
+    - nos modos "paralelo" e "incremental", os arquivos são processados um de cada vez, cada um pelo próprio modo;
+    - um arquivo com erro de leitura não interrompe os demais. O resultado de cada arquivo (ResultadoArquivo)
+      é passado a `progresso(resultado, posicao, total)` (por padrão, uma linha impressa por arquivo) e
+      fica disponível em `resultados_ingestao`.
+
+    Retorna a quantidade de linhas de dados lidas (enfileiradas, no modo "fila"), ou None se o arquivo não pôde
+    ser lido (com vários arquivos, a soma dos arquivos lidos, ou None se nenhum pôde ser lido).
+    As linhas inválidas, descartadas ao serem aplicadas, são somadas em `linhas_rejeitadas`.
     """
-    def processar_interacoes_csv(self, caminho_arquivo: str) -> None:
-        self._carregar_interacoes_csv(caminho_arquivo)
+    def processar_interacoes_csv(self, caminho_arquivo, modo: str = "fila", tamanho_lote: int = TAMANHO_LOTE_PADRAO,
+                                 num_processos: int | None = None, num_leitores: int | None = None,
+                                 progresso=None) -> int | None:
+        if modo not in MODOS_PROCESSAMENTO:
+            raise ValueError(f"Modo de processamento '{modo}' inválido. Permitidos: {MODOS_PROCESSAMENTO}")
+
+        if self._instrumentacao is not None:
+            with self._instrumentacao.medir(f"ingestao_csv.{modo}"):
+                return self._despachar_ingestao_csv(caminho_arquivo, modo, tamanho_lote, num_processos,
+                                                    num_leitores, progresso)
+        return self._despachar_ingestao_csv(caminho_arquivo, modo, tamanho_lote, num_processos, num_leitores, progresso)
+
+    # Resultado de cada arquivo da última chamada a processar_interacoes_csv
+    @property
+    def resultados_ingestao(self) -> list[ResultadoArquivo]:
+        return list(self._resultados_ingestao)
+
+    def _despachar_ingestao_csv(self, entrada, modo: str, tamanho_lote: int, num_processos: int | None,
+                                num_leitores: int | None, progresso) -> int | None:
+        arquivos = resolver_arquivos(entrada)
+        if isinstance(entrada, (str, os.PathLike)) and arquivos == [os.fspath(entrada)]:
+            # Um único arquivo: mesmo comportamento (e mesmas mensagens) da leitura de sempre
+            inicio = time.perf_counter()
+            lidas = self._processar_arquivo_csv(arquivos[0], modo, tamanho_lote, num_processos)
+            erro = None if lidas is not None else f"Não foi possível ler o arquivo CSV '{arquivos[0]}'."
+            self._resultados_ingestao = [
+                ResultadoArquivo(arquivos[0], lidas or 0, erro, time.perf_counter() - inicio)
+            ]
+            return lidas
+
+        return self._processar_varios_csv(arquivos, modo, tamanho_lote, num_processos, num_leitores,
+                                          progresso or exibir_progresso_arquivo)
+
+    """
+    Processa vários arquivos, isolando os erros de cada um (ver processar_interacoes_csv).
+
+    - Melhor caso (Ω): O(n log n), para as n linhas de todos os arquivos.
+    - Caso médio (Θ): O(n log n), o mesmo custo da leitura sequencial, com a E/S sobreposta ao processamento.
+    - Pior caso (O): O(n log n), idem.
+
+    Justificativa: as threads leitoras só antecipam a leitura; a aplicação nas árvores continua em uma única thread.
+    """
+    def _processar_varios_csv(self, arquivos: list[str], modo: str, tamanho_lote: int, num_processos: int | None,
+                              num_leitores: int | None, progresso) -> int | None:
+        if tamanho_lote < 1:
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo.")
+
+        resultados: list[ResultadoArquivo] = []
+        self._resultados_ingestao = resultados
+
+        def concluir(arquivo: str, linhas: int, erro: str | None, inicio: float) -> None:
+            resultados.append(ResultadoArquivo(arquivo, linhas, erro, time.perf_counter() - inicio))
+            progresso(resultados[-1], len(resultados), len(arquivos))
+
+        if modo in ("fila", "streaming"):
+            for arquivo, lotes in ler_arquivos_em_paralelo(arquivos, tamanho_lote, num_leitores):
+                inicio = time.perf_counter()
+                linhas = 0
+                erro = None
+                try:
+                    for lote in lotes:
+                        if modo == "fila":
+                            self.enfileirar_interacoes(lote)
+                        else:
+                            self._aplicar_lote(lote)
+                        linhas += len(lote)
+                except FileNotFoundError:
+                    erro = f"Arquivo '{arquivo}' não encontrado."
+                except Exception as e:
+                    erro = f"Erro ao ler o arquivo CSV '{arquivo}': {e}"
+                concluir(arquivo, linhas, erro, inicio)
+        else:
+            for arquivo in arquivos:
+                inicio = time.perf_counter()
+                linhas = self._processar_arquivo_csv(arquivo, modo, tamanho_lote, num_processos)
+                erro = None if linhas is not None else f"Não foi possível ler o arquivo CSV '{arquivo}'."
+                concluir(arquivo, linhas or 0, erro, inicio)
+
+        lidas = [resultado.linhas for resultado in resultados if resultado.erro is None]
+        return sum(lidas) if lidas else None
+
+    def _processar_arquivo_csv(self, caminho_arquivo: str, modo: str, tamanho_lote: int,
+                               num_processos: int | None) -> int | None:
+        if modo == "fila":
+            return self._carregar_interacoes_csv(caminho_arquivo)
+        elif modo == "streaming":
+            return self._processar_interacoes_csv_em_lotes(caminho_arquivo, tamanho_lote)
+        elif modo == "paralelo":
+            return self._processar_interacoes_csv_em_paralelo(caminho_arquivo, num_processos)
+        elif modo == "incremental":
+            return self._processar_interacoes_csv_incremental(caminho_arquivo, tamanho_lote)
 
     def _carregar_interacoes_csv(self, caminho_arquivo: str):
         try:
-            with open(caminho_arquivo, mode="r", encoding="utf-8") as arquivo_csv:
+            with abrir_csv(caminho_arquivo) as arquivo_csv:
                 # Transformando a linha de interação em um dicionário
                 # Nova estrutura da linha:
                 # 'id_conteudo': 1, 'nome_conteudo': 'Jornal Nacional' ... etc.
                 leitor_csv = csv.DictReader(arquivo_csv)
 
+                lidas = 0
                 for linha in leitor_csv:
                     self._fila_interacoes_brutas.enfileirar(linha)
+                    lidas += 1
         except FileNotFoundError:
             print(f"Erro: Arquivo '{caminho_arquivo}' não encontrado.")
             return None
         except Exception as e:
             print(f"Erro ao ler o arquivo CSV '{caminho_arquivo}': {e}")
             return None
+        return lidas
+
+    """
+    Lê o CSV em lotes de tamanho fixo e aplica cada lote diretamente nas árvores.
+
+    - Melhor caso (Ω): O(n log n), onde n é o número de linhas do CSV.
+    - Caso médio (Θ): O(n log n), cada linha envolve buscas/inserções nas árvores AVL.
+    - Pior caso (O): O(n log n), idem.
+
+    Justificativa: o custo de tempo é o mesmo do fluxo fila + processamento, mas o espaço extra
+    cai de O(n) (todas as linhas brutas na fila) para O(tamanho_lote).
+    """
+    def _processar_interacoes_csv_em_lotes(self, caminho_arquivo: str, tamanho_lote: int):
+        if tamanho_lote < 1:
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo.")
+
+        try:
+            with abrir_csv(caminho_arquivo) as arquivo_csv:
+                leitor_csv = csv.DictReader(arquivo_csv)
+
+                lidas = 0
+                while True:
+                    # islice consome no máximo 'tamanho_lote' linhas do leitor por vez
+                    lote = list(islice(leitor_csv, tamanho_lote))
+                    if not lote:
+                        break
+                    self._aplicar_lote(lote)
+                    lidas += len(lote)
+        except FileNotFoundError:
+            print(f"Erro: Arquivo '{caminho_arquivo}' não encontrado.")
+            return None
+        except Exception as e:
+            print(f"Erro ao ler o arquivo CSV '{caminho_arquivo}': {e}")
+            return None
+        return lidas
+
+    """
+    Converte o CSV em paralelo (ver analise.ingestao_paralela) e aplica os resultados nas árvores.
+
+    - Melhor caso (Ω): O(n / p + n log n), com p processos fazendo a conversão das n linhas.
+    - Caso médio (Θ): O(n / p + n log n), a aplicação nas árvores continua serial.
+    - Pior caso (O): O(n log n), com um único processo.
+
+    Justificativa: a conversão (datetime, int, validação) sai do processo principal; as inserções
+    nas árvores continuam em ordem, preservando o mesmo estado final do caminho serial.
+
+    A divisão em intervalos de bytes exige um arquivo descomprimido; um arquivo comprimido é lido em fluxo
+    pelo modo "streaming", com o mesmo resultado.
+    """
+    def _processar_interacoes_csv_em_paralelo(self, caminho_arquivo: str, num_processos: int | None):
+        # Importação tardia: o módulo de ingestão paralela importa converter_linha_csv deste módulo
+        from analise.ingestao_paralela import converter_csv_em_paralelo
+
+        if num_processos is not None and num_processos < 1:
+            raise ValueError("O número de processos deve ser um inteiro positivo.")
+
+        try:
+            if detectar_compressao(caminho_arquivo) is not None:
+                print(f"Aviso: '{caminho_arquivo}' é comprimido; lendo em lotes, sem conversão paralela.")
+                return self._processar_interacoes_csv_em_lotes(caminho_arquivo, TAMANHO_LOTE_PADRAO)
+
+            lidas = 0
+            for resultados in converter_csv_em_paralelo(caminho_arquivo, num_processos):
+                lidas += len(resultados)
+                if self._instrumentacao is not None:
+                    self._aplicar_resultados_instrumentado(resultados)
+                    continue
+                for resultado in resultados:
+                    if isinstance(resultado, str):
+                        print(resultado)
+                        self._linhas_rejeitadas += 1
+                        continue
+                    try:
+                        self._aplicar_registro(resultado)
+                    except Exception as e:
+                        # Ver _aplicar_linha
+                        print(f"Erro ao aplicar interação: {e}")
+                        self._linhas_rejeitadas += 1
+        except FileNotFoundError:
+            print(f"Erro: Arquivo '{caminho_arquivo}' não encontrado.")
+            return None
+        except Exception as e:
+            print(f"Erro ao ler o arquivo CSV '{caminho_arquivo}': {e}")
+            return None
+        return lidas
+
+    """
+    Ingere apenas as linhas novas de um CSV que cresce por acréscimo (append), aplicando-as direto nas árvores.
+
+    A marca d'água de cada arquivo guarda: offset (bytes já consumidos), tamanho e mtime vistos na última leitura,
+    o cabeçalho, a última linha consumida (para detectar se o arquivo foi substituído) e o último timestamp processado.
+
+    - Melhor caso (Ω): O(1), arquivo com o mesmo tamanho e mtime da última leitura (apenas um os.stat).
+    - Caso médio (Θ): O(k log n), onde k é o número de linhas novas.
+    - Pior caso (O): O(N log n), se o arquivo foi truncado/substituído e precisa ser lido do início.
+
+    Justificativa: a leitura começa no offset salvo (seek), então linhas já processadas nunca são relidas;
+    uma linha final sem quebra de linha (ainda sendo escrita) fica para a próxima execução, assim como um registro
+    cujo campo entre aspas ainda não foi fechado (o offset só avança em fins de registro do CSV). Pelo mesmo motivo,
+    a marca só é criada quando o cabeçalho está completo: antes disso (arquivo vazio ou cabeçalho parcial), retorna 0.
+    """
+    def _processar_interacoes_csv_incremental(self, caminho_arquivo: str, tamanho_lote: int):
+        chave = os.path.abspath(caminho_arquivo)
+
+        try:
+            estado_arquivo = os.stat(caminho_arquivo)
+        except FileNotFoundError:
+            print(f"Erro: Arquivo '{caminho_arquivo}' não encontrado.")
+            return None
+
+        # Os offsets da marca d'água só fazem sentido no arquivo descomprimido
+        if detectar_compressao(caminho_arquivo) is not None:
+            print(f"Erro: o modo incremental não aceita arquivos comprimidos ('{caminho_arquivo}').")
+            return None
+
+        marca = self._marcas_ingestao.get(chave)
+        if (marca is not None and marca["tamanho"] == estado_arquivo.st_size
+                and marca["mtime_ns"] == estado_arquivo.st_mtime_ns):
+            return 0
+
+        try:
+            with open(caminho_arquivo, mode="rb") as arquivo:
+                if marca is not None and not self._marca_continua_valida(arquivo, marca, estado_arquivo.st_size):
+                    print(f"Aviso: '{caminho_arquivo}' foi truncado ou substituído; reprocessando desde o início.")
+                    marca = None
+
+                if marca is None:
+                    linha_cabecalho = arquivo.readline()
+                    while linha_cabecalho.endswith(b"\n") and linha_cabecalho.count(b'"') % 2:
+                        linha_cabecalho += arquivo.readline()
+                    # Arquivo vazio ou cabeçalho ainda sendo escrito: nenhuma marca é salva até ele estar completo,
+                    # senão as linhas seguintes seriam lidas com um cabeçalho errado (e descartadas)
+                    if not linha_cabecalho.endswith(b"\n") or linha_cabecalho.count(b'"') % 2:
+                        return 0
+                    marca = {
+                        "offset": arquivo.tell(),
+                        "tamanho": 0,
+                        "mtime_ns": 0,
+                        "cabecalho": next(csv.reader([linha_cabecalho.decode("utf-8")]), []),
+                        "ultima_linha": linha_cabecalho.hex(),
+                        "ultimo_timestamp": None,
+                    }
+                else:
+                    arquivo.seek(marca["offset"])
+
+                cabecalho = marca["cabecalho"]
+                lidas = 0
+                lote = []
+                ultima_linha = None
+                registro_bytes = b""
+                for linha_bytes in arquivo:
+                    # Linha incompleta no fim do arquivo: ainda está sendo escrita
+                    if not linha_bytes.endswith(b"\n"):
+                        break
+                    registro_bytes += linha_bytes
+                    # Aspas em número ímpar: um campo entre aspas (comentário com quebra de linha) continua na
+                    # próxima linha; o offset só avança quando o registro do CSV está completo
+                    if registro_bytes.count(b'"') % 2:
+                        continue
+                    marca["offset"] += len(registro_bytes)
+                    ultima_linha = registro_bytes
+
+                    valores = next(csv.reader([registro_bytes.decode("utf-8")]), [])
+                    registro_bytes = b""
+                    if valores:
+                        lote.append(dict(zip(cabecalho, valores)))
+                    if len(lote) >= tamanho_lote:
+                        self._aplicar_lote_incremental(lote, marca)
+                        lidas += len(lote)
+                        lote = []
+
+                if lote:
+                    self._aplicar_lote_incremental(lote, marca)
+                    lidas += len(lote)
+                if ultima_linha is not None:
+                    marca["ultima_linha"] = ultima_linha.hex()
+        except Exception as e:
+            print(f"Erro ao ler o arquivo CSV '{caminho_arquivo}': {e}")
+            return None
+
+        marca["tamanho"] = estado_arquivo.st_size
+        marca["mtime_ns"] = estado_arquivo.st_mtime_ns
+        self._marcas_ingestao[chave] = marca
+        return lidas
+
+    # O arquivo ainda é o mesmo se não encolheu e se a última linha consumida continua logo antes do offset salvo
+    def _marca_continua_valida(self, arquivo, marca: dict, tamanho_atual: int) -> bool:
+        ultima_linha = bytes.fromhex(marca["ultima_linha"])
+        if tamanho_atual < marca["offset"] or marca["offset"] < len(ultima_linha):
+            return False
+        arquivo.seek(marca["offset"] - len(ultima_linha))
+        return arquivo.read(len(ultima_linha)) == ultima_linha
+
+    def _aplicar_lote_incremental(self, lote: list[dict], marca: dict) -> None:
+        instrumentacao = self._instrumentacao
+        aplicar_registro = self._aplicar_registro if instrumentacao is None else self._aplicar_registro_instrumentado
+        tamanhos_arvores = (len(self._arvore_conteudos), len(self._arvore_usuarios))
+        rejeitadas = 0
+
+        maior_epoch = None
+        for linha in lote:
+            try:
+                registro = converter_linha_csv(linha)
+            except Exception as e:
+                print(f"Erro ao criar interação: {e}")
+                self._linhas_rejeitadas += 1
+                rejeitadas += 1
+                continue
+
+            try:
+                aplicar_registro(registro)
+            except Exception as e:
+                # Ver _aplicar_linha: sem isto, a exceção descartaria a marca d'água com os lotes anteriores
+                # já aplicados, e a próxima chamada os aplicaria de novo
+                print(f"Erro ao aplicar interação: {e}")
+                self._linhas_rejeitadas += 1
+                rejeitadas += 1
+                continue
+            if maior_epoch is None or registro[3] > maior_epoch:
+                maior_epoch = registro[3]
+
+        if maior_epoch is not None:
+            timestamp = epoch_para_datetime(maior_epoch).isoformat(sep=" ")
+            if marca["ultimo_timestamp"] is None or timestamp > marca["ultimo_timestamp"]:
+                marca["ultimo_timestamp"] = timestamp
+
+        if instrumentacao is not None:
+            self._contabilizar_lote(len(lote), rejeitadas, tamanhos_arvores)
+
+    # Complexidade: O(k) - cada uma das k linhas (dicionários no formato do CSV) é enfileirada em O(1).
+    # As linhas só são aplicadas nas árvores por processar_interacoes_da_fila.
+    def enfileirar_interacoes(self, linhas) -> None:
+        for linha in linhas:
+            self._fila_interacoes_brutas.enfileirar(linha)
+
     """
     Processa cada interação da fila e atualiza as árvores e plataformas.
 
@@ -81,346 +637,900 @@ class SistemaAnaliseEngajamento:
     - Pior caso (O): O(n log n), com custo dominante vindo das árvores AVL.
 
     Justificativa: para cada linha desenfileirada, o método realiza buscas e inserções nas árvores AVL e em dicionário, o que mantém a complexidade logarítmica.
+    As linhas são retiradas em lotes, com uma única aquisição da trava da fila por lote.
+
+    Com 'bloquear=True', continua consumindo as linhas enfileiradas por outras threads até `fechar_fila_interacoes`.
     """
-    def processar_interacoes_da_fila(self) -> None:
-        while not self._fila_interacoes_brutas.esta_vazia():
-            linha = self._fila_interacoes_brutas.desenfileirar()
-
-            # Extrai os dados da linha do CSV
-            id_usuario = linha.get("id_usuario")
-            id_conteudo = linha.get("id_conteudo")
-            nome_conteudo = linha.get("nome_conteudo")
-            timestamp_interacao = linha.get("timestamp_interacao")
-            nome_plataforma = linha.get("nome_plataforma")
-            tipo_interacao = linha.get("tipo_interacao")
-            watch_duration_seconds = linha.get("watch_duration_seconds")
-            comment_text = linha.get("comment_text", "")
-
-            # Conteúdo
-            conteudo = self._arvore_conteudos.buscar_elemento(int(id_conteudo))
-            if conteudo is None:
-                conteudo = Conteudo(int(id_conteudo), nome_conteudo)
-                self.inserir_conteudo(conteudo)
-
-            # Usuário
-            usuario = self._arvore_usuarios.buscar_elemento(int(id_usuario))
-            if usuario is None:
-                usuario = Usuario(int(id_usuario))
-                self.inserir_usuario(usuario)
-
-            # Plataforma
-            plataforma = self._plataformas_registradas.get(nome_plataforma)
-            if plataforma is None:
-                plataforma = Plataforma(len(self._plataformas_registradas) + 1, nome_plataforma)
-                self._plataformas_registradas[nome_plataforma] = plataforma
-
-            # Cria a interação
+    def processar_interacoes_da_fila(self, bloquear: bool = False) -> None:
+        if self._instrumentacao is not None:
+            with self._instrumentacao.medir("processar_fila"):
+                for lote in self._fila_interacoes_brutas.drenar_lotes(TAMANHO_LOTE_PADRAO, bloquear=bloquear):
+                    self._aplicar_lote(lote)
+            return
+
+        for lote in self._fila_interacoes_brutas.drenar_lotes(TAMANHO_LOTE_PADRAO, bloquear=bloquear):
+            self._aplicar_lote(lote)
+
+    # Sinaliza que não haverá mais linhas: um processar_interacoes_da_fila(bloquear=True) termina após esvaziar a fila
+    def fechar_fila_interacoes(self) -> None:
+        self._fila_interacoes_brutas.fechar()
+
+    def _aplicar_lote(self, lote: list[dict]) -> None:
+        if self._instrumentacao is not None:
+            self._aplicar_lote_instrumentado(lote)
+            return
+
+        for linha in lote:
+            self._aplicar_linha(linha)
+
+    # -------- Caminhos instrumentados (usados apenas com a instrumentação ligada) --------
+    # Mesmo efeito de _aplicar_lote, medindo a conversão de cada linha e as fases de _aplicar_registro_instrumentado.
+    def _aplicar_lote_instrumentado(self, lote: list[dict]) -> None:
+        instrumentacao = self._instrumentacao
+        relogio = time.perf_counter_ns
+        tamanhos_arvores = (len(self._arvore_conteudos), len(self._arvore_usuarios))
+        rejeitadas = 0
+
+        for linha in lote:
+            inicio = relogio()
             try:
-                interacao_obj = Interacao(
-                    conteudo_associado=conteudo,
-                    id_usuario=id_usuario,
-                    timestamp_interacao=timestamp_interacao,
-                    plataforma_interacao=plataforma,
-                    tipo_interacao=tipo_interacao,
-                    watch_duration_seconds=watch_duration_seconds,
-                    comment_text=comment_text
-                )
+                registro = converter_linha_csv(linha)
             except Exception as e:
                 print(f"Erro ao criar interação: {e}")
+                self._linhas_rejeitadas += 1
+                rejeitadas += 1
+                continue
+            instrumentacao.registrar("conversao_linha", relogio() - inicio)
+            try:
+                self._aplicar_registro_instrumentado(registro)
+            except Exception as e:
+                # Ver _aplicar_linha
+                print(f"Erro ao aplicar interação: {e}")
+                self._linhas_rejeitadas += 1
+                rejeitadas += 1
+
+        self._contabilizar_lote(len(lote), rejeitadas, tamanhos_arvores)
+
+    # Resultados da ingestão paralela: registros já convertidos ou mensagens de erro (linhas rejeitadas)
+    def _aplicar_resultados_instrumentado(self, resultados: list) -> None:
+        tamanhos_arvores = (len(self._arvore_conteudos), len(self._arvore_usuarios))
+        rejeitadas = 0
+        for resultado in resultados:
+            if isinstance(resultado, str):
+                print(resultado)
+                self._linhas_rejeitadas += 1
+                rejeitadas += 1
                 continue
+            try:
+                self._aplicar_registro_instrumentado(resultado)
+            except Exception as e:
+                # Ver _aplicar_linha
+                print(f"Erro ao aplicar interação: {e}")
+                self._linhas_rejeitadas += 1
+                rejeitadas += 1
+        self._contabilizar_lote(len(resultados), rejeitadas, tamanhos_arvores)
+
+    # Mesmo efeito de _aplicar_registro, medindo separadamente a busca/criação das entidades nas árvores
+    # e o registro da interação (construção da Interacao e atualização dos agregados)
+    def _aplicar_registro_instrumentado(self, registro: tuple) -> None:
+        instrumentacao = self._instrumentacao
+        relogio = time.perf_counter_ns
 
-            # Registra a interação no usuário e no conteúdo
-            usuario.registrar_interacao(interacao_obj)
-            conteudo.adicionar_interacao(interacao_obj)
+        inicio = relogio()
+        entidades = self._resolver_entidades(registro)
+        meio = relogio()
+        self._registrar_interacao(registro, *entidades)
+        instrumentacao.registrar("arvores.busca_ou_insercao", meio - inicio)
+        instrumentacao.registrar("registro_interacao", relogio() - meio)
+
+    # Linhas lidas/rejeitadas do lote e acertos/falhas nas árvores: cada linha aplicada faz uma busca em cada árvore,
+    # e cada falha cria um elemento novo, então as falhas são o crescimento da árvore durante o lote
+    def _contabilizar_lote(self, lidas: int, rejeitadas: int, tamanhos_arvores: tuple[int, int]) -> None:
+        instrumentacao = self._instrumentacao
+        aplicadas = lidas - rejeitadas
+        instrumentacao.contar("linhas_lidas", lidas)
+        instrumentacao.contar("linhas_rejeitadas", rejeitadas)
+        for nome, arvore, tamanho_antes in (("arvore_conteudos", self._arvore_conteudos, tamanhos_arvores[0]),
+                                            ("arvore_usuarios", self._arvore_usuarios, tamanhos_arvores[1])):
+            falhas = len(arvore) - tamanho_antes
+            instrumentacao.contar(f"{nome}.falhas", falhas)
+            instrumentacao.contar(f"{nome}.acertos", aplicadas - falhas)
 
     """
-    Gera um relatório dos usuários mais ativos com base no tempo total de consumo (em segundos).
+    Valida uma linha bruta do CSV e a registra no conteúdo, no usuário e na plataforma.
 
-    Args:
-        top_n (int, opcional): Número de usuários mais ativos a exibir. Se None, exibe todos.
-
-    - Melhor caso (Ω): O(n log n), se a ordenação for eficiente e a árvore já estiver balanceada.
-    - Caso médio (Θ): O(n log n), onde n é o número de usuários.
-    - Pior caso (O): O(n²), caso o Quick Sort tenha piores divisões.
-
-    Justificativa: a extração dos usuários da árvore leva O(n), e a ordenação com Quick Sort pode variar de O(n log n) a O(n²).
-    """
-    def gerar_relatorio_atividade_usuarios(self, top_n: int = None):
-        # Obtém todos os usuários da árvore em ordem
-        usuarios = self._arvore_usuarios.percurso_in_order()
-        #print(f"DEBUG: Usuários encontrados: {len(usuarios)}")
-
-        # Cria lista de tuplas (usuario, tempo_total_consumo)
-        usuarios_consumo = []
-        for usuario in usuarios:
-            #print(f"DEBUG: Usuário {usuario.id_usuario}")
-            #print(f"DEBUG: Interações: {getattr(usuario, '_Usuario__interacoes_realizadas', None)}")
-            tempo_total = sum(
-                interacao.watch_duration_seconds
-                for interacao in getattr(usuario, '_Usuario__interacoes_realizadas', [])
+    - Melhor caso (Ω): O(log n), conteúdo e usuário já existentes nas árvores.
+    - Caso médio (Θ): O(log n), buscas e eventuais inserções nas árvores AVL.
+    - Pior caso (O): O(log n), idem, graças ao balanceamento.
+
+    Justificativa: o custo é dominado pelas buscas/inserções nas árvores; a plataforma é resolvida em O(1) via dicionário.
+    """
+    def _aplicar_linha(self, linha: dict) -> bool:
+        try:
+            registro = converter_linha_csv(linha)
+        except Exception as e:
+            print(f"Erro ao criar interação: {e}")
+            self._linhas_rejeitadas += 1
+            return False
+
+        try:
+            self._aplicar_registro(registro)
+        except Exception as e:
+            # Registro já validado que ainda assim falhou ao ser aplicado: a linha é contada como rejeitada
+            # e o lote segue, em vez de a exceção interromper o consumo da fila
+            print(f"Erro ao aplicar interação: {e}")
+            self._linhas_rejeitadas += 1
+            return False
+        return True
+
+    def _aplicar_registro(self, registro: tuple) -> None:
+        self._registrar_interacao(registro, *self._resolver_entidades(registro))
+
+    # Conteúdo, usuário e plataforma do registro, criados se ainda não existirem
+    def _resolver_entidades(self, registro: tuple) -> tuple[Conteudo, Usuario, Plataforma]:
+        self._versao_dados += 1
+        return (
+            self._obter_ou_criar_conteudo(registro[0], registro[1]),
+            self._obter_ou_criar_usuario(registro[2]),
+            self._obter_ou_criar_plataforma(registro[4]),
+        )
+
+    def _registrar_interacao(self, registro: tuple, conteudo: Conteudo, usuario: Usuario,
+                             plataforma: Plataforma) -> None:
+        (id_conteudo, _, id_usuario, epoch,
+         _, tipo_interacao, watch_duration_seconds, comment_text) = registro
+
+        if self._rollups is not None:
+            self._rollups.registrar(epoch, id_conteudo, plataforma.id_plataforma, id_usuario,
+                                    tipo_interacao, watch_duration_seconds)
+
+        if self._armazenamento is not None:
+            # Modo colunar: a linha vai para os arrays e as entidades guardam apenas o índice
+            indice = self._armazenamento.adicionar(
+                id_conteudo,
+                id_usuario,
+                epoch,
+                plataforma.id_plataforma,
+                tipo_interacao,
+                watch_duration_seconds,
+                comment_text,
             )
-            usuarios_consumo.append((usuario, tempo_total))
+            usuario.registrar_indice_colunar(indice, tipo_interacao, watch_duration_seconds)
+            conteudo.adicionar_indice_colunar(indice, tipo_interacao, watch_duration_seconds)
+            plataforma.contabilizar_interacao(tipo_interacao, watch_duration_seconds)
+            return
+
+        interacao_obj = Interacao(
+            conteudo_associado=conteudo,
+            id_usuario=id_usuario,
+            timestamp_interacao=epoch,
+            plataforma_interacao=plataforma,
+            tipo_interacao=tipo_interacao,
+            watch_duration_seconds=watch_duration_seconds,
+            # Comentários repetidos passam a compartilhar o mesmo objeto str (no modo colunar, o armazenamento já os codifica)
+            comment_text=self._textos_comentario.internar(comment_text) if comment_text else comment_text
+        )
+
+        # Registra a interação no usuário, no conteúdo e na plataforma (que só mantém agregados)
+        usuario.registrar_interacao(interacao_obj)
+        conteudo.adicionar_interacao(interacao_obj)
+        plataforma.registrar_interacao(interacao_obj)
+        self._indice_temporal.adicionar(epoch, interacao_obj)
+
+    def _obter_ou_criar_conteudo(self, id_conteudo: int, nome_conteudo: str) -> Conteudo:
+        conteudo = self._arvore_conteudos.get(id_conteudo)
+        if conteudo is None:
+            conteudo = Conteudo(id_conteudo, nome_conteudo)
+            if self._armazenamento is not None:
+                conteudo.usar_visao_colunar(VisaoInteracoes(self._armazenamento, self._materializar_interacao))
+            self.inserir_conteudo(conteudo)
+        return conteudo
+
+    def _obter_ou_criar_usuario(self, id_usuario: int) -> Usuario:
+        usuario = self._arvore_usuarios.get(id_usuario)
+        if usuario is None:
+            usuario = Usuario(id_usuario)
+            if self._armazenamento is not None:
+                usuario.usar_visao_colunar(VisaoInteracoes(self._armazenamento, self._materializar_interacao))
+            self.inserir_usuario(usuario)
+        return usuario
+
+    def _obter_ou_criar_plataforma(self, nome_plataforma: str) -> Plataforma:
+        plataforma = self._plataformas_registradas.get(nome_plataforma)
+        if plataforma is None:
+            plataforma = Plataforma(len(self._plataformas_registradas) + 1, nome_plataforma)
+            self._plataformas_registradas[nome_plataforma] = plataforma
+            self._plataformas_por_id[plataforma.id_plataforma] = plataforma
+        return plataforma
+
+    """
+    Reconstrói um objeto Interacao a partir de uma linha do armazenamento colunar.
+
+    - Melhor caso (Ω): O(1), conteúdo encontrado próximo à raiz da árvore.
+    - Caso médio (Θ): O(log n), busca do conteúdo associado na árvore.
+    - Pior caso (O): O(log n), idem.
+
+    Justificativa: usado pelas visões colunares apenas quando algum código precisa do objeto completo.
+    """
+    def _materializar_interacao(self, indice: int) -> Interacao:
+        (id_conteudo, id_usuario, timestamp_epoch, codigo_plataforma,
+         codigo_tipo, duracao, comentario) = self._armazenamento.linha(indice)
+
+        return Interacao(
+            conteudo_associado=self._arvore_conteudos.buscar_elemento(id_conteudo),
+            id_usuario=id_usuario,
+            timestamp_interacao=timestamp_epoch,
+            plataforma_interacao=self._plataformas_por_id[codigo_plataforma],
+            tipo_interacao=TipoInteracao(codigo_tipo),
+            watch_duration_seconds=duracao,
+            comment_text=comentario
+        )
+
+    # -------- Consultas por janela de tempo --------
+    # As janelas são semiabertas, [inicio, fim), com datetimes sem fuso horário (como os do CSV); None deixa o lado aberto.
+
+    # Complexidade: O(1) se o índice estiver em dia; no modo colunar, O(k) para incluir as k linhas novas do armazenamento.
+    def _obter_indice_temporal(self) -> IndiceTemporal:
+        if self._armazenamento is not None:
+            timestamps = self._armazenamento.timestamps
+            for linha in range(len(self._indice_temporal), len(timestamps)):
+                self._indice_temporal.adicionar(timestamps[linha], linha)
+        return self._indice_temporal
+
+    # Índice temporal das interações de um conteúdo ou usuário, criado na primeira consulta e completado
+    # incrementalmente (O(k) para as k interações novas da entidade) nas consultas seguintes.
+    def _obter_indice_temporal_entidade(self, tipo: str, entidade, interacoes) -> IndiceTemporal:
+        chave = (tipo, id(entidade))
+        entidade_indexada, indice = self._indices_temporais_entidades.get(chave, (None, None))
+        if entidade_indexada is not entidade:
+            indice = IndiceTemporal("q" if self._armazenamento is not None else None)
+            self._indices_temporais_entidades[chave] = (entidade, indice)
+
+        if self._armazenamento is not None:
+            timestamps = self._armazenamento.timestamps
+            linhas = interacoes.indices
+            for posicao in range(len(indice), len(linhas)):
+                indice.adicionar(timestamps[linhas[posicao]], linhas[posicao])
+        else:
+            for posicao in range(len(indice), len(interacoes)):
+                interacao = interacoes[posicao]
+                indice.adicionar(interacao.timestamp_epoch, interacao)
+        return indice
+
+    # Converte uma referência do índice temporal em objeto Interacao
+    def _referencia_para_interacao(self, referencia) -> Interacao:
+        return self._materializar_interacao(referencia) if self._armazenamento is not None else referencia
+
+    """
+    Retorna, em ordem cronológica, as interações ocorridas entre 'inicio' (inclusive) e 'fim' (exclusive).
+
+    - Melhor caso (Ω): O(log n), janela vazia.
+    - Caso médio (Θ): O(log n + k), onde k é o número de interações na janela.
+    - Pior caso (O): O(n log n), na primeira consulta após inserções fora de ordem cronológica (reordenação única).
+
+    Justificativa: as pontas da janela são localizadas por busca binária no array ordenado de epochs.
+    """
+    def interacoes_no_periodo(self, inicio: datetime | None = None, fim: datetime | None = None) -> list[Interacao]:
+        referencias = self._obter_indice_temporal().intervalo(_epoch_ou_none(inicio), _epoch_ou_none(fim))
+        return [self._referencia_para_interacao(referencia) for referencia in referencias]
+
+    # Mesmas garantias de 'interacoes_no_periodo', com n = interações do conteúdo. Retorna [] se o conteúdo não existir.
+    def interacoes_do_conteudo_no_periodo(self, id_conteudo: int, inicio: datetime | None = None,
+                                          fim: datetime | None = None) -> list[Interacao]:
+        conteudo = self._arvore_conteudos.get(id_conteudo)
+        if conteudo is None:
+            return []
+        indice = self._obter_indice_temporal_entidade("conteudo", conteudo, conteudo.interacoes)
+        return [self._referencia_para_interacao(r) for r in indice.intervalo(_epoch_ou_none(inicio), _epoch_ou_none(fim))]
+
+    # Mesmas garantias de 'interacoes_no_periodo', com n = interações do usuário. Retorna [] se o usuário não existir.
+    def interacoes_do_usuario_no_periodo(self, id_usuario: int, inicio: datetime | None = None,
+                                         fim: datetime | None = None) -> list[Interacao]:
+        usuario = self._arvore_usuarios.get(id_usuario)
+        if usuario is None:
+            return []
+        indice = self._obter_indice_temporal_entidade("usuario", usuario, usuario.interacoes_realizadas)
+        return [self._referencia_para_interacao(r) for r in indice.intervalo(_epoch_ou_none(inicio), _epoch_ou_none(fim))]
+
+    # Percorre a janela no índice global, devolvendo tuplas
+    # (epoch, id_conteudo, id_usuario, plataforma, codigo_tipo, watch_duration_seconds, comment_text)
+    # sem materializar objetos Interacao no modo colunar.
+    def _registros_no_periodo(self, inicio: datetime | None, fim: datetime | None):
+        itens = self._obter_indice_temporal().itens_intervalo(_epoch_ou_none(inicio), _epoch_ou_none(fim))
+
+        if self._armazenamento is not None:
+            armazenamento = self._armazenamento
+            ids_conteudo, ids_usuario = armazenamento.ids_conteudo, armazenamento.ids_usuario
+            codigos_plataforma, codigos_tipo = armazenamento.codigos_plataforma, armazenamento.codigos_tipo
+            duracoes = armazenamento.duracoes
+            for epoch, linha in itens:
+                yield (epoch, ids_conteudo[linha], ids_usuario[linha],
+                       self._plataformas_por_id[codigos_plataforma[linha]], codigos_tipo[linha],
+                       duracoes[linha], armazenamento.comentario(linha))
+        else:
+            for epoch, i in itens:
+                yield (epoch, i.conteudo_associado.id_conteudo, i.id_usuario, i.plataforma_interacao,
+                       i.codigo_tipo, i.watch_duration_seconds, i.comment_text)
 
-        # Ordena a lista com base no tempo total de consumo (decrescente)
-        quick_sort(usuarios_consumo, key=lambda x: x[1])
+    """
+    Série de tendência de um conteúdo, plataforma ou usuário, lida dos rollups pré-agregados.
+
+    Args:
+        dimensao (str): "conteudo", "plataforma" ou "usuario".
+        id_entidade (int): ID do conteúdo/usuário, ou id_plataforma.
+        granularidade (str): "minuto", "hora" ou "dia".
+        inicio, fim (datetime, opcionais): janela [inicio, fim) dos baldes.
+
+    Retorna uma lista ordenada de (início do balde, contagem por tipo de interação, tempo total em segundos).
+    Baldes antigos já compactados para uma granularidade mais grossa só aparecem nessa granularidade.
+
+    - Melhor caso (Ω): O(1), entidade sem baldes.
+    - Caso médio (Θ): O(b + r log r), onde b é o número de baldes da entidade e r o de baldes devolvidos.
+    - Pior caso (O): O(b + r log r), idem; nenhuma interação é percorrida.
+
+    Justificativa: os baldes são mantidos incrementalmente por CuboRollups.registrar durante a ingestão.
+    """
+    def serie_temporal(self, dimensao: str, id_entidade: int, granularidade: str = "hora",
+                       inicio: datetime | None = None, fim: datetime | None = None) -> list[tuple[datetime, dict, int]]:
+        if self._rollups is None:
+            raise ValueError("Os rollups não estão habilitados. Crie o sistema com rollups=True.")
+
+        serie = self._rollups.serie(dimensao, id_entidade, granularidade, _epoch_ou_none(inicio), _epoch_ou_none(fim))
+        return [
+            (epoch_para_datetime(balde), dict(zip(TIPOS_INTERACAO, valores[:-1])), valores[-1])
+            for balde, valores in serie
+        ]
+
+    """
+    Agrega por conteúdo, usuário e plataforma apenas as interações da janela [inicio, fim).
 
-        # Reverte para ordem decrescente (Quick Sort faz crescente por padrão)
-        usuarios_consumo.reverse()
+    Retorna um dicionário com listas em ordem de ID:
+        "conteudos":   (conteudo, tempo_total, contagem_por_tipo, comentarios)
+        "usuarios":    (usuario, tempo_total)
+        "plataformas": (plataforma, total_interacoes, tempo_total, contagem_por_tipo)
+    Só aparecem entidades com alguma interação na janela (e que ainda existam nas árvores).
+    Cada contagem_por_tipo é uma lista indexada pelo código do tipo (TipoInteracao).
 
-        # Limita ao top_n se for informado
-        if top_n is not None:
-            usuarios_consumo = usuarios_consumo[:top_n]
+    - Melhor caso (Ω): O(log n), janela vazia.
+    - Caso médio (Θ): O(log n + k + e log e), com k interações na janela e e entidades envolvidas.
+    - Pior caso (O): O(log n + k + e log e), idem.
+
+    Justificativa: só as k interações da janela são visitadas; a ordenação final é sobre as entidades envolvidas.
+    """
+    def _agregar_periodo(self, inicio: datetime | None, fim: datetime | None) -> dict:
+        conteudos: dict[int, list] = {}
+        usuarios: dict[int, list] = {}
+        plataformas: dict[int, list] = {}
+
+        for _, id_conteudo, id_usuario, plataforma, tipo, duracao, comentario in self._registros_no_periodo(inicio, fim):
+            agregado_conteudo = conteudos.get(id_conteudo)
+            if agregado_conteudo is None:
+                agregado_conteudo = conteudos[id_conteudo] = [self._arvore_conteudos.get(id_conteudo), 0, [0] * len(TipoInteracao), []]
+            agregado_conteudo[1] += duracao
+            agregado_conteudo[2][tipo] += 1
+            if tipo == TipoInteracao.COMMENT:
+                agregado_conteudo[3].append(comentario)
+
+            agregado_usuario = usuarios.get(id_usuario)
+            if agregado_usuario is None:
+                agregado_usuario = usuarios[id_usuario] = [self._arvore_usuarios.get(id_usuario), 0]
+            agregado_usuario[1] += duracao
+
+            agregado_plataforma = plataformas.get(plataforma.id_plataforma)
+            if agregado_plataforma is None:
+                agregado_plataforma = plataformas[plataforma.id_plataforma] = [plataforma, 0, 0, [0] * len(TipoInteracao)]
+            agregado_plataforma[1] += 1
+            agregado_plataforma[2] += duracao
+            agregado_plataforma[3][tipo] += 1
+
+        return {
+            "conteudos": [tuple(conteudos[i]) for i in sorted(conteudos) if conteudos[i][0] is not None],
+            "usuarios": [tuple(usuarios[i]) for i in sorted(usuarios) if usuarios[i][0] is not None],
+            "plataformas": [tuple(plataformas[i]) for i in sorted(plataformas)],
+        }
+
+    """
+    Calcula o tempo total de consumo (em segundos) dos usuários mais ativos.
+
+    Args:
+        top_n (int, opcional): Número de usuários mais ativos a retornar. Se None, retorna todos.
+        inicio, fim (datetime, opcionais): restringem o cálculo às interações da janela [inicio, fim).
+
+    Retorna uma lista de (id_usuario, tempo_total), em ordem decrescente de tempo (empates por menor ID).
+
+    - Melhor caso (Ω): O(n), quando os primeiros usuários percorridos já são os mais ativos.
+    - Caso médio (Θ): O(n log k), onde n é o número de usuários e k = top_n.
+    - Pior caso (O): O(n log k), ou O(n log n) se top_n for None (ordenação completa).
+      Com janela, n passa a ser o número de usuários ativos nela, mais O(log N + m) para as m interações da janela.
+
+    Justificativa: a extração dos usuários da árvore leva O(n) (o tempo total de cada usuário é um agregado O(1)),
+    e a seleção dos k maiores usa um heap de tamanho k, sem recursão e sem degradar com empates.
+    """
+    @relatorio_em_cache
+    def calcular_atividade_usuarios(self, top_n: int = None, inicio: datetime | None = None,
+                                    fim: datetime | None = None) -> list[tuple[int, int]]:
+        if inicio is None and fim is None:
+            # Obtém todos os usuários da árvore em ordem
+            usuarios = self._arvore_usuarios.percurso_in_order()
+
+            # Cria lista de tuplas (usuario, tempo_total_consumo)
+            usuarios_consumo = [(usuario, usuario.tempo_total_consumo) for usuario in usuarios]
+        else:
+            # Apenas os usuários com interações na janela, com o tempo consumido dentro dela
+            usuarios_consumo = self._agregar_periodo(inicio, fim)["usuarios"]
+
+        # Seleciona os top_n usuários com maior tempo total de consumo (decrescente; empates por menor ID)
+        usuarios_consumo = self._selecionar_top_k(usuarios_consumo, top_n, key=lambda x: x[1])
+
+        return [(usuario.id_usuario, tempo) for usuario, tempo in usuarios_consumo]
+
+    # Exibe o relatório dos usuários mais ativos (ver calcular_atividade_usuarios)
+    def gerar_relatorio_atividade_usuarios(self, top_n: int = None, inicio: datetime | None = None,
+                                           fim: datetime | None = None, formato: str = "texto", destino=None):
+        resultado = self.calcular_atividade_usuarios(top_n, inicio, fim)
+        exibir_relatorio_atividade_usuarios(resultado, formato, destino)
+        return resultado
 
-        # Exibe o relatório
-        print("\n--- Relatório: Usuários com Maior Tempo Total de Consumo ---")
-        for usuario, tempo in usuarios_consumo:
-            print(f"Usuário ID {usuario.id_usuario} - Tempo Total: {formatar_tempo(tempo)}")
-            
 # Relatorios Analiticos
     """
     Exibe um resumo analítico com métricas de engajamento por tipo de conteúdo e plataforma.
 
-    - Melhor caso (Ω): O(n), se os dados estiverem organizados e exigirem poucas iterações por categoria.
-    - Caso médio (Θ): O(n), onde n é o total de conteúdos percorridos na árvore.
-    - Pior caso (O): O(n), se todos os conteúdos tiverem muitos dados e diferentes tipos/plataformas.
+    - Melhor caso (Ω): O(n), onde n é o total de entidades (conteúdos, usuários e plataformas).
+    - Caso médio (Θ): O(n log 10), os rankings são seleções dos 10 maiores via heap.
+    - Pior caso (O): O(n log 10), idem.
 
-    Justificativa: percorre linearmente os conteúdos para agregar contagens e tempos por tipo/plataforma.
+    Justificativa: todas as métricas vêm dos agregados mantidos em Conteudo, Usuario e Plataforma,
+    então nenhuma seção percorre as interações; resta apenas ordenar as entidades.
     """
-    def gerar_relatorio_analitico(self):
+    def gerar_relatorio_analitico(self, motor: str = "python", inicio: datetime | None = None,
+                                  fim: datetime | None = None, formato: str = "texto", destino=None):
         """
         Gera relatórios analíticos de engajamento a partir dos dados processados.
         Inclui rankings e estatísticas conforme solicitado no enunciado.
+
+        Args:
+            motor (str): "python" (padrão) calcula as seções a partir dos agregados das entidades;
+                "vetorizado" calcula tudo de uma vez com NumPy sobre as colunas do armazenamento colunar
+                (requer armazenamento_colunar=True). A saída impressa é a mesma nos dois motores.
+            inicio, fim (datetime, opcionais): restringem o relatório às interações da janela [inicio, fim).
+                Com janela, as seções só incluem entidades com interações dentro dela.
+            formato (str): "texto" (padrão), "csv" ou "json" (ver analise.renderizacao).
+            destino: arquivo aberto ou caminho onde o relatório é escrito; None usa a saída padrão.
+
+        Returns:
+            dict: as seções calculadas (ver calcular_secoes_analiticas).
         """
-        print("\n===== RELATÓRIOS ANALÍTICOS DE ENGAJAMENTO =====")
-        
+        resultado = self.calcular_secoes_analiticas(motor, inicio, fim)
+        exibir_relatorio_analitico(resultado, formato, destino)
+        return resultado
+
+    """
+    Calcula as sete seções do relatório analítico com o motor escolhido (ver gerar_relatorio_analitico).
+
+    Retorna um dicionário com listas de tuplas simples (IDs, nomes e números, sem objetos de entidade):
+        conteudos_mais_consumidos:    (id_conteudo, tipo_conteudo, tempo)
+        usuarios_mais_ativos:         (id_usuario, tempo)
+        engajamento_plataformas:      (nome_plataforma, engajamentos)
+        conteudos_mais_comentados:    (id_conteudo, tipo_conteudo, comentarios)
+        interacoes_por_tipo_conteudo: (tipo_conteudo, interacoes)
+        media_por_plataforma:         (nome_plataforma, media)
+        comentarios_por_conteudo:     (id_conteudo, comentarios)
+
+    - Complexidade: a mesma de gerar_relatorio_analitico; a conversão para tuplas é O(n).
+    """
+    @relatorio_em_cache
+    def calcular_secoes_analiticas(self, motor: str = "python", inicio: datetime | None = None,
+                                   fim: datetime | None = None) -> dict:
+        if motor == "python":
+            secoes = self._calcular_secoes_analiticas(inicio, fim)
+        elif motor == "vetorizado":
+            # Importação tardia: NumPy é uma dependência opcional, necessária apenas para este motor
+            from analise.motor_vetorizado import MotorRelatoriosVetorizado
+            secoes = MotorRelatoriosVetorizado(self).calcular_secoes_analiticas(
+                _epoch_ou_none(inicio), _epoch_ou_none(fim)
+            )
+        else:
+            raise ValueError(f"Motor de relatório '{motor}' inválido. Permitidos: {MOTORES_RELATORIO}")
+
+        return {
+            "conteudos_mais_consumidos": [
+                (c.id_conteudo, type(c).__name__, tempo) for c, tempo in secoes["conteudos_mais_consumidos"]
+            ],
+            "usuarios_mais_ativos": [(u.id_usuario, tempo) for u, tempo in secoes["usuarios_mais_ativos"]],
+            "engajamento_plataformas": secoes["engajamento_plataformas"],
+            "conteudos_mais_comentados": [
+                (c.id_conteudo, type(c).__name__, comentarios) for c, comentarios in secoes["conteudos_mais_comentados"]
+            ],
+            "interacoes_por_tipo_conteudo": secoes["interacoes_por_tipo_conteudo"],
+            "media_por_plataforma": secoes["media_por_plataforma"],
+            "comentarios_por_conteudo": [
+                (c.id_conteudo, comentarios) for c, comentarios in secoes["comentarios_por_conteudo"]
+            ],
+        }
+
+    """
+    Calcula as sete seções do relatório analítico a partir dos agregados das entidades.
+
+    Retorna um dicionário com as listas de tuplas de cada seção; o formato é o mesmo produzido
+    por MotorRelatoriosVetorizado.calcular_secoes_analiticas.
+    Com 'inicio'/'fim', os agregados são recalculados apenas sobre as interações da janela (ver _agregar_periodo).
+    """
+    def _calcular_secoes_analiticas(self, inicio: datetime | None = None, fim: datetime | None = None) -> dict:
+        # Valores de cada entidade: (conteudo, tempo, comentarios, interacoes), (usuario, tempo)
+        # e (nome_plataforma, engajamentos, interacoes, tempo)
+        if inicio is None and fim is None:
+            conteudos = [
+                (c, c.tempo_total_consumo, c.total_comentarios, c.total_interacoes)
+                for c in self._arvore_conteudos.percurso_in_order()
+            ]
+            usuarios = [(u, u.tempo_total_consumo) for u in self._arvore_usuarios.percurso_in_order()]
+            plataformas = [
+                (p.nome_plataforma, p.total_engajamentos, p.total_interacoes, p.tempo_total_consumo)
+                for p in self._plataformas_registradas.values()
+            ]
+        else:
+            periodo = self._agregar_periodo(inicio, fim)
+            conteudos = [
+                (c, tempo, contagem[TipoInteracao.COMMENT], sum(contagem))
+                for c, tempo, contagem, _ in periodo["conteudos"]
+            ]
+            usuarios = periodo["usuarios"]
+            plataformas = [
+                (p.nome_plataforma, sum(contagem[tipo] for tipo in TIPOS_ENGAJAMENTO), total, tempo)
+                for p, total, tempo, contagem in periodo["plataformas"]
+            ]
+
         # 1. Ranking de conteúdos mais consumidos (por tempo total de consumo)
         """
         Coleta todos os conteúdos da árvore AVL.
-        Para cada conteúdo, soma o tempo total assistido (watch_duration_seconds).
+        Para cada conteúdo, lê o tempo total assistido (agregado de watch_duration_seconds).
         Armazena em uma lista os conteúdos e seus respectivos tempos de consumo.
-        Ordena a lista de tuplas por ordem crescente de tempo de consumo.
+        Seleciona os 10 conteúdos com maior tempo de consumo.
         """
-        conteudos = [value for _, value in self._arvore_conteudos.items()]
-        ranking_conteudos = []
-        for c in conteudos:
-            total = sum(i.watch_duration_seconds for i in c.interacoes_recebidas)
-            ranking_conteudos.append((c, total))
-
-        quick_sort(ranking_conteudos, key=lambda x: x[1])
-        ranking_conteudos.reverse()
-        
-        print("\n--- Conteúdos Mais Consumidos (por tempo total) ---")
-        for c, tempo in ranking_conteudos[:10]:
-            print(f"Conteúdo ID {c.id_conteudo} - Tipo: {type(c).__name__} - Tempo: {formatar_tempo(tempo)}")
-        
+        ranking_conteudos = [(c, tempo) for c, tempo, _, _ in conteudos]
+
+        ranking_conteudos = self._selecionar_top_k(ranking_conteudos, 10, key=lambda x: x[1])
+
         # 2. Usuários com maior tempo total de consumo
         """
         Coleta todos os usuários da árvore AVL.
-        Para cada usuário, soma o tempo total assistido (watch_duration_seconds) 
-        de todas as interações realizadas.
+        Para cada usuário, lê o tempo total assistido (agregado de watch_duration_seconds
+        de todas as interações realizadas).
         - Armazena em uma lista os usuários e seus respectivos tempos de consumo.
-        - Ordena a lista de tuplas por ordem crescente de tempo de consumo.
+        - Seleciona os 10 usuários com maior tempo de consumo.
         
         """
-        usuarios = [value for _, value in self._arvore_usuarios.items()]
-        ranking_usuarios = []
-        for u in usuarios:
-            tempo_total = sum(i.watch_duration_seconds for i in u._Usuario__interacoes_realizadas)
-            ranking_usuarios.append((u, tempo_total))
-
-        quick_sort(ranking_usuarios, key=lambda x: x[1])
-        ranking_usuarios.reverse()
-        
-        print("\n--- Usuários com Maior Tempo de Consumo ---")
-        for u, tempo in ranking_usuarios[:10]:
-            print(f"Usuário ID {u.id_usuario} - Tempo: {formatar_tempo(tempo)}")
+        ranking_usuarios = self._selecionar_top_k(usuarios, 10, key=lambda x: x[1])
 
         # 3. Plataforma com maior engajamento (like, share, comment)
         """
-        Coleta todos os conteúdos da árvore AVL.
-        Para cada conteúdo, conta o número de interações de tipo "like", "share" e "comment".
-        - Armazena em um dicionário os conteúdos e seus respectivos engajamentos.
-        - Ordena o dicionário por ordem crescente de engajamento.
+        Coleta todas as plataformas registradas.
+        Para cada plataforma, lê o número de interações de tipo "like", "share" e "comment".
+        - Armazena em uma lista as plataformas e seus respectivos engajamentos.
+        - Seleciona as 10 plataformas com maior engajamento.
         """
-        engajamento = defaultdict(int)
-        for conteudo in conteudos:
-            for interacao in conteudo.interacoes:
-                if interacao.tipo_interacao in ["like", "share", "comment"]:
-                    engajamento[conteudo.plataforma.nome_plataforma] += 1
-        
-        ranking_engajamento = list(engajamento.items())
-        quick_sort(ranking_engajamento, key=lambda x: x[1])
-        ranking_engajamento.reverse()
-        
-        print("\n--- Plataforma com Maior Engajamento ---")
-        for plataforma, engajamento in ranking_engajamento[:10]:
-            print(f"Plataforma {plataforma} - Engajamento: {engajamento}")
-        
+        ranking_engajamento = [
+            (nome, engajamentos) for nome, engajamentos, _, _ in plataformas if engajamentos > 0
+        ]
+        ranking_engajamento = self._selecionar_top_k(ranking_engajamento, 10, key=lambda x: x[1])
+
         # 4. Conteúdo mais comentado
         """
         Coleta todos os conteúdos da árvore AVL.
         Para cada conteúdo, conta o número de interações de tipo "comment".
         - Armazena em uma lista os conteúdos e seus respectivos comentários.
-        - Ordena a lista de tuplas por ordem crescente de comentários.
+        - Seleciona os 10 conteúdos mais comentados.
         """
-        ranking_comentados = []
-        for conteudo in conteudos:
-            total_comentarios = sum(1 for interacao in conteudo.interacoes if interacao.tipo_interacao == "comment")
-            ranking_comentados.append((conteudo, total_comentarios))
+        comentarios_por_conteudo = [(conteudo, comentarios) for conteudo, _, comentarios, _ in conteudos]
+
+        ranking_comentados = self._selecionar_top_k(comentarios_por_conteudo, 10, key=lambda x: x[1])
 
-        quick_sort(ranking_comentados, key=lambda x: x[1])
-        ranking_comentados.reverse()
-        
-        print("\n--- Conteúdos Mais Comentados ---")
-        for c, comentarios in ranking_comentados[:10]:
-            print(f"Conteúdo ID {c.id_conteudo} - Tipo: {type(c).__name__} - Comentarios: {comentarios}")
-        
         # 5. Total de interações por tipo de conteúdo
         """
         Coleta todos os conteúdos da árvore AVL.    
         Para cada conteúdo, conta o número de interações.
         - Armazena em um dicionário os conteúdos e seus respectivos interações.
-        - Ordena o dicionário por ordem crescente de interações.
+        - Ordena o dicionário por ordem decrescente de interações.
         """
         interacoes_por_tipo = defaultdict(int)
-        for conteudo in conteudos:
+        for conteudo, _, _, total_interacoes in conteudos:
             tipo = type(conteudo).__name__
-            interacoes_por_tipo[tipo] += len(conteudo.interacoes)
-        
+            interacoes_por_tipo[tipo] += total_interacoes
+
         ranking_interacoes = list(interacoes_por_tipo.items())
-        quick_sort(ranking_interacoes, key=lambda x: x[1])
-        ranking_interacoes.reverse()
-        
-        print("\n--- Total de Interações por Tipo de Conteúdo ---")
-        for tipo, interacoes in ranking_interacoes:
-            print(f"Tipo: {tipo} - Quantidade de Interações: {interacoes}")
-        
+        ranking_interacoes = self._selecionar_top_k(ranking_interacoes, key=lambda x: x[1])
+
         # 6. Tempo médio de consumo por plataforma
         """
-        Coleta todos os conteúdos da árvore AVL.    
-        Para cada conteúdo, soma o tempo de cada interação.
-        - Armazena em um dicionário os conteúdos e seus respectivos tempos de interação.
-        - Calcula a média de interações por plataforma.
-        - Exibe a plataforma com a média de interações mais alta.
+        Coleta todas as plataformas registradas.
+        Para cada plataforma, lê o tempo total e a quantidade de interações (agregados).
+        - Calcula a média de tempo por interação em cada plataforma.
         """
-        tempo_plataforma = defaultdict(int)
-        qtd_plataforma = defaultdict(int)
-        for c in conteudos:
-            for i in c.interacoes_recebidas:
-                tempo_plataforma[i.plataforma_interacao.nome_plataforma] += i.watch_duration_seconds
-                qtd_plataforma[i.plataforma_interacao.nome_plataforma] += 1
-
-        print("\n--- Tempo Médio de Consumo por Plataforma ---")
-        for plataforma, total in tempo_plataforma.items():
-            qtd = qtd_plataforma[plataforma]
-            media = total // qtd if qtd > 0 else 0
-            print(f"{plataforma} - Média: {formatar_tempo(media)}")
+        media_por_plataforma = []
+        for nome, _, qtd, tempo in plataformas:
+            media = tempo // qtd if qtd > 0 else 0
+            media_por_plataforma.append((nome, media))
 
         # 7. Quantidade de comentários por conteúdo
         """
-        Coleta todos os conteúdos da árvore AVL.
-        Para cada conteúdo, conta o número de interações de tipo "comment". 
-        - Armazena em uma lista os conteúdos e seus respectivos comentários.
-        - Ordena a lista de tuplas por ordem crescente de comentários.
+        Reaproveita a contagem de comentários da seção 4, na ordem de ID dos conteúdos.
         """
-        print("\n--- Comentários por Conteúdo ---")
-        for c in conteudos:
-            comentarios = sum(1 for i in c.interacoes_recebidas if i.tipo_interacao == "comment")
-            print(f"Conteúdo ID {c.id_conteudo} - Comentários: {comentarios}")
+        return {
+            "conteudos_mais_consumidos": ranking_conteudos,
+            "usuarios_mais_ativos": ranking_usuarios,
+            "engajamento_plataformas": ranking_engajamento,
+            "conteudos_mais_comentados": ranking_comentados,
+            "interacoes_por_tipo_conteudo": ranking_interacoes,
+            "media_por_plataforma": media_por_plataforma,
+            "comentarios_por_conteudo": comentarios_por_conteudo,
+        }
 
     """
-    Exibe os conteúdos com maior engajamento baseado na soma de interações (like, comment, share).
+    Calcula os 10 conteúdos com maior engajamento baseado na soma de interações (like, comment, share).
+
+    Retorna uma lista de (id_conteudo, nome_conteudo, total, likes, shares, comments).
 
-    - Melhor caso (Ω): O(n log n), se as partições do Quick Sort forem equilibradas.
-    - Caso médio (Θ): O(n log n), onde n é o número de conteúdos.
-    - Pior caso (O): O(n²), com escolhas ruins de pivô no Quick Sort.
+    - Melhor caso (Ω): O(n), quando os primeiros conteúdos percorridos já são os mais engajados.
+    - Caso médio (Θ): O(n log 10), onde n é o número de conteúdos.
+    - Pior caso (O): O(n log 10), idem.
 
-    Justificativa: o custo dominante é o Quick Sort, que opera após coleta linear dos dados.
+    Justificativa: coleta linear dos agregados (O(1) por conteúdo) seguida da seleção dos 10 maiores via heap.
+    Com 'inicio'/'fim', as contagens vêm apenas das interações da janela [inicio, fim) (ver _agregar_periodo).
     """
-    def relatorio_conteudos_mais_engajados(self):
-        conteudos = self._arvore_conteudos.percurso_in_order()
+    @relatorio_em_cache
+    def calcular_conteudos_mais_engajados(self, inicio: datetime | None = None,
+                                          fim: datetime | None = None) -> list[tuple]:
+        if inicio is None and fim is None:
+            contagens = [
+                (conteudo, conteudo.contagem_por_codigo)
+                for conteudo in self._arvore_conteudos.percurso_in_order()
+            ]
+        else:
+            contagens = [(conteudo, contagem) for conteudo, _, contagem, _ in self._agregar_periodo(inicio, fim)["conteudos"]]
+
         engajamento = []
-        for conteudo in conteudos:
-            # Tenta usar interacoes_recebidas, se não existir, usa interacoes
-            interacoes = getattr(conteudo, 'interacoes_recebidas', None)
-            if interacoes is None:
-                interacoes = getattr(conteudo, 'interacoes', [])
-            likes = sum(1 for i in interacoes if getattr(i, 'tipo_interacao', None) == "like")
-            shares = sum(1 for i in interacoes if getattr(i, 'tipo_interacao', None) == "share")
-            comments = sum(1 for i in interacoes if getattr(i, 'tipo_interacao', None) == "comment")
+        for conteudo, contagem in contagens:
+            likes = contagem[TipoInteracao.LIKE]
+            shares = contagem[TipoInteracao.SHARE]
+            comments = contagem[TipoInteracao.COMMENT]
             total = likes + shares + comments
             engajamento.append((conteudo, total, likes, shares, comments))
-        quick_sort(engajamento, key=lambda x: x[1])
-        engajamento.reverse()
-        print("\n--- Conteúdos Mais Engajados ---")
-        for c, total, likes, shares, comments in engajamento[:10]:
-            print(f"Conteúdo ID {c.id_conteudo} - {c.nome_conteudo} | Engajamento Total: {total}\n👍 {likes}\n🔄 {shares}\n💬 {comments}\n")
-
-    """
-    Lista a quantidade de comentários para cada conteúdo registrado.
-
-    - Melhor caso (Ω): O(n log n), se dados estiverem balanceados.
-    - Caso médio (Θ): O(n log n), onde n é o número de conteúdos.
-    - Pior caso (O): O(n²), em caso de pior partição no Quick Sort.
-
-    Justificativa: cada conteúdo é acessado uma vez para verificar interações do tipo 'comment', com complexidade linear.
-    """
-    def gerar_relatorio_comentarios_por_conteudo(self):
-        conteudos = self._arvore_conteudos.percurso_in_order()
-        print("\n--- Comentários por Conteúdo ---")
-        for c in conteudos:
-            interacoes = getattr(c, 'interacoes_recebidas', None)
-            if interacoes is None:
-                interacoes = getattr(c, 'interacoes', [])
-            comentarios = [getattr(i, 'comment_text', '') for i in interacoes if getattr(i, 'tipo_interacao', None) == "comment"]
-            print(f"Conteúdo ID {c.id_conteudo} - {c.nome_conteudo} | 💬 Comentários: {len(comentarios)}")
-            for texto in comentarios:
-                print(f"  - {texto}")
-            print("")
-    
+        engajamento = self._selecionar_top_k(engajamento, 10, key=lambda x: x[1])
+        return [(c.id_conteudo, c.nome_conteudo, *valores) for c, *valores in engajamento]
+
+    # Exibe os conteúdos mais engajados (ver calcular_conteudos_mais_engajados)
+    def relatorio_conteudos_mais_engajados(self, inicio: datetime | None = None, fim: datetime | None = None,
+                                                 formato: str = "texto", destino=None):
+        resultado = self.calcular_conteudos_mais_engajados(inicio, fim)
+        exibir_conteudos_mais_engajados(resultado, formato, destino)
+        return resultado
+
     """
-    Gera relatório de conteúdos mais engajados, ordenando pelo total de interações com Quick Sort.
+    Lista os comentários de cada conteúdo registrado.
+
+    Retorna uma lista de (id_conteudo, nome_conteudo, textos dos comentários), em ordem de ID.
 
-    - Melhor caso (Ω): O(n log n), quando a partição do Quick Sort é sempre equilibrada.
-    - Caso médio (Θ): O(n log n), onde n é o número de conteúdos a ordenar.
-    - Pior caso (O): O(n²), se os conteúdos já estiverem em ordem desfavorável e o pivô for mal escolhido.
+    - Melhor caso (Ω): O(n), conteúdos sem comentários (a contagem é um agregado O(1)).
+    - Caso médio (Θ): O(n + m), onde n é o número de conteúdos e m o de interações dos conteúdos comentados.
+    - Pior caso (O): O(n + m), idem.
 
-    Justificativa: o tempo de ordenação depende do algoritmo escolhido (Quick Sort neste caso), que no pior caso pode degradar para O(n²).
+    Justificativa: os textos precisam ser listados, então só os conteúdos com comentários têm suas interações percorridas.
+    Com 'inicio'/'fim', lista apenas os conteúdos com interações na janela [inicio, fim) e os comentários feitos nela.
     """
-    def gerar_relatorio_engajamento_conteudos(self, top_n: int = None):
-        # Obtém todos os conteúdos armazenados na árvore binária (ordenados por ID)
-        conteudos = self._arvore_conteudos.percurso_in_order()
+    @relatorio_em_cache
+    def calcular_comentarios_por_conteudo(self, inicio: datetime | None = None,
+                                          fim: datetime | None = None) -> list[tuple[int, str, list[str]]]:
+        if inicio is not None or fim is not None:
+            return [
+                (c.id_conteudo, c.nome_conteudo, comentarios)
+                for c, _, _, comentarios in self._agregar_periodo(inicio, fim)["conteudos"]
+            ]
 
-        # Calcula o total de interações (engajamento) para cada conteúdo
-        engajamento_conteudos = []
-        for conteudo in conteudos:
-            total_interacoes = len(conteudo.interacoes)
-            engajamento_conteudos.append((conteudo, total_interacoes))
+        resultado = []
+        for c in self._arvore_conteudos.percurso_in_order():
+            comentarios = []
+            if c.total_comentarios > 0:
+                comentarios = [i.comment_text for i in c.interacoes if i.codigo_tipo is TipoInteracao.COMMENT]
+            resultado.append((c.id_conteudo, c.nome_conteudo, comentarios))
+        return resultado
 
-        # Ordena os conteúdos com base na métrica de engajamento (número de interações)
-        # Usa quick_sort (poderia ser insertion_sort para listas pequenas)
-        from estruturas_dados.algoritmos_ordenacao import quick_sort
-        quick_sort(engajamento_conteudos, key=lambda x: x[1])
+    # Exibe os comentários de cada conteúdo (ver calcular_comentarios_por_conteudo)
+    def gerar_relatorio_comentarios_por_conteudo(self, inicio: datetime | None = None, fim: datetime | None = None,
+                                                       formato: str = "texto", destino=None):
+        resultado = self.calcular_comentarios_por_conteudo(inicio, fim)
+        exibir_relatorio_comentarios_por_conteudo(resultado, formato, destino)
+        return resultado
+    
+    """
+    Calcula os conteúdos mais engajados, selecionando os top_n pelo total de interações.
 
-        # Inverte a lista para ordem decrescente (do mais engajado para o menos)
-        engajamento_conteudos.reverse()
+    Retorna uma lista de (id_conteudo, nome_conteudo, total_interacoes), em ordem decrescente (empates por menor ID).
 
-        # Se top_n foi especificado, limita a lista aos primeiros N conteúdos
-        if top_n is not None:
-            engajamento_conteudos = engajamento_conteudos[:top_n]
+    - Melhor caso (Ω): O(n), quando os primeiros conteúdos percorridos já são os mais engajados.
+    - Caso médio (Θ): O(n log k), onde n é o número de conteúdos e k = top_n.
+    - Pior caso (O): O(n log k), ou O(n log n) se top_n for None (ordenação completa).
+
+    Justificativa: a seleção via heap de tamanho k não depende da escolha de pivô, então empates não degradam o desempenho.
+    Com 'inicio'/'fim', conta apenas as interações da janela [inicio, fim) (ver _agregar_periodo).
+    """
+    @relatorio_em_cache
+    def calcular_engajamento_conteudos(self, top_n: int = None, inicio: datetime | None = None,
+                                       fim: datetime | None = None) -> list[tuple[int, str, int]]:
+        if inicio is None and fim is None:
+            # Obtém todos os conteúdos armazenados na árvore binária (ordenados por ID)
+            conteudos = self._arvore_conteudos.percurso_in_order()
 
-        # Exibe o relatório formatado no console
-        print("\n--- Relatório: Conteúdos com Maior Engajamento ---")
-        for conteudo, total in engajamento_conteudos:
-            print(f"Conteúdo ID {conteudo.id_conteudo} - Nome: {conteudo.nome_conteudo} - Total de Interações: {total}")
+            # Calcula o total de interações (engajamento) para cada conteúdo
+            engajamento_conteudos = [(conteudo, conteudo.total_interacoes) for conteudo in conteudos]
+        else:
+            engajamento_conteudos = [
+                (conteudo, sum(contagem)) for conteudo, _, contagem, _ in self._agregar_periodo(inicio, fim)["conteudos"]
+            ]
+
+        # Seleciona os top_n conteúdos com base no número de interações (decrescente; empates por menor ID)
+        # Se top_n for None, todos os conteúdos são retornados já ordenados
+        engajamento_conteudos = self._selecionar_top_k(engajamento_conteudos, top_n, key=lambda x: x[1])
+
+        return [(conteudo.id_conteudo, conteudo.nome_conteudo, total) for conteudo, total in engajamento_conteudos]
+
+    # Exibe o relatório de engajamento dos conteúdos (ver calcular_engajamento_conteudos)
+    def gerar_relatorio_engajamento_conteudos(self, top_n: int = None, inicio: datetime | None = None,
+                                              fim: datetime | None = None, formato: str = "texto", destino=None):
+        resultado = self.calcular_engajamento_conteudos(top_n, inicio, fim)
+        exibir_relatorio_engajamento_conteudos(resultado, formato, destino)
+        return resultado
 
-def formatar_tempo(segundos: int) -> str:
     """
-    Formata o tempo em segundos para o formato HH:MM:SS.
-    - Calcula as horas, minutos e segundos a partir dos segundos.
+    Calcula o tempo de consumo de cada plataforma, hora a hora, dentro da janela [inicio, fim).
+
+    Retorna uma lista de (início da hora, nome_plataforma, tempo_total), ordenada por hora e pela ordem de registro da plataforma.
+
+    - Melhor caso (Ω): O(log n), janela vazia.
+    - Caso médio (Θ): O(log n + k + h log h), com k interações na janela e h pares (hora, plataforma) distintos.
+    - Pior caso (O): O(log n + k + h log h), idem.
+
+    Justificativa: a janela é localizada no índice temporal por busca binária; cada interação dela é somada
+    ao balde da sua hora (epoch truncado em múltiplos de 3600 s) em um dicionário.
     """
-    horas = segundos // 3600
-    minutos = (segundos % 3600) // 60
-    segundos_restantes = segundos % 60
+    @relatorio_em_cache
+    def calcular_tempo_por_plataforma_por_hora(self, inicio: datetime | None = None,
+                                               fim: datetime | None = None) -> list[tuple[datetime, str, int]]:
+        tempo_por_hora: dict[tuple[int, int], int] = defaultdict(int)
+        for epoch, _, _, plataforma, _, duracao, _ in self._registros_no_periodo(inicio, fim):
+            tempo_por_hora[(epoch - epoch % 3600, plataforma.id_plataforma)] += duracao
+
+        return [
+            (epoch_para_datetime(hora), self._plataformas_por_id[id_plataforma].nome_plataforma, tempo_por_hora[(hora, id_plataforma)])
+            for hora, id_plataforma in sorted(tempo_por_hora)
+        ]
+
+    # Exibe o tempo de consumo por plataforma por hora (ver calcular_tempo_por_plataforma_por_hora)
+    def gerar_relatorio_tempo_por_plataforma_por_hora(self, inicio: datetime | None = None, fim: datetime | None = None,
+                                                            formato: str = "texto", destino=None):
+        resultado = self.calcular_tempo_por_plataforma_por_hora(inicio, fim)
+        exibir_relatorio_tempo_por_plataforma_por_hora(resultado, formato, destino)
+        return resultado
+
+    # Complexidade: O(p), com p plataformas (ou O(log n + k) com janela, ver _agregar_periodo).
+    # Retorna (nome_plataforma, total_interacoes, tempo_total, engajamentos) de cada plataforma, na ordem de registro.
+    # São os agregados brutos (somáveis), usados para combinar resultados de vários sistemas.
+    @relatorio_em_cache
+    def calcular_agregados_plataformas(self, inicio: datetime | None = None,
+                                       fim: datetime | None = None) -> list[tuple[str, int, int, int]]:
+        if inicio is None and fim is None:
+            return [
+                (p.nome_plataforma, p.total_interacoes, p.tempo_total_consumo, p.total_engajamentos)
+                for p in self._plataformas_registradas.values()
+            ]
+        return [
+            (p.nome_plataforma, total, tempo, sum(contagem[tipo] for tipo in TIPOS_ENGAJAMENTO))
+            for p, total, tempo, contagem in self._agregar_periodo(inicio, fim)["plataformas"]
+        ]
+
+    # Complexidade: O(n), com n conteúdos (ou os conteúdos ativos na janela).
+    # Retorna (tipo_conteudo, menor id_conteudo do tipo, total_interacoes) de cada tipo, na ordem em que
+    # os tipos aparecem percorrendo os conteúdos por ID; o menor ID permite refazer essa ordem ao combinar sistemas.
+    @relatorio_em_cache
+    def calcular_agregados_tipos_conteudo(self, inicio: datetime | None = None,
+                                          fim: datetime | None = None) -> list[tuple[str, int, int]]:
+        if inicio is None and fim is None:
+            conteudos = [(c, c.total_interacoes) for c in self._arvore_conteudos.percurso_in_order()]
+        else:
+            conteudos = [(c, sum(contagem)) for c, _, contagem, _ in self._agregar_periodo(inicio, fim)["conteudos"]]
+
+        agregados: dict[str, list] = {}
+        for conteudo, total_interacoes in conteudos:
+            tipo = type(conteudo).__name__
+            if tipo not in agregados:
+                agregados[tipo] = [conteudo.id_conteudo, 0]
+            agregados[tipo][1] += total_interacoes
+        return [(tipo, primeiro_id, total) for tipo, (primeiro_id, total) in agregados.items()]
+
+# -------- Exibição dos relatórios --------
+# Recebem as tuplas devolvidas pelos métodos calcular_* (de um SistemaAnaliseEngajamento ou de um
+# SistemaAnaliseParticionado) e as escrevem de uma só vez no console, ou em 'destino', no formato escolhido
+# ("texto", "csv" ou "json"; ver analise.renderizacao).
+
+def exibir_relatorio_atividade_usuarios(usuarios_consumo: list[tuple[int, int]], formato: str = "texto",
+                                        destino=None) -> None:
+    renderizar("atividade_usuarios", usuarios_consumo, formato, destino)
+
+
+def exibir_relatorio_analitico(secoes: dict, formato: str = "texto", destino=None) -> None:
+    renderizar("secoes_analiticas", secoes, formato, destino)
+
+
+def exibir_conteudos_mais_engajados(engajamento: list[tuple], formato: str = "texto", destino=None) -> None:
+    renderizar("conteudos_mais_engajados", engajamento, formato, destino)
+
+
+def exibir_relatorio_comentarios_por_conteudo(conteudos: list[tuple[int, str, list[str]]], formato: str = "texto",
+                                              destino=None) -> None:
+    renderizar("comentarios_por_conteudo", conteudos, formato, destino)
+
+
+def exibir_relatorio_engajamento_conteudos(engajamento_conteudos: list[tuple[int, str, int]], formato: str = "texto",
+                                           destino=None) -> None:
+    renderizar("engajamento_conteudos", engajamento_conteudos, formato, destino)
+
+
+def exibir_relatorio_tempo_por_plataforma_por_hora(tempos: list[tuple[datetime, str, int]], formato: str = "texto",
+                                                   destino=None) -> None:
+    renderizar("tempo_por_plataforma_por_hora", tempos, formato, destino)
+
+
+"""
+Valida e converte uma linha bruta do CSV (dicionário do csv.DictReader) nos tipos usados pelo sistema.
+
+Retorna a tupla (id_conteudo, nome_conteudo, id_usuario, timestamp_epoch, nome_plataforma,
+tipo_interacao, watch_duration_seconds, comment_text), com o timestamp em segundos desde 1970 (UTC)
+e tipo_interacao como TipoInteracao. Lança ValueError/TypeError se a linha for inválida, inclusive com IDs,
+duração ou timestamp fora das faixas que as colunas int64 e o datetime representam.
+
+O timestamp pode ser o texto do CSV, um datetime ou um epoch já convertido (ver timestamp_para_epoch);
+nenhum datetime é guardado.
+
+- Complexidade: O(1), número fixo de conversões por linha.
+"""
+def converter_linha_csv(linha: dict) -> tuple:
+    id_conteudo = int(linha.get("id_conteudo"))
+    id_usuario = int(linha.get("id_usuario"))
+
+    timestamp_interacao = linha.get("timestamp_interacao")
+    if timestamp_interacao is None or timestamp_interacao == "":
+        raise ValueError("Campo 'timestamp_interacao' ausente.")
+    timestamp_epoch = timestamp_para_epoch(timestamp_interacao)
+
+    tipo_interacao = TipoInteracao.de_texto(linha.get("tipo_interacao"))
+    watch_duration_seconds = max(0, int(linha.get("watch_duration_seconds") or 0))
+
+    # Uma única comparação encadeada por campo; o campo inválido só é identificado no caminho de erro
+    if not (MENOR_INTEIRO_64 <= id_conteudo <= MAIOR_INTEIRO_64 and MENOR_INTEIRO_64 <= id_usuario <= MAIOR_INTEIRO_64
+            and MENOR_EPOCH <= timestamp_epoch <= MAIOR_EPOCH and watch_duration_seconds <= MAIOR_INTEIRO_64):
+        _rejeitar_fora_da_faixa(id_conteudo, id_usuario, timestamp_epoch, watch_duration_seconds)
+
+    return (
+        id_conteudo,
+        linha.get("nome_conteudo"),
+        id_usuario,
+        timestamp_epoch,
+        # A coluna do CSV se chama 'plataforma'; 'nome_plataforma' é aceito por compatibilidade
+        linha.get("plataforma", linha.get("nome_plataforma")),
+        tipo_interacao,
+        watch_duration_seconds,
+        (linha.get("comment_text") or "").strip(),
+    )
+
+
+def _rejeitar_fora_da_faixa(id_conteudo: int, id_usuario: int, timestamp_epoch: int, watch_duration_seconds: int):
+    for campo, valor, minimo, maximo in (("id_conteudo", id_conteudo, MENOR_INTEIRO_64, MAIOR_INTEIRO_64),
+                                         ("id_usuario", id_usuario, MENOR_INTEIRO_64, MAIOR_INTEIRO_64),
+                                         ("timestamp_interacao", timestamp_epoch, MENOR_EPOCH, MAIOR_EPOCH),
+                                         ("watch_duration_seconds", watch_duration_seconds, 0, MAIOR_INTEIRO_64)):
+        if not minimo <= valor <= maximo:
+            raise ValueError(f"Campo '{campo}' fora da faixa permitida: {valor}.")
+
 
-    return f"{horas:02}:{minutos:02}:{segundos_restantes:02}"
\ No newline at end of file
+# Converte um limite de janela (datetime ou None) para epoch
+def _epoch_ou_none(momento: datetime | None) -> int | None:
+    return None if momento is None else datetime_para_epoch(momento)
@@ -0,0 +1,519 @@
+"""
+Sistema de análise particionado entre processos (shards).
+
+O SistemaAnaliseParticionado distribui conteúdos e usuários, pelo hash do ID, entre N processos trabalhadores
+de longa duração; cada processo mantém suas próprias árvores em um SistemaAnaliseEngajamento local.
+O processo coordenador lê o CSV, roteia cada linha para os shards donos e combina os resultados parciais
+de cada relatório (seleção dos top-N a partir dos top-N de cada shard, somas e contagens por chave).
+
+Cada processo guarda duas partições, em dois sistemas locais:
+    - papel "conteudo": as linhas cujo hash(id_conteudo) % N cai neste shard;
+    - papel "usuario":  as linhas cujo hash(id_usuario) % N cai neste shard.
+Assim, toda linha é aplicada exatamente duas vezes (uma em cada papel) e cada conteúdo e cada usuário
+tem um único dono, com todas as suas interações. Os relatórios de conteúdos e de plataformas consultam
+o papel "conteudo" (que, somado, contém cada linha uma vez) e os de usuários consultam o papel "usuario";
+por isso as combinações são exatas e a saída é idêntica à de um SistemaAnaliseEngajamento único.
+
+As mensagens de linhas inválidas são devolvidas ao coordenador, que as imprime na ordem do arquivo.
+"""
+import csv
+import os
+from collections import defaultdict
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+from multiprocessing import Pipe, Process
+
+from estruturas_dados.selecao_top_k import selecionar_top_k
+from analise.sistema import (
+    SistemaAnaliseEngajamento,
+    TAMANHO_LOTE_PADRAO,
+    converter_linha_csv,
+    exibir_conteudos_mais_engajados,
+    exibir_relatorio_analitico,
+    exibir_relatorio_atividade_usuarios,
+    exibir_relatorio_comentarios_por_conteudo,
+    exibir_relatorio_engajamento_conteudos,
+    exibir_relatorio_tempo_por_plataforma_por_hora,
+)
+
+PAPEIS = ("conteudo", "usuario")
+
+
+class SistemaAnaliseParticionado:
+    """
+    Args:
+        num_particoes (int, opcional): número de processos trabalhadores (padrão: os.cpu_count()).
+        **opcoes_sistema: repassadas ao SistemaAnaliseEngajamento de cada shard
+            (por exemplo armazenamento_colunar=True ou rollups=True).
+
+    Os processos ficam ativos até `encerrar()`; o sistema também pode ser usado com `with`.
+    """
+    def __init__(self, num_particoes: int | None = None, **opcoes_sistema):
+        num_particoes = num_particoes or os.cpu_count() or 1
+        if num_particoes < 1:
+            raise ValueError("O número de partições deve ser um inteiro positivo.")
+
+        self._num_particoes = num_particoes
+        self._rollups = bool(opcoes_sistema.get("rollups"))
+        self._conexoes = []
+        self._processos = []
+        for _ in range(num_particoes):
+            conexao, conexao_trabalhador = Pipe()
+            processo = Process(target=_executar_particao, args=(conexao_trabalhador, opcoes_sistema), daemon=True)
+            processo.start()
+            conexao_trabalhador.close()
+            self._conexoes.append(conexao)
+            self._processos.append(processo)
+
+        # Número da próxima linha de dados (contado entre todos os arquivos ingeridos), usado para ordenar
+        # as mensagens de erro e para reconstruir a ordem global de registro das plataformas
+        self._proxima_linha = 0
+
+    @property
+    def num_particoes(self) -> int:
+        return self._num_particoes
+
+    def encerrar(self) -> None:
+        for conexao in self._conexoes:
+            try:
+                conexao.send(("encerrar",))
+            except (BrokenPipeError, OSError):
+                pass
+            conexao.close()
+        for processo in self._processos:
+            processo.join()
+        self._conexoes = []
+        self._processos = []
+
+    def __enter__(self) -> "SistemaAnaliseParticionado":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.encerrar()
+
+    # -------- Ingestão --------
+
+    """
+    Lê o CSV em lotes e envia a cada shard as linhas que lhe pertencem, em cada um dos dois papéis.
+
+    - Melhor caso (Ω): O(n / p), com n linhas e p shards, se a aplicação nas árvores dominar o custo.
+    - Caso médio (Θ): O(n·c + 2n / p), onde c é o custo (serial) de ler e rotear cada linha no coordenador.
+    - Pior caso (O): O(2n), com um único shard (cada linha é aplicada nos dois papéis).
+
+    Justificativa: enquanto os shards aplicam o lote atual, o coordenador já lê e roteia o próximo;
+    a memória extra é O(tamanho_lote) no coordenador.
+    """
+    def processar_interacoes_csv(self, caminho_arquivo: str, tamanho_lote: int = TAMANHO_LOTE_PADRAO) -> None:
+        if tamanho_lote < 1:
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo.")
+
+        # Erros de roteamento do lote em processamento nos shards (None quando nenhum lote está pendente);
+        # só são exibidos junto com os erros devolvidos pelos shards, para manter a ordem do arquivo
+        erros_pendentes = None
+        try:
+            with open(caminho_arquivo, mode="r", encoding="utf-8", newline="") as arquivo_csv:
+                leitor_csv = csv.reader(arquivo_csv)
+                cabecalho = next(leitor_csv, None)
+                if cabecalho is None:
+                    return None
+
+                while True:
+                    lotes, erros = self._rotear_lote(cabecalho, islice(leitor_csv, tamanho_lote))
+                    if erros_pendentes is not None:
+                        self._exibir_erros(self._receber_erros_aplicacao(erros_pendentes))
+                        erros_pendentes = None
+                    if lotes is None:
+                        self._exibir_erros(erros)
+                        break
+
+                    for conexao, lotes_particao in zip(self._conexoes, lotes):
+                        conexao.send(("aplicar", cabecalho, lotes_particao))
+                    erros_pendentes = erros
+
+            if self._rollups:
+                self._sincronizar_rollups()
+        except FileNotFoundError:
+            print(f"Erro: Arquivo '{caminho_arquivo}' não encontrado.")
+            return None
+        except Exception as e:
+            print(f"Erro ao ler o arquivo CSV '{caminho_arquivo}': {e}")
+            return None
+        finally:
+            # Mantém os canais sincronizados mesmo se a leitura falhar no meio
+            if erros_pendentes is not None:
+                self._exibir_erros(self._receber_erros_aplicacao(erros_pendentes))
+
+    # Separa as linhas do lote por shard e papel: [[linhas do papel "conteudo", linhas do papel "usuario"], ...].
+    # Retorna (None, erros) quando o leitor não tem mais linhas.
+    def _rotear_lote(self, cabecalho: list[str], linhas) -> tuple[list | None, list]:
+        posicao_conteudo = cabecalho.index("id_conteudo") if "id_conteudo" in cabecalho else None
+        posicao_usuario = cabecalho.index("id_usuario") if "id_usuario" in cabecalho else None
+
+        lotes = [([], []) for _ in range(self._num_particoes)]
+        erros = []
+        vazio = True
+        for valores in linhas:
+            vazio = False
+            # Linhas em branco são ignoradas, como no csv.DictReader
+            if not valores:
+                continue
+            numero_linha = self._proxima_linha
+            self._proxima_linha += 1
+
+            try:
+                id_conteudo = int(valores[posicao_conteudo])
+                id_usuario = int(valores[posicao_usuario])
+            except (TypeError, ValueError, IndexError):
+                # A mensagem vem da própria conversão, para ser a mesma do SistemaAnaliseEngajamento
+                try:
+                    converter_linha_csv(_linha_como_dicionario(cabecalho, valores))
+                except Exception as e:
+                    erros.append((numero_linha, f"Erro ao criar interação: {e}"))
+                continue
+
+            lotes[hash(id_conteudo) % self._num_particoes][0].append((numero_linha, valores))
+            lotes[hash(id_usuario) % self._num_particoes][1].append((numero_linha, valores))
+
+        return (None if vazio else lotes), erros
+
+    def _receber_erros_aplicacao(self, erros: list) -> list:
+        for conexao in self._conexoes:
+            erros.extend(conexao.recv())
+        return erros
+
+    # Cada shard compacta seus rollups pela própria marca d'água (o maior timestamp que ele viu); após a ingestão,
+    # todos passam a usar a marca d'água global, para que as retenções de minuto/hora cubram o mesmo período
+    def _sincronizar_rollups(self) -> None:
+        for conexao in self._conexoes:
+            conexao.send(("marca_dagua", None))
+        marcas = [marca for marca in self._receber_resultados() if marca is not None]
+        if not marcas:
+            return
+
+        for conexao in self._conexoes:
+            conexao.send(("marca_dagua", max(marcas)))
+        self._receber_resultados()
+
+    # Uma mensagem por linha, na ordem do arquivo (a mesma linha pode falhar nos dois papéis)
+    @staticmethod
+    def _exibir_erros(erros: list) -> None:
+        ultima_linha = None
+        for numero_linha, mensagem in sorted(erros):
+            if numero_linha != ultima_linha:
+                print(mensagem)
+                ultima_linha = numero_linha
+
+    # -------- Comunicação com os shards --------
+
+    # Executa o mesmo método do SistemaAnaliseEngajamento em todos os shards, no papel indicado,
+    # e devolve a lista de resultados parciais (os shards trabalham em paralelo)
+    def _consultar(self, papel: str, metodo: str, *args, **kwargs) -> list:
+        for conexao in self._conexoes:
+            conexao.send(("calcular", papel, metodo, args, kwargs))
+        return self._receber_resultados()
+
+    def _consultar_particao(self, particao: int, papel: str, metodo: str, *args, **kwargs):
+        self._conexoes[particao].send(("calcular", papel, metodo, args, kwargs))
+        return _resultado_ou_erro(self._conexoes[particao].recv())
+
+    def _receber_resultados(self) -> list:
+        # Recebe de todos os shards antes de lançar um eventual erro, para não deixar respostas pendentes
+        respostas = [conexao.recv() for conexao in self._conexoes]
+        return [_resultado_ou_erro(resposta) for resposta in respostas]
+
+    # Agregados (total_interacoes, tempo_total, engajamentos) de cada plataforma somados entre os shards,
+    # na ordem global de registro (a ordem da primeira linha válida de cada plataforma)
+    def _agregados_plataformas(self, inicio: datetime | None, fim: datetime | None) -> list[tuple[str, int, int, int]]:
+        for conexao in self._conexoes:
+            conexao.send(("agregados_plataformas", inicio, fim))
+
+        primeira_linha: dict[str, int] = {}
+        somas: dict[str, list] = {}
+        for parciais, primeiras_linhas in self._receber_resultados():
+            for nome, linha in primeiras_linhas.items():
+                if nome not in primeira_linha or linha < primeira_linha[nome]:
+                    primeira_linha[nome] = linha
+            for nome, total, tempo, engajamentos in parciais:
+                soma = somas.setdefault(nome, [0, 0, 0])
+                soma[0] += total
+                soma[1] += tempo
+                soma[2] += engajamentos
+
+        return [(nome, *somas[nome]) for nome in sorted(somas, key=primeira_linha.__getitem__)]
+
+    # -------- Relatórios --------
+    # Mesmos nomes, parâmetros e resultados dos métodos de SistemaAnaliseEngajamento.
+
+    """
+    Combina os top_n usuários de cada shard (papel "usuario").
+
+    - Complexidade: O(n/p · log k) em cada shard, em paralelo, mais O(p·k log(p·k)) no coordenador.
+
+    Justificativa: cada usuário tem um único dono, então os k maiores globais estão entre os k maiores de algum shard;
+    os candidatos são ordenados por ID para que os empates sigam o mesmo critério (menor ID) do sistema único.
+    """
+    def calcular_atividade_usuarios(self, top_n: int = None, inicio: datetime | None = None,
+                                    fim: datetime | None = None) -> list[tuple[int, int]]:
+        parciais = self._consultar("usuario", "calcular_atividade_usuarios", top_n, inicio, fim)
+        return _combinar_top_k(parciais, top_n, chave_id=0, chave_valor=1)
+
+    def gerar_relatorio_atividade_usuarios(self, top_n: int = None, inicio: datetime | None = None,
+                                           fim: datetime | None = None, formato: str = "texto", destino=None):
+        resultado = self.calcular_atividade_usuarios(top_n, inicio, fim)
+        exibir_relatorio_atividade_usuarios(resultado, formato, destino)
+        return resultado
+
+    def calcular_engajamento_conteudos(self, top_n: int = None, inicio: datetime | None = None,
+                                       fim: datetime | None = None) -> list[tuple[int, str, int]]:
+        parciais = self._consultar("conteudo", "calcular_engajamento_conteudos", top_n, inicio, fim)
+        return _combinar_top_k(parciais, top_n, chave_id=0, chave_valor=2)
+
+    def gerar_relatorio_engajamento_conteudos(self, top_n: int = None, inicio: datetime | None = None,
+                                              fim: datetime | None = None, formato: str = "texto", destino=None):
+        resultado = self.calcular_engajamento_conteudos(top_n, inicio, fim)
+        exibir_relatorio_engajamento_conteudos(resultado, formato, destino)
+        return resultado
+
+    def calcular_conteudos_mais_engajados(self, inicio: datetime | None = None,
+                                          fim: datetime | None = None) -> list[tuple]:
+        parciais = self._consultar("conteudo", "calcular_conteudos_mais_engajados", inicio, fim)
+        return _combinar_top_k(parciais, 10, chave_id=0, chave_valor=2)
+
+    def relatorio_conteudos_mais_engajados(self, inicio: datetime | None = None, fim: datetime | None = None,
+                                                 formato: str = "texto", destino=None):
+        resultado = self.calcular_conteudos_mais_engajados(inicio, fim)
+        exibir_conteudos_mais_engajados(resultado, formato, destino)
+        return resultado
+
+    # Complexidade: O(n log p) - intercalação das listas de cada shard, já ordenadas por ID.
+    def calcular_comentarios_por_conteudo(self, inicio: datetime | None = None,
+                                          fim: datetime | None = None) -> list[tuple[int, str, list[str]]]:
+        parciais = self._consultar("conteudo", "calcular_comentarios_por_conteudo", inicio, fim)
+        return list(merge(*parciais, key=lambda x: x[0]))
+
+    def gerar_relatorio_comentarios_por_conteudo(self, inicio: datetime | None = None, fim: datetime | None = None,
+                                                       formato: str = "texto", destino=None):
+        resultado = self.calcular_comentarios_por_conteudo(inicio, fim)
+        exibir_relatorio_comentarios_por_conteudo(resultado, formato, destino)
+        return resultado
+
+    # Complexidade: O(h·q) - soma por (hora, plataforma) das h·q entradas devolvidas pelos shards.
+    def calcular_tempo_por_plataforma_por_hora(self, inicio: datetime | None = None,
+                                               fim: datetime | None = None) -> list[tuple[datetime, str, int]]:
+        parciais = self._consultar("conteudo", "calcular_tempo_por_plataforma_por_hora", inicio, fim)
+        ordem = {nome: posicao for posicao, (nome, *_) in enumerate(self._agregados_plataformas(None, None))}
+
+        tempo_por_hora: dict[tuple[datetime, str], int] = defaultdict(int)
+        for parcial in parciais:
+            for hora, nome, tempo in parcial:
+                tempo_por_hora[(hora, nome)] += tempo
+
+        return [
+            (hora, nome, tempo_por_hora[(hora, nome)])
+            for hora, nome in sorted(tempo_por_hora, key=lambda x: (x[0], ordem[x[1]]))
+        ]
+
+    def gerar_relatorio_tempo_por_plataforma_por_hora(self, inicio: datetime | None = None, fim: datetime | None = None,
+                                                            formato: str = "texto", destino=None):
+        resultado = self.calcular_tempo_por_plataforma_por_hora(inicio, fim)
+        exibir_relatorio_tempo_por_plataforma_por_hora(resultado, formato, destino)
+        return resultado
+
+    def calcular_agregados_plataformas(self, inicio: datetime | None = None,
+                                       fim: datetime | None = None) -> list[tuple[str, int, int, int]]:
+        return self._agregados_plataformas(inicio, fim)
+
+    """
+    Combina as sete seções do relatório analítico calculadas em cada shard (com o motor escolhido).
+
+    - Rankings (conteúdos, usuários, comentados): top 10 a partir dos top 10 de cada shard.
+    - Plataformas (engajamento e tempo médio): somas dos agregados brutos; a média é recalculada sobre as somas.
+    - Interações por tipo de conteúdo: somas por tipo, na ordem do menor ID de cada tipo.
+    - Comentários por conteúdo: intercalação por ID.
+
+    - Complexidade: O(n/p) em cada shard, em paralelo, mais O(n log p) no coordenador para intercalar a seção 7 (todos os conteúdos).
+    """
+    def calcular_secoes_analiticas(self, motor: str = "python", inicio: datetime | None = None,
+                                   fim: datetime | None = None) -> dict:
+        secoes_conteudos = self._consultar("conteudo", "calcular_secoes_analiticas", motor, inicio, fim)
+        secoes_usuarios = self._consultar("usuario", "calcular_secoes_analiticas", motor, inicio, fim)
+        tipos = self._consultar("conteudo", "calcular_agregados_tipos_conteudo", inicio, fim)
+        plataformas = self._agregados_plataformas(inicio, fim)
+
+        interacoes_por_tipo: dict[str, list] = {}
+        for parcial in tipos:
+            for tipo, primeiro_id, total in parcial:
+                agregado = interacoes_por_tipo.setdefault(tipo, [primeiro_id, 0])
+                agregado[0] = min(agregado[0], primeiro_id)
+                agregado[1] += total
+        ranking_interacoes = [
+            (tipo, total) for tipo, (_, total) in sorted(interacoes_por_tipo.items(), key=lambda x: x[1][0])
+        ]
+
+        return {
+            "conteudos_mais_consumidos": _combinar_top_k(
+                [s["conteudos_mais_consumidos"] for s in secoes_conteudos], 10, chave_id=0, chave_valor=2
+            ),
+            "usuarios_mais_ativos": _combinar_top_k(
+                [s["usuarios_mais_ativos"] for s in secoes_usuarios], 10, chave_id=0, chave_valor=1
+            ),
+            "engajamento_plataformas": selecionar_top_k(
+                [(nome, engajamentos) for nome, _, _, engajamentos in plataformas if engajamentos > 0],
+                10,
+                key=lambda x: x[1],
+            ),
+            "conteudos_mais_comentados": _combinar_top_k(
+                [s["conteudos_mais_comentados"] for s in secoes_conteudos], 10, chave_id=0, chave_valor=2
+            ),
+            "interacoes_por_tipo_conteudo": selecionar_top_k(ranking_interacoes, key=lambda x: x[1]),
+            "media_por_plataforma": [
+                (nome, tempo // total if total > 0 else 0) for nome, total, tempo, _ in plataformas
+            ],
+            "comentarios_por_conteudo": list(
+                merge(*(s["comentarios_por_conteudo"] for s in secoes_conteudos), key=lambda x: x[0])
+            ),
+        }
+
+    def gerar_relatorio_analitico(self, motor: str = "python", inicio: datetime | None = None,
+                                  fim: datetime | None = None, formato: str = "texto", destino=None):
+        resultado = self.calcular_secoes_analiticas(motor, inicio, fim)
+        exibir_relatorio_analitico(resultado, formato, destino)
+        return resultado
+
+    """
+    Série temporal dos rollups (requer rollups=True), como em SistemaAnaliseEngajamento.serie_temporal.
+
+    Conteúdos e usuários são consultados apenas no shard dono; plataformas são somadas entre os shards do papel
+    "conteudo". O id de uma plataforma é a sua posição na ordem global de registro (1, 2, ...), como no sistema único.
+    """
+    def serie_temporal(self, dimensao: str, id_entidade: int, granularidade: str = "hora",
+                       inicio: datetime | None = None, fim: datetime | None = None) -> list[tuple[datetime, dict, int]]:
+        if dimensao in PAPEIS:
+            particao = hash(id_entidade) % self._num_particoes
+            return self._consultar_particao(
+                particao, dimensao, "serie_temporal", dimensao, id_entidade, granularidade, inicio, fim
+            )
+        if dimensao != "plataforma":
+            # Dimensão inválida: deixa a validação (e a mensagem de erro) para o sistema local
+            return self._consultar_particao(0, "conteudo", "serie_temporal", dimensao, id_entidade, granularidade, inicio, fim)
+
+        plataformas = self._agregados_plataformas(None, None)
+        if not 1 <= id_entidade <= len(plataformas):
+            return []
+        nome = plataformas[id_entidade - 1][0]
+
+        for conexao in self._conexoes:
+            conexao.send(("serie_plataforma", nome, granularidade, inicio, fim))
+
+        somas: dict[datetime, list] = {}
+        for parcial in self._receber_resultados():
+            for balde, contagem, tempo in parcial:
+                if balde not in somas:
+                    somas[balde] = [dict(contagem), tempo]
+                else:
+                    for tipo, quantidade in contagem.items():
+                        somas[balde][0][tipo] += quantidade
+                    somas[balde][1] += tempo
+        return [(balde, contagem, tempo) for balde, (contagem, tempo) in sorted(somas.items())]
+
+
+# Combina os top-k de cada shard: candidatos ordenados por ID (critério de desempate do sistema único) e nova seleção
+def _combinar_top_k(parciais: list[list[tuple]], k: int | None, chave_id: int, chave_valor: int) -> list[tuple]:
+    candidatos = sorted((item for parcial in parciais for item in parcial), key=lambda x: x[chave_id])
+    return selecionar_top_k(candidatos, k, key=lambda x: x[chave_valor])
+
+
+def _resultado_ou_erro(resposta: tuple):
+    status, valor = resposta
+    if status == "erro":
+        raise valor
+    return valor
+
+
+# Monta o dicionário da linha como o csv.DictReader: campos faltantes viram None e os excedentes ficam na chave None
+def _linha_como_dicionario(cabecalho: list[str], valores: list[str]) -> dict:
+    linha = dict(zip(cabecalho, valores))
+    if len(valores) > len(cabecalho):
+        linha[None] = valores[len(cabecalho):]
+    elif len(valores) < len(cabecalho):
+        for campo in cabecalho[len(valores):]:
+            linha[campo] = None
+    return linha
+
+
+# Laço principal de cada processo trabalhador: um sistema local por papel e a primeira linha de cada plataforma
+# (entre as linhas aplicadas no papel "conteudo"), usada pelo coordenador para refazer a ordem global das plataformas.
+def _executar_particao(conexao, opcoes_sistema: dict) -> None:
+    sistemas = {papel: SistemaAnaliseEngajamento(**opcoes_sistema) for papel in PAPEIS}
+    primeira_linha_plataforma: dict[str, int] = {}
+
+    while True:
+        try:
+            comando, *argumentos = conexao.recv()
+        except EOFError:
+            break
+
+        if comando == "encerrar":
+            break
+
+        if comando == "aplicar":
+            cabecalho, (linhas_conteudo, linhas_usuario) = argumentos
+            erros = []
+            for numero_linha, valores in linhas_conteudo:
+                try:
+                    registro = converter_linha_csv(_linha_como_dicionario(cabecalho, valores))
+                except Exception as e:
+                    erros.append((numero_linha, f"Erro ao criar interação: {e}"))
+                    continue
+                try:
+                    sistemas["conteudo"]._aplicar_registro(registro)
+                except Exception as e:
+                    erros.append((numero_linha, f"Erro ao aplicar interação: {e}"))
+                    continue
+                primeira_linha_plataforma.setdefault(registro[4], numero_linha)
+
+            # As linhas inválidas já foram reportadas pelo shard dono do conteúdo; as que falham ao serem aplicadas
+            # são reportadas pelos dois papéis, e o coordenador exibe uma mensagem por linha
+            for numero_linha, valores in linhas_usuario:
+                try:
+                    registro = converter_linha_csv(_linha_como_dicionario(cabecalho, valores))
+                except Exception:
+                    continue
+                try:
+                    sistemas["usuario"]._aplicar_registro(registro)
+                except Exception as e:
+                    erros.append((numero_linha, f"Erro ao aplicar interação: {e}"))
+            conexao.send(erros)
+            continue
+
+        try:
+            if comando == "calcular":
+                papel, metodo, args, kwargs = argumentos
+                resultado = getattr(sistemas[papel], metodo)(*args, **kwargs)
+            elif comando == "agregados_plataformas":
+                resultado = (sistemas["conteudo"].calcular_agregados_plataformas(*argumentos), primeira_linha_plataforma)
+            elif comando == "marca_dagua":
+                # Sem argumento, informa a maior marca d'água local; com um epoch, avança as marcas até ele
+                (epoch,) = argumentos
+                cubos = [sistema.rollups for sistema in sistemas.values()]
+                if epoch is None:
+                    marcas = [cubo.marca_dagua for cubo in cubos if cubo.marca_dagua is not None]
+                    resultado = max(marcas) if marcas else None
+                else:
+                    for cubo in cubos:
+                        cubo.avancar_marca_dagua(epoch)
+                    resultado = None
+            elif comando == "serie_plataforma":
+                nome, granularidade, inicio, fim = argumentos
+                plataforma = sistemas["conteudo"]._plataformas_registradas.get(nome)
+                resultado = [] if plataforma is None else sistemas["conteudo"].serie_temporal(
+                    "plataforma", plataforma.id_plataforma, granularidade, inicio, fim
+                )
+            else:
+                raise ValueError(f"Comando '{comando}' desconhecido.")
+            conexao.send(("ok", resultado))
+        except Exception as e:
+            conexao.send(("erro", e))
+
+    conexao.close()
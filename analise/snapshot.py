@@ -0,0 +1,322 @@
+"""
+Snapshot binário do estado processado de um SistemaAnaliseEngajamento.
+
+Layout do arquivo (cabeçalho em little-endian; seções na ordem de bytes da máquina, registrada em 'ordem_bytes'):
+
+    [cabeçalho: 32 bytes]  MAGICO (8) | versão (u32) | reservado (u32) | offset dos metadados (u64) | tamanho (u64)
+    [seções binárias]      cada seção começa em um offset múltiplo de 8 bytes
+    [metadados JSON]       versão, checksum SHA-256 do CSV de origem, plataformas e o mapa nome -> (offset, bytes, formato)
+
+As seções guardam as colunas de interações, as tabelas de strings (comentários e nomes de conteúdos),
+os agregados de usuários e conteúdos e, para cada entidade, a lista das suas linhas (formato CSR: um array
+de offsets e um array de índices agrupados por entidade).
+
+Ao carregar, o arquivo é mapeado em memória (mmap) e as colunas viram memoryviews sobre o próprio arquivo:
+nenhuma interação é relida ou convertida, então os relatórios ficam disponíveis sem reprocessar o CSV.
+"""
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from entidades.conteudo import Conteudo
+from entidades.plataforma import Plataforma
+from entidades.usuario import Usuario
+from estruturas_dados.armazenamento_colunar import (
+    ArmazenamentoColunar,
+    VisaoInteracoes,
+    COLUNAS,
+    TIPOS_INTERACAO,
+)
+
+MAGICO = b"GLBSNAP\x00"
+VERSAO_FORMATO = 1
+_CABECALHO = struct.Struct("<8sIIQQ")
+_ALINHAMENTO = 8
+
+
+class SnapshotInvalidoError(ValueError):
+    """O arquivo não é um snapshot válido, é de outra versão ou não corresponde ao CSV de origem."""
+
+
+# Complexidade: O(t) - lê o arquivo em blocos de 1 MiB, onde t é o tamanho do arquivo.
+def calcular_checksum_arquivo(caminho_arquivo: str) -> str:
+    resumo = hashlib.sha256()
+    with open(caminho_arquivo, mode="rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(1024 * 1024), b""):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+"""
+Grava o estado do sistema em 'caminho'.
+
+- Melhor caso (Ω): O(n + m), sistema em modo colunar: as colunas são gravadas diretamente.
+- Caso médio (Θ): O(n + m), onde n é o número de interações e m o de entidades.
+- Pior caso (O): O(n + m), sistema em modo objeto: as interações são convertidas em colunas antes.
+
+Justificativa: cada interação e cada entidade é escrita uma única vez, em blocos binários contíguos.
+"""
+def salvar_snapshot(sistema, caminho: str, caminho_arquivo_origem: str | None = None,
+                    metadados_extras: dict | None = None) -> None:
+    conteudos = sistema.percurso_in_order()
+    usuarios = sistema.percurso_em_ordem()
+    plataformas = sorted(sistema._plataformas_registradas.values(), key=lambda p: p.id_plataforma)
+
+    armazenamento, linhas_por_conteudo, linhas_por_usuario = _colunas_do_sistema(sistema, conteudos, usuarios)
+
+    secoes: dict[str, object] = {nome: getattr(armazenamento, nome) for nome in COLUNAS}
+
+    secoes["comentarios_offsets"], secoes["comentarios_dados"] = _tabela_strings(armazenamento.comentarios)
+
+    secoes["conteudos_ids"] = array("q", (c.id_conteudo for c in conteudos))
+    secoes["conteudos_nomes_offsets"], secoes["conteudos_nomes_dados"] = _tabela_strings(
+        c.nome_conteudo or "" for c in conteudos
+    )
+    secoes["conteudos_agregados"] = _agregados(conteudos)
+    secoes["conteudos_linhas_offsets"], secoes["conteudos_linhas"] = _csr(linhas_por_conteudo)
+
+    secoes["usuarios_ids"] = array("q", (u.id_usuario for u in usuarios))
+    secoes["usuarios_agregados"] = _agregados(usuarios)
+    secoes["usuarios_linhas_offsets"], secoes["usuarios_linhas"] = _csr(linhas_por_usuario)
+
+    metadados = {
+        "versao_formato": VERSAO_FORMATO,
+        "ordem_bytes": sys.byteorder,
+        "checksum_origem": calcular_checksum_arquivo(caminho_arquivo_origem) if caminho_arquivo_origem else None,
+        "caminho_origem": caminho_arquivo_origem,
+        "tipos_interacao": list(TIPOS_INTERACAO),
+        "plataformas": [
+            {
+                "id": p.id_plataforma,
+                "nome": p.nome_plataforma,
+                "total_interacoes": p.total_interacoes,
+                "tempo_total_consumo": p.tempo_total_consumo,
+                "total_visualizacoes_validas": p.total_visualizacoes_validas,
+                "contagem_por_tipo": p.contagem_por_tipo,
+            }
+            for p in plataformas
+        ],
+        "extras": metadados_extras or {},
+        "secoes": {},
+    }
+
+    # Grava em um temporário no mesmo diretório e o move sobre 'caminho' só no fim: o snapshot anterior continua
+    # íntegro se a escrita falhar e, se estiver mapeado em memória (recarregado de 'caminho'), não é truncado
+    caminho_temporario = f"{caminho}.{os.getpid()}.parcial"
+    try:
+        with open(caminho_temporario, mode="wb") as arquivo:
+            arquivo.write(b"\x00" * _CABECALHO.size)
+
+            for nome, dados in secoes.items():
+                _alinhar(arquivo)
+                visao = memoryview(dados)
+                metadados["secoes"][nome] = [arquivo.tell(), visao.nbytes, visao.format]
+                arquivo.write(visao)
+
+            _alinhar(arquivo)
+            offset_metadados = arquivo.tell()
+            bytes_metadados = json.dumps(metadados, ensure_ascii=False).encode("utf-8")
+            arquivo.write(bytes_metadados)
+
+            arquivo.seek(0)
+            arquivo.write(_CABECALHO.pack(MAGICO, VERSAO_FORMATO, 0, offset_metadados, len(bytes_metadados)))
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(caminho_temporario, caminho)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(caminho_temporario)
+        raise
+
+
+"""
+Lê um snapshot e devolve um SistemaAnaliseEngajamento em modo colunar, com as colunas mapeadas em memória.
+
+Args:
+    caminho_arquivo_origem (str, opcional): se informado, o checksum do CSV é comparado com o registrado
+        no snapshot, e SnapshotInvalidoError é lançada se o arquivo de origem tiver mudado.
+
+- Melhor caso (Ω): O(m), onde m é o número de entidades (usuários, conteúdos e plataformas).
+- Caso médio (Θ): O(m), as interações não são percorridas; cada entidade recebe uma fatia do arquivo.
+- Pior caso (O): O(m + t), se o checksum do CSV de origem (t bytes) precisar ser verificado.
+
+Justificativa: as colunas de interações são memoryviews sobre o mmap (sem cópia); só as entidades
+precisam ser recriadas para popular as árvores.
+"""
+def carregar_snapshot(caminho: str, caminho_arquivo_origem: str | None = None):
+    # Importação tardia: analise.sistema importa este módulo sob demanda
+    from analise.sistema import SistemaAnaliseEngajamento
+
+    with open(caminho, mode="rb") as arquivo:
+        if os.fstat(arquivo.fileno()).st_size < _CABECALHO.size:
+            raise SnapshotInvalidoError(f"'{caminho}' não é um snapshot válido.")
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magico, versao, _, offset_metadados, tamanho_metadados = _CABECALHO.unpack_from(mapa, 0)
+    if magico != MAGICO:
+        raise SnapshotInvalidoError(f"'{caminho}' não é um snapshot válido.")
+    if versao != VERSAO_FORMATO:
+        raise SnapshotInvalidoError(
+            f"Versão de snapshot {versao} não suportada (esperada: {VERSAO_FORMATO})."
+        )
+
+    metadados = json.loads(bytes(mapa[offset_metadados:offset_metadados + tamanho_metadados]).decode("utf-8"))
+    if metadados["ordem_bytes"] != sys.byteorder:
+        raise SnapshotInvalidoError("O snapshot foi gerado em uma máquina com ordem de bytes diferente.")
+    if metadados["tipos_interacao"] != list(TIPOS_INTERACAO):
+        raise SnapshotInvalidoError("O snapshot usa uma codificação de tipos de interação diferente.")
+
+    if caminho_arquivo_origem is not None:
+        checksum = calcular_checksum_arquivo(caminho_arquivo_origem)
+        if checksum != metadados["checksum_origem"]:
+            raise SnapshotInvalidoError(
+                f"O snapshot '{caminho}' não corresponde ao conteúdo atual de '{caminho_arquivo_origem}'."
+            )
+
+    sistema = SistemaAnaliseEngajamento(armazenamento_colunar=True)
+    buffer = memoryview(mapa)
+
+    def secao(nome: str) -> memoryview:
+        offset, tamanho, formato = metadados["secoes"][nome]
+        return buffer[offset:offset + tamanho].cast(formato)
+
+    def tabela_strings(prefixo: str) -> list[str]:
+        offsets = secao(f"{prefixo}_offsets")
+        dados = secao(f"{prefixo}_dados")
+        return [str(dados[offsets[i]:offsets[i + 1]], "utf-8") for i in range(len(offsets) - 1)]
+
+    armazenamento = ArmazenamentoColunar.de_colunas(
+        {nome: secao(nome) for nome in COLUNAS}, tabela_strings("comentarios")
+    )
+    sistema._armazenamento = armazenamento
+    materializar = sistema._materializar_interacao
+
+    # Plataformas
+    for dados in metadados["plataformas"]:
+        plataforma = Plataforma(dados["id"], dados["nome"])
+        plataforma.restaurar_agregados(
+            dados["total_interacoes"],
+            dados["tempo_total_consumo"],
+            dados["total_visualizacoes_validas"],
+            dados["contagem_por_tipo"],
+        )
+        sistema._plataformas_registradas[plataforma.nome_plataforma] = plataforma
+        sistema._plataformas_por_id[plataforma.id_plataforma] = plataforma
+
+    # Conteúdos
+    nomes = tabela_strings("conteudos_nomes")
+    agregados = secao("conteudos_agregados")
+    offsets = secao("conteudos_linhas_offsets")
+    linhas = secao("conteudos_linhas")
+    for posicao, id_conteudo in enumerate(secao("conteudos_ids")):
+        conteudo = Conteudo(id_conteudo, nomes[posicao])
+        visao = VisaoInteracoes(armazenamento, materializar)
+        visao.usar_indices(linhas[offsets[posicao]:offsets[posicao + 1]])
+        conteudo.usar_visao_colunar(visao)
+        conteudo.restaurar_agregados(*_ler_agregados(agregados, posicao))
+        sistema.inserir_conteudo(conteudo)
+
+    # Usuários
+    agregados = secao("usuarios_agregados")
+    offsets = secao("usuarios_linhas_offsets")
+    linhas = secao("usuarios_linhas")
+    for posicao, id_usuario in enumerate(secao("usuarios_ids")):
+        usuario = Usuario(id_usuario)
+        visao = VisaoInteracoes(armazenamento, materializar)
+        visao.usar_indices(linhas[offsets[posicao]:offsets[posicao + 1]])
+        usuario.usar_visao_colunar(visao)
+        usuario.restaurar_agregados(*_ler_agregados(agregados, posicao))
+        sistema.inserir_usuario(usuario)
+
+    sistema._mapa_snapshot = mapa
+    sistema._metadados_snapshot = metadados
+    return sistema
+
+
+# Devolve um ArmazenamentoColunar com todas as interações e, para cada conteúdo/usuário (na ordem recebida),
+# a sequência de índices das suas linhas. Em modo colunar, reaproveita as colunas e as visões existentes.
+def _colunas_do_sistema(sistema, conteudos: list, usuarios: list):
+    if sistema.armazenamento_colunar is not None:
+        return (
+            sistema.armazenamento_colunar,
+            [c.interacoes.indices for c in conteudos],
+            [u.interacoes_realizadas.indices for u in usuarios],
+        )
+
+    armazenamento = ArmazenamentoColunar()
+    linha_da_interacao: dict[int, int] = {}
+    linhas_por_conteudo = []
+    for conteudo in conteudos:
+        linhas = array("q")
+        for interacao in conteudo.interacoes:
+            indice = armazenamento.adicionar(
+                conteudo.id_conteudo,
+                interacao.id_usuario,
+                interacao.timestamp_epoch,
+                interacao.plataforma_interacao.id_plataforma,
+                interacao.codigo_tipo,
+                interacao.watch_duration_seconds,
+                interacao.comment_text,
+            )
+            linha_da_interacao[id(interacao)] = indice
+            linhas.append(indice)
+        linhas_por_conteudo.append(linhas)
+
+    # Interações de conteúdos removidos da árvore não entram no snapshot
+    linhas_por_usuario = [
+        array("q", (linha_da_interacao[id(i)] for i in u.interacoes_realizadas if id(i) in linha_da_interacao))
+        for u in usuarios
+    ]
+    return armazenamento, linhas_por_conteudo, linhas_por_usuario
+
+
+# Concatena as listas de linhas de cada entidade (formato CSR): offsets[i]:offsets[i + 1] são as linhas da entidade i
+def _csr(listas_de_linhas: list):
+    offsets = array("q", [0])
+    linhas = array("q")
+    for lista in listas_de_linhas:
+        linhas.extend(lista)
+        offsets.append(len(linhas))
+    return offsets, linhas
+
+
+# Tabela de strings: os textos UTF-8 concatenados e os offsets de início/fim de cada um
+def _tabela_strings(textos) -> tuple[array, bytes]:
+    offsets = array("q", [0])
+    partes = []
+    total = 0
+    for texto in textos:
+        codificado = texto.encode("utf-8")
+        partes.append(codificado)
+        total += len(codificado)
+        offsets.append(total)
+    return offsets, b"".join(partes)
+
+
+# Agregados de cada entidade, em blocos fixos: tempo total, visualizações válidas e a contagem de cada tipo
+def _agregados(entidades: list) -> array:
+    dados = array("q")
+    for entidade in entidades:
+        contagem = entidade.contagem_por_tipo
+        dados.append(entidade.tempo_total_consumo)
+        dados.append(entidade.total_visualizacoes_validas)
+        dados.extend(contagem.get(tipo, 0) for tipo in TIPOS_INTERACAO)
+    return dados
+
+
+def _ler_agregados(dados: memoryview, posicao: int) -> tuple:
+    largura = 2 + len(TIPOS_INTERACAO)
+    bloco = dados[posicao * largura:(posicao + 1) * largura]
+    contagem = {tipo: bloco[2 + i] for i, tipo in enumerate(TIPOS_INTERACAO) if bloco[2 + i]}
+    return bloco[0], bloco[1], contagem
+
+
+def _alinhar(arquivo) -> None:
+    resto = arquivo.tell() % _ALINHAMENTO
+    if resto:
+        arquivo.write(b"\x00" * (_ALINHAMENTO - resto))
@@ -0,0 +1,100 @@
+"""
+Benchmark do índice ordenado usado por `ArvoreBinariaBusca`, comparado com a antiga AVLTree do bintrees.
+
+Mede inserção, busca (acertos e falhas), percurso em ordem e remoção, com chaves em ordem crescente
+(como os IDs do CSV) e embaralhadas. O bintrees é opcional: se não estiver instalado, só o índice atual é medido.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_arvore [--tamanho 100000] [--repeticoes 3]
+"""
+import argparse
+import random
+import time
+
+from estruturas_dados.arvore_binaria_busca import ArvoreBinariaBusca
+
+try:
+    from bintrees import AVLTree
+except ImportError:  # pragma: no cover - depende do ambiente
+    AVLTree = None
+
+
+# Adaptador com a interface da versão anterior de ArvoreBinariaBusca (busca via exceção)
+class ArvoreBintrees:
+    def __init__(self) -> None:
+        self._arvore_binaria = AVLTree()
+
+    def inserir_elemento(self, chave: int, elemento: object) -> None:
+        self._arvore_binaria.insert(chave, elemento)
+
+    def remover_elemento(self, chave: int) -> None:
+        self._arvore_binaria.remove(chave)
+
+    def buscar_elemento(self, chave: int) -> object | None:
+        try:
+            return self._arvore_binaria.get_value(chave)
+        except Exception:
+            return None
+
+    def percurso_in_order(self) -> list:
+        return [elemento for _, elemento in self._arvore_binaria.items()]
+
+
+def _cronometrar(funcao) -> float:
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+# Executa cada operação sobre uma árvore nova e devolve {operação: menor tempo em segundos}
+def medir(fabrica, chaves: list, repeticoes: int) -> dict:
+    ausentes = [chave + len(chaves) * 10 for chave in chaves]
+    tempos: dict[str, float] = {}
+
+    for _ in range(repeticoes):
+        arvore = fabrica()
+        medicoes = {
+            "inserir": _cronometrar(lambda: [arvore.inserir_elemento(chave, chave) for chave in chaves]),
+            "buscar (acerto)": _cronometrar(lambda: [arvore.buscar_elemento(chave) for chave in chaves]),
+            "buscar (falha)": _cronometrar(lambda: [arvore.buscar_elemento(chave) for chave in ausentes]),
+            "percurso_in_order": _cronometrar(arvore.percurso_in_order),
+            "remover": _cronometrar(lambda: [arvore.remover_elemento(chave) for chave in chaves[::2]]),
+        }
+        for operacao, segundos in medicoes.items():
+            tempos[operacao] = min(segundos, tempos.get(operacao, float("inf")))
+
+    return tempos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanho", type=int, default=100_000, help="quantidade de chaves")
+    parser.add_argument("--repeticoes", type=int, default=3, help="repetições (vale o menor tempo)")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    crescentes = list(range(1, args.tamanho + 1))
+    embaralhadas = crescentes[:]
+    random.Random(args.semente).shuffle(embaralhadas)
+
+    implementacoes = {"ArvoreBinariaBusca": ArvoreBinariaBusca}
+    if AVLTree is not None:
+        implementacoes["bintrees.AVLTree"] = ArvoreBintrees
+    else:
+        print("bintrees não instalado: medindo apenas ArvoreBinariaBusca (pip install bintrees para comparar).")
+
+    for descricao, chaves in (("chaves crescentes", crescentes), ("chaves embaralhadas", embaralhadas)):
+        print(f"\n{args.tamanho} {descricao}")
+        resultados = {nome: medir(fabrica, chaves, args.repeticoes) for nome, fabrica in implementacoes.items()}
+
+        nomes = list(resultados)
+        print(f"{'operação':<20}" + "".join(f"{nome:>22}" for nome in nomes))
+        for operacao in resultados[nomes[0]]:
+            linha = f"{operacao:<20}" + "".join(f"{resultados[nome][operacao] * 1000:>19.1f} ms" for nome in nomes)
+            if len(nomes) > 1 and resultados[nomes[0]][operacao] > 0:
+                linha += f"   ({resultados[nomes[1]][operacao] / resultados[nomes[0]][operacao]:.1f}x)"
+            print(linha)
+
+
+if __name__ == "__main__":
+    main()
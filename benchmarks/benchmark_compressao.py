@@ -0,0 +1,105 @@
+"""
+Benchmark da leitura de CSVs comprimidos (gzip, bz2, xz) comparada à do CSV sem compressão.
+
+Para cada formato, sobre o mesmo CSV sintético (ver benchmarks/gerador_sintetico.py):
+    - tamanho em disco e taxa de compressão;
+    - leitura pura (abrir_csv + csv.DictReader, sem processar as linhas), com o buffer padrão do Python
+      e com TAMANHO_BUFFER_LEITURA;
+    - processar_interacoes_csv completo no modo "streaming", em linhas por segundo.
+
+Os arquivos são gerados em `--diretorio` e reaproveitados nas execuções seguintes com o mesmo tamanho.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_compressao [--linhas 300000] [--repeticoes 3] [--formatos gzip,bz2,xz]
+"""
+import argparse
+import contextlib
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+
+from analise.ingestao_arquivos import COMPRESSOES, TAMANHO_BUFFER_LEITURA, abrir_csv
+from analise.sistema import SistemaAnaliseEngajamento
+from benchmarks.gerador_sintetico import ParametrosGeracao, gerar_csv
+
+EXTENSOES = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+
+
+# Gera (ou reaproveita) o CSV sintético e as cópias comprimidas; devolve {formato: caminho}, com None = sem compressão
+def preparar_arquivos(diretorio: str, linhas: int, formatos: list[str]) -> dict:
+    os.makedirs(diretorio, exist_ok=True)
+    parametros = ParametrosGeracao(linhas)
+    caminho_csv = os.path.join(diretorio, parametros.nome_arquivo())
+    if not os.path.exists(caminho_csv):
+        print(f"Gerando {caminho_csv}...")
+        gerar_csv(caminho_csv + ".parcial", parametros)
+        os.replace(caminho_csv + ".parcial", caminho_csv)
+
+    arquivos = {None: caminho_csv}
+    for formato in formatos:
+        caminho = caminho_csv + EXTENSOES[formato]
+        if not os.path.exists(caminho):
+            print(f"Comprimindo {caminho}...")
+            with open(caminho_csv, "rb") as origem, COMPRESSOES[formato][1](caminho + ".parcial", mode="wb") as destino:
+                shutil.copyfileobj(origem, destino, TAMANHO_BUFFER_LEITURA)
+            os.replace(caminho + ".parcial", caminho)
+        arquivos[formato] = caminho
+    return arquivos
+
+
+def ler_linhas(caminho_arquivo: str, tamanho_buffer: int) -> int:
+    with abrir_csv(caminho_arquivo, tamanho_buffer) as arquivo_csv:
+        return sum(1 for _ in csv.DictReader(arquivo_csv))
+
+
+def processar(caminho_arquivo: str, tamanho_buffer: int) -> int:
+    sistema = SistemaAnaliseEngajamento(capacidade_cache_relatorios=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return sistema.processar_interacoes_csv(caminho_arquivo, modo="streaming")
+
+
+# Menor tempo entre as repetições e o resultado da última
+def medir(funcao, caminho_arquivo: str, tamanho_buffer: int, repeticoes: int) -> tuple[float, int]:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(caminho_arquivo, tamanho_buffer)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=300_000)
+    parser.add_argument("--repeticoes", type=int, default=3, help="repetições (vale o menor tempo)")
+    parser.add_argument("--formatos", default=",".join(COMPRESSOES), help="formatos separados por vírgula")
+    parser.add_argument("--diretorio", default=os.path.join(tempfile.gettempdir(), "benchmarks_globo"),
+                        help="onde os CSVs sintéticos são gerados e reaproveitados")
+    args = parser.parse_args()
+
+    formatos = [formato.strip() for formato in args.formatos.split(",") if formato.strip()]
+    invalidos = [formato for formato in formatos if formato not in COMPRESSOES]
+    if invalidos:
+        parser.error(f"formatos inválidos: {', '.join(invalidos)}. Permitidos: {', '.join(COMPRESSOES)}")
+
+    arquivos = preparar_arquivos(args.diretorio, args.linhas, formatos)
+    tamanho_original = os.path.getsize(arquivos[None])
+
+    print(f"\n{args.linhas} linhas, {tamanho_original / 2**20:.1f} MB sem compressão")
+    print(f"{'formato':<10}{'MB':>8}{'taxa':>8}{'leitura 8K':>14}{'leitura 1M':>14}{'streaming':>14}")
+    for formato, caminho_arquivo in arquivos.items():
+        tamanho = os.path.getsize(caminho_arquivo)
+        taxas = []
+        for funcao, tamanho_buffer in ((ler_linhas, io.DEFAULT_BUFFER_SIZE), (ler_linhas, TAMANHO_BUFFER_LEITURA),
+                                       (processar, TAMANHO_BUFFER_LEITURA)):
+            segundos, linhas = medir(funcao, caminho_arquivo, tamanho_buffer, args.repeticoes)
+            taxas.append(linhas / segundos)
+        print(f"{formato or 'nenhum':<10}{tamanho / 2**20:>8.1f}{tamanho_original / tamanho:>7.1f}x"
+              + "".join(f"{taxa / 1000:>10.0f} k/s" for taxa in taxas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Benchmark de memória das entidades (Interacao, Conteudo, Usuario, Plataforma) com e sem `__slots__`.
+
+Mede duas coisas:
+    - bytes por objeto de cada entidade, com tracemalloc sobre alguns milhares de instâncias;
+    - bytes por interação do sistema inteiro (modo de objetos), pelo crescimento do RSS do processo ao
+      carregar o `interacoes_globo.csv` replicado até `--linhas` linhas (10 milhões por padrão).
+
+A versão "antes" é a mesma classe reconstruída sem `__slots__` (atributos em um `__dict__` por instância,
+como as entidades eram até então); cada variante roda em um processo novo, para que uma não herde a memória da outra.
+Com `--colunar`, mede também o armazenamento colunar como referência.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_memoria [--linhas 10000000] [--arquivo interacoes_globo.csv] [--novos-ids] [--colunar]
+"""
+import argparse
+import csv
+import gc
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import analise.sistema
+from analise.sistema import SistemaAnaliseEngajamento, TAMANHO_LOTE_PADRAO, converter_linha_csv
+from entidades.conteudo import Conteudo
+from entidades.interacao import Interacao
+from entidades.plataforma import Plataforma
+from entidades.usuario import Usuario
+
+ARQUIVO_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "interacoes_globo.csv")
+
+ENTIDADES = (Interacao, Conteudo, Usuario, Plataforma)
+
+# Nome da variante -> (usa __slots__, armazenamento colunar)
+VARIANTES = {
+    "antes (__dict__)": (False, False),
+    "depois (__slots__)": (True, False),
+    "colunar (__slots__)": (True, True),
+}
+
+
+# Mesma classe, sem __slots__: os atributos voltam a ficar em um __dict__ por instância
+def classe_com_dict(classe: type) -> type:
+    ignorados = {"__slots__", "__dict__", "__weakref__", *classe.__slots__}
+    atributos = {nome: valor for nome, valor in vars(classe).items() if nome not in ignorados}
+    return type(classe.__name__, classe.__bases__, atributos)
+
+
+# Troca as entidades usadas pelo sistema pelas versões com __dict__ (apenas no processo da medição)
+def usar_entidades_com_dict() -> None:
+    for classe in ENTIDADES:
+        setattr(analise.sistema, classe.__name__, classe_com_dict(classe))
+
+
+"""
+Replica as linhas válidas do arquivo até completar 'total' linhas.
+
+Cada cópia desloca os timestamps em um segundo (cada linha tem o seu próprio datetime, como na leitura do CSV,
+e as datas continuam próximas das originais). Por padrão os IDs se repetem, então
+o custo medido é o de cada interação; com 'novos_ids', cada cópia desloca também os IDs de conteúdo e de usuário
+(o catálogo e a base de usuários crescem com o volume). Nomes e comentários são os mesmos objetos str
+do arquivo original, como ficariam depois de internados.
+
+- Complexidade: O(total), um dicionário novo por linha gerada.
+"""
+def gerar_linhas(caminho_arquivo: str, total: int, novos_ids: bool = False):
+    with open(caminho_arquivo, newline="", encoding="utf-8") as arquivo:
+        base = []
+        for linha in csv.DictReader(arquivo):
+            try:
+                converter_linha_csv(linha)
+            except Exception:
+                continue
+            linha["id_conteudo"] = int(linha["id_conteudo"])
+            linha["id_usuario"] = int(linha["id_usuario"])
+            linha["timestamp_interacao"] = datetime.fromisoformat(linha["timestamp_interacao"])
+            base.append(linha)
+
+    if not base:
+        raise ValueError(f"Nenhuma linha válida em '{caminho_arquivo}'.")
+
+    passo_conteudo = max(linha["id_conteudo"] for linha in base)
+    passo_usuario = max(linha["id_usuario"] for linha in base)
+
+    for gerada in range(total):
+        copia, posicao = divmod(gerada, len(base))
+        linha = dict(base[posicao])
+        if novos_ids:
+            linha["id_conteudo"] += copia * passo_conteudo
+            linha["id_usuario"] += copia * passo_usuario
+        linha["timestamp_interacao"] += timedelta(seconds=copia)
+        yield linha
+
+
+# RSS atual do processo, em bytes (/proc no Linux; nos demais sistemas, o pico informado por getrusage)
+def rss_atual() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico if sys.platform == "darwin" else pico * 1024
+
+
+# Executada em um processo novo: carrega as linhas geradas e devolve (crescimento do RSS em bytes, segundos)
+def medir_variante(caminho_arquivo: str, linhas: int, novos_ids: bool, com_slots: bool,
+                   colunar: bool) -> tuple[int, float]:
+    if not com_slots:
+        usar_entidades_com_dict()
+
+    gc.collect()
+    rss_inicial = rss_atual()
+    inicio = time.perf_counter()
+
+    sistema = SistemaAnaliseEngajamento(armazenamento_colunar=colunar)
+    lote = []
+    for linha in gerar_linhas(caminho_arquivo, linhas, novos_ids):
+        lote.append(linha)
+        if len(lote) == TAMANHO_LOTE_PADRAO:
+            sistema.enfileirar_interacoes(lote)
+            sistema.processar_interacoes_da_fila()
+            lote = []
+    sistema.enfileirar_interacoes(lote)
+    sistema.processar_interacoes_da_fila()
+    del lote
+
+    segundos = time.perf_counter() - inicio
+    gc.collect()
+    return rss_atual() - rss_inicial, segundos
+
+
+# Bytes por instância de cada entidade: {nome da classe: bytes}, medidos com tracemalloc
+def medir_objetos(classes: dict[str, type], quantidade: int = 10_000) -> dict[str, float]:
+    conteudo = classes["Conteudo"](1, "Jornal Nacional")
+    plataforma = classes["Plataforma"](1, "Globoplay")
+    instante = datetime(2024, 10, 20, 20, 5, 12)
+
+    fabricas = {
+        "Interacao": lambda i: classes["Interacao"](conteudo, i, instante, plataforma, "like", 0, ""),
+        "Conteudo": lambda i: classes["Conteudo"](i, "Jornal Nacional"),
+        "Usuario": lambda i: classes["Usuario"](i),
+        "Plataforma": lambda i: classes["Plataforma"](i, "Globoplay"),
+    }
+
+    resultado = {}
+    for nome, fabrica in fabricas.items():
+        # IDs pequenos (inteiros em cache) para que só o objeto e suas estruturas próprias sejam contados
+        ids = [i % 256 for i in range(quantidade)]
+        gc.collect()
+        tracemalloc.start()
+        objetos = [fabrica(i) for i in ids]
+        atual, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        resultado[nome] = (atual - sys.getsizeof(objetos)) / quantidade
+        del objetos
+    return resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=10_000_000, help="quantidade de interações carregadas")
+    parser.add_argument("--arquivo", default=ARQUIVO_PADRAO, help="CSV replicado até completar as linhas")
+    parser.add_argument("--novos-ids", action="store_true",
+                        help="cada cópia do arquivo ganha novos IDs de conteúdo e de usuário")
+    parser.add_argument("--colunar", action="store_true", help="mede também o armazenamento colunar")
+    args = parser.parse_args()
+
+    antes = medir_objetos({classe.__name__: classe_com_dict(classe) for classe in ENTIDADES})
+    depois = medir_objetos({classe.__name__: classe for classe in ENTIDADES})
+
+    print("Bytes por objeto")
+    print(f"{'entidade':<12}{'antes (__dict__)':>20}{'depois (__slots__)':>22}{'economia':>12}")
+    for nome in antes:
+        print(f"{nome:<12}{antes[nome]:>20.0f}{depois[nome]:>22.0f}{1 - depois[nome] / antes[nome]:>12.0%}")
+
+    variantes = [nome for nome in VARIANTES if args.colunar or not VARIANTES[nome][1]]
+    print(f"\nBytes por interação ({args.linhas} linhas replicadas de {os.path.basename(args.arquivo)})")
+    print(f"{'variante':<22}{'bytes/interação':>18}{'total':>14}{'tempo':>12}")
+
+    # Um processo novo por variante: a memória liberada por uma medição não distorce a seguinte
+    contexto = multiprocessing.get_context("spawn")
+    referencia = None
+    with contexto.Pool(1, maxtasksperchild=1) as processos:
+        for nome in variantes:
+            com_slots, colunar = VARIANTES[nome]
+            crescimento, segundos = processos.apply(
+                medir_variante, (args.arquivo, args.linhas, args.novos_ids, com_slots, colunar)
+            )
+            por_interacao = crescimento / args.linhas
+            linha = f"{nome:<22}{por_interacao:>18.0f}{crescimento / 2**20:>11.0f} MB{segundos:>10.1f} s"
+            if referencia is None:
+                referencia = por_interacao
+            else:
+                linha += f"   ({1 - por_interacao / referencia:.0%} menos)"
+            print(linha)
+
+
+if __name__ == "__main__":
+    main()
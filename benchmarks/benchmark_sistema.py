@@ -0,0 +1,188 @@
+"""
+Suíte de benchmark do SistemaAnaliseEngajamento sobre CSVs sintéticos (ver benchmarks/gerador_sintetico.py).
+
+Para cada tamanho, em um processo novo:
+    - processar_interacoes_csv (no modo escolhido) e processar_interacoes_da_fila;
+    - cada gerar_relatorio_* (e relatorio_conteudos_mais_engajados), com a saída descartada em os.devnull;
+    - o pico de RSS do processo e o crescimento do RSS depois da carga.
+
+O cache de relatórios fica desligado, para que cada relatório meça o próprio cálculo. Os CSVs gerados são guardados
+em `--diretorio` e reaproveitados nas execuções seguintes com os mesmos parâmetros. Os resultados são gravados em
+JSON (`--saida`); com `--comparar anterior.json`, cada tempo é comparado com o de uma execução anterior
+(por exemplo, de outro commit).
+
+No modo "fila", todas as linhas brutas ficam na fila antes de serem processadas; para 50 milhões de linhas,
+use `--modo streaming` (memória limitada ao lote) ou uma máquina com dezenas de GB de RAM.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_sistema [--tamanhos 10k,1m,50m] [--saida resultados.json]
+        [--comparar anterior.json] [--modo fila] [--colunar] [--usuarios 100000] [--conteudos 5000]
+        [--plataformas 8] [--assimetria 1.1] [--semente 42]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from analise.sistema import MODOS_PROCESSAMENTO, SistemaAnaliseEngajamento
+from benchmarks.benchmark_memoria import rss_atual
+from benchmarks.gerador_sintetico import ParametrosGeracao, gerar_csv
+
+# Tamanhos nomeados aceitos em --tamanhos (também aceita a quantidade de linhas diretamente)
+TAMANHOS = {"10k": 10_000, "1m": 1_000_000, "50m": 50_000_000}
+
+RELATORIOS = (
+    "gerar_relatorio_atividade_usuarios",
+    "gerar_relatorio_engajamento_conteudos",
+    "relatorio_conteudos_mais_engajados",
+    "gerar_relatorio_comentarios_por_conteudo",
+    "gerar_relatorio_tempo_por_plataforma_por_hora",
+    "gerar_relatorio_analitico",
+)
+
+
+def ler_tamanho(texto: str) -> int:
+    texto = texto.strip().lower()
+    if texto in TAMANHOS:
+        return TAMANHOS[texto]
+    return int(texto.replace("_", ""))
+
+
+# Pico de RSS do processo atual, em bytes (getrusage informa KB no Linux e bytes no macOS)
+def pico_rss() -> int:
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+# Executada em um processo novo: carrega o CSV, gera os relatórios e devolve tempos (segundos) e memória (bytes)
+def medir_tamanho(caminho_arquivo: str, modo: str, colunar: bool) -> dict:
+    rss_inicial = rss_atual()
+    sistema = SistemaAnaliseEngajamento(armazenamento_colunar=colunar, capacidade_cache_relatorios=0)
+    tempos = {}
+
+    inicio = time.perf_counter()
+    sistema.processar_interacoes_csv(caminho_arquivo, modo=modo)
+    tempos["processar_interacoes_csv"] = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    sistema.processar_interacoes_da_fila()
+    tempos["processar_interacoes_da_fila"] = time.perf_counter() - inicio
+    rss_carregado = rss_atual()
+
+    with open(os.devnull, "w", encoding="utf-8") as descarte:
+        for nome in RELATORIOS:
+            inicio = time.perf_counter()
+            getattr(sistema, nome)(destino=descarte)
+            tempos[nome] = time.perf_counter() - inicio
+
+    return {
+        "tempos": tempos,
+        "crescimento_rss_bytes": rss_carregado - rss_inicial,
+        "pico_rss_bytes": pico_rss(),
+    }
+
+
+# Commit atual do repositório (None fora de um repositório git)
+def commit_atual() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def exibir_comparacao(resultados: list[dict], anterior: dict) -> None:
+    anteriores = {resultado["parametros"]["linhas"]: resultado for resultado in anterior["resultados"]}
+    print(f"\nComparação com {anterior['metadados'].get('commit') or 'a execução anterior'} "
+          "(razão > 1: mais lento agora)")
+    for resultado in resultados:
+        linhas = resultado["parametros"]["linhas"]
+        base = anteriores.get(linhas)
+        if base is None:
+            print(f"{linhas} linhas: sem resultado anterior")
+            continue
+        if base["parametros"] != resultado["parametros"]:
+            print(f"{linhas} linhas: parâmetros diferentes dos anteriores, comparação apenas indicativa")
+        print(f"{linhas} linhas")
+        for etapa, segundos in resultado["tempos"].items():
+            if etapa in base["tempos"] and base["tempos"][etapa] > 0:
+                print(f"  {etapa:<48}{base['tempos'][etapa]:>10.3f} s{segundos:>10.3f} s"
+                      f"{segundos / base['tempos'][etapa]:>8.2f}x")
+        print(f"  {'pico_rss':<48}{base['pico_rss_bytes'] / 2**20:>9.0f} MB{resultado['pico_rss_bytes'] / 2**20:>9.0f} MB"
+              f"{resultado['pico_rss_bytes'] / base['pico_rss_bytes']:>8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", default="10k,1m", help="tamanhos separados por vírgula: 10k, 1m, 50m ou linhas")
+    parser.add_argument("--saida", default="resultados_benchmark.json", help="arquivo JSON com os resultados")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior, para comparar os tempos")
+    parser.add_argument("--diretorio", default=os.path.join(tempfile.gettempdir(), "benchmarks_globo"),
+                        help="onde os CSVs sintéticos são gerados e reaproveitados")
+    parser.add_argument("--modo", default="fila", choices=MODOS_PROCESSAMENTO)
+    parser.add_argument("--colunar", action="store_true", help="usa o armazenamento colunar")
+    parser.add_argument("--usuarios", type=int, default=100_000)
+    parser.add_argument("--conteudos", type=int, default=5_000)
+    parser.add_argument("--plataformas", type=int, default=8)
+    parser.add_argument("--assimetria", type=float, default=1.1, help="expoente de Zipf (0 = uniforme)")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    os.makedirs(args.diretorio, exist_ok=True)
+    resultados = []
+
+    # Um processo novo por tamanho: o pico de RSS de um não contamina o do outro
+    contexto = multiprocessing.get_context("spawn")
+    with contexto.Pool(1, maxtasksperchild=1) as processos:
+        for tamanho in args.tamanhos.split(","):
+            parametros = ParametrosGeracao(ler_tamanho(tamanho), args.usuarios, args.conteudos, args.plataformas,
+                                           args.assimetria, args.semente)
+            caminho_arquivo = os.path.join(args.diretorio, parametros.nome_arquivo())
+            if not os.path.exists(caminho_arquivo):
+                print(f"Gerando {caminho_arquivo}...")
+                caminho_temporario = caminho_arquivo + ".parcial"
+                gerar_csv(caminho_temporario, parametros)
+                os.replace(caminho_temporario, caminho_arquivo)
+
+            medicao = processos.apply(medir_tamanho, (caminho_arquivo, args.modo, args.colunar))
+            resultado = {"parametros": parametros.como_dicionario(), **medicao}
+            resultados.append(resultado)
+
+            linhas = parametros.linhas
+            print(f"\n{linhas} linhas (pico de RSS {resultado['pico_rss_bytes'] / 2**20:.0f} MB, "
+                  f"{resultado['crescimento_rss_bytes'] / max(linhas, 1):.0f} bytes/interação)")
+            for etapa, segundos in resultado["tempos"].items():
+                print(f"  {etapa:<48}{segundos:>10.3f} s")
+
+    documento = {
+        "metadados": {
+            "commit": commit_atual(),
+            "data": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "cpus": os.cpu_count(),
+            "modo": args.modo,
+            "colunar": args.colunar,
+        },
+        "resultados": resultados,
+    }
+    with open(args.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(documento, arquivo, ensure_ascii=False, indent=2)
+    print(f"\nResultados gravados em '{args.saida}'")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            exibir_comparacao(resultados, json.load(arquivo))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Microbenchmark da conversão de timestamps do CSV para epoch.
+
+Compara:
+    - o caminho anterior: datetime.fromisoformat em toda linha, guardando o datetime e convertendo-o depois
+      para epoch com operações de timedelta;
+    - o caminho atual (timestamp_para_epoch): datetime.fromisoformat seguido de aritmética inteira, sem guardar
+      o datetime;
+    - um parser em Python puro para o layout fixo 'AAAA-MM-DD HH:MM:SS', com cache por prefixo de data e tabelas
+      para horas/minutos/segundos (alternativa avaliada; no CPython, o fromisoformat em C é mais rápido).
+
+Os timestamps são os do `interacoes_globo.csv`, replicados com segundos deslocados até `--tamanho` textos
+(as datas se repetem, como em um arquivo real).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.benchmark_timestamps [--tamanho 1000000] [--repeticoes 3]
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from estruturas_dados.conversor_timestamp import timestamp_para_epoch
+
+ARQUIVO_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "interacoes_globo.csv")
+
+_EPOCA = datetime(1970, 1, 1)
+_HORAS = {f"{hora:02d}": hora * 3600 for hora in range(24)}
+_MINUTOS = {f"{minuto:02d}": minuto * 60 for minuto in range(60)}
+_SEGUNDOS = {f"{segundo:02d}": segundo for segundo in range(60)}
+
+
+# Textos no layout do CSV, com os mesmos dias do arquivo e segundos variando entre as cópias
+def gerar_textos(caminho_arquivo: str, tamanho: int) -> list[str]:
+    with open(caminho_arquivo, newline="", encoding="utf-8") as arquivo:
+        base = []
+        for linha in csv.DictReader(arquivo):
+            try:
+                base.append(datetime.fromisoformat(linha["timestamp_interacao"]))
+            except (TypeError, ValueError):
+                continue
+
+    return [
+        (base[i % len(base)] + timedelta(seconds=(i // len(base)) % 3600)).isoformat(sep=" ")
+        for i in range(tamanho)
+    ]
+
+
+def caminho_anterior(textos: list[str]) -> list[int]:
+    momentos = [datetime.fromisoformat(texto) for texto in textos]
+    return [(momento - _EPOCA) // timedelta(seconds=1) for momento in momentos]
+
+
+def caminho_atual(textos: list[str]) -> list[int]:
+    return [timestamp_para_epoch(texto) for texto in textos]
+
+
+def parser_com_cache_de_datas(textos: list[str]) -> list[int]:
+    epochs_por_data: dict[str, int] = {}
+    resultado = []
+    for texto in textos:
+        epoch = None
+        if len(texto) == 19 and texto[10] in " T" and texto[13] == ":" and texto[16] == ":":
+            meia_noite = epochs_por_data.get(texto[:10])
+            if meia_noite is None:
+                meia_noite = epochs_por_data[texto[:10]] = timestamp_para_epoch(texto[:10])
+            hora, minuto, segundo = _HORAS.get(texto[11:13]), _MINUTOS.get(texto[14:16]), _SEGUNDOS.get(texto[17:19])
+            if hora is not None and minuto is not None and segundo is not None:
+                epoch = meia_noite + hora + minuto + segundo
+        resultado.append(timestamp_para_epoch(texto) if epoch is None else epoch)
+    return resultado
+
+
+# Menor tempo (segundos) entre as repetições, e o resultado da última
+def medir(funcao, textos: list[str], repeticoes: int) -> tuple[float, list]:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(textos)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanho", type=int, default=1_000_000, help="quantidade de timestamps convertidos")
+    parser.add_argument("--repeticoes", type=int, default=3, help="repetições (vale o menor tempo)")
+    parser.add_argument("--arquivo", default=ARQUIVO_PADRAO)
+    args = parser.parse_args()
+
+    textos = gerar_textos(args.arquivo, args.tamanho)
+    caminhos = {
+        "anterior (datetime + timedelta)": caminho_anterior,
+        "timestamp_para_epoch": caminho_atual,
+        "parser Python com cache de datas": parser_com_cache_de_datas,
+    }
+
+    tempos = {}
+    resultados = {}
+    for nome, funcao in caminhos.items():
+        tempos[nome], resultados[nome] = medir(funcao, textos, args.repeticoes)
+
+    esperado = resultados["anterior (datetime + timedelta)"]
+    for nome, resultado in resultados.items():
+        if resultado != esperado:
+            raise AssertionError(f"'{nome}' divergiu do caminho anterior.")
+
+    referencia = tempos["anterior (datetime + timedelta)"]
+    print(f"{args.tamanho} timestamps")
+    print(f"{'caminho':<36}{'tempo':>12}{'ns/linha':>12}{'speedup':>10}")
+    for nome, segundos in tempos.items():
+        print(f"{nome:<36}{segundos * 1000:>9.1f} ms{segundos * 1e9 / args.tamanho:>12.0f}{referencia / segundos:>9.1f}x")
+
+    # Memória guardada por interação: um datetime (anterior) ou um int (epoch)
+    print(f"\nbytes por timestamp guardado: datetime {sys.getsizeof(datetime.fromisoformat(textos[0]))}, "
+          f"epoch (int) {sys.getsizeof(esperado[0])}")
+
+
+if __name__ == "__main__":
+    main()
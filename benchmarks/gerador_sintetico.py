@@ -0,0 +1,170 @@
+"""
+Gerador determinístico de interações sintéticas, no mesmo esquema do `interacoes_globo.csv`.
+
+A mesma semente e os mesmos parâmetros geram sempre o mesmo arquivo, byte a byte. Usuários, conteúdos e plataformas
+são sorteados com distribuição de Zipf: o item de posição k tem peso 1 / k**assimetria, então assimetria 0 é
+uniforme e valores maiores concentram as interações em poucos IDs (o conteúdo 1 é o mais popular, e assim por diante).
+Os timestamps são crescentes, como em um log de eventos, e só as linhas 'view_start' têm duração.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.gerador_sintetico saida.csv --linhas 1000000 [--usuarios 100000] [--conteudos 5000]
+        [--plataformas 8] [--assimetria 1.1] [--semente 42]
+"""
+import argparse
+import csv
+import random
+from datetime import datetime, timedelta
+from itertools import accumulate
+
+COLUNAS = (
+    "id_conteudo", "nome_conteudo", "id_usuario", "timestamp_interacao", "plataforma", "tipo_interacao",
+    "watch_duration_seconds", "comment_text",
+)
+
+# Plataformas do arquivo original; a partir da nona, os nomes são gerados
+NOMES_PLATAFORMAS = (
+    "Globoplay", "TV Globo", "GE Globo", "Sportv Play", "Premiere", "G1", "Spotify", "Receitas Gshow",
+)
+
+# Proporção de cada tipo de interação, próxima à do arquivo original
+PESOS_TIPOS = {"view_start": 55, "comment": 25, "like": 13, "share": 7}
+
+COMENTARIOS = (
+    "Muito bom o tema de hoje!", "Adorei a discussão!", "Que capítulo emocionante!", "Debate necessário.",
+    "Excelente ponto de vista.", "Esse tema me fez refletir muito.", "Não gostei do final.", "Quero mais episódios!",
+)
+
+INICIO_PADRAO = datetime(2024, 10, 20)
+
+# Quantidade de linhas sorteadas e escritas por vez
+TAMANHO_BLOCO = 100_000
+
+
+class ParametrosGeracao:
+    def __init__(self, linhas: int, usuarios: int = 100_000, conteudos: int = 5_000, plataformas: int = 8,
+                 assimetria: float = 1.1, semente: int = 42) -> None:
+        if linhas < 0:
+            raise ValueError("A quantidade de linhas deve ser um inteiro não negativo.")
+        if min(usuarios, conteudos, plataformas) < 1:
+            raise ValueError("As quantidades de usuários, conteúdos e plataformas devem ser positivas.")
+        if assimetria < 0:
+            raise ValueError("A assimetria deve ser não negativa.")
+
+        self.linhas = linhas
+        self.usuarios = usuarios
+        self.conteudos = conteudos
+        self.plataformas = plataformas
+        self.assimetria = assimetria
+        self.semente = semente
+
+    # Parâmetros como dicionário (usado nos resultados em JSON do benchmark)
+    def como_dicionario(self) -> dict:
+        return {
+            "linhas": self.linhas, "usuarios": self.usuarios, "conteudos": self.conteudos,
+            "plataformas": self.plataformas, "assimetria": self.assimetria, "semente": self.semente,
+        }
+
+    # Nome de arquivo que identifica os parâmetros (arquivos já gerados podem ser reaproveitados)
+    def nome_arquivo(self) -> str:
+        return (f"interacoes_sinteticas_{self.linhas}l_{self.usuarios}u_{self.conteudos}c_{self.plataformas}p_"
+                f"a{self.assimetria:g}_s{self.semente}.csv")
+
+
+def nome_plataforma(posicao: int) -> str:
+    if posicao < len(NOMES_PLATAFORMAS):
+        return NOMES_PLATAFORMAS[posicao]
+    return f"Plataforma {posicao + 1}"
+
+
+# Pesos acumulados da distribuição de Zipf para 'quantidade' itens (para random.choices)
+def pesos_zipf(quantidade: int, assimetria: float) -> list[float]:
+    return list(accumulate(1 / posicao ** assimetria for posicao in range(1, quantidade + 1)))
+
+
+"""
+Gera as linhas (na ordem das COLUNAS) a partir dos parâmetros.
+
+- Complexidade: O(n log m), n linhas e m o maior entre usuários, conteúdos e plataformas
+  (cada sorteio é uma busca binária nos pesos acumulados); memória O(m + TAMANHO_BLOCO).
+"""
+def gerar_linhas(parametros: ParametrosGeracao, inicio: datetime = INICIO_PADRAO):
+    aleatorio = random.Random(parametros.semente)
+
+    ids_usuarios = range(1, parametros.usuarios + 1)
+    ids_conteudos = range(1, parametros.conteudos + 1)
+    posicoes_plataformas = range(parametros.plataformas)
+    pesos_usuarios = pesos_zipf(parametros.usuarios, parametros.assimetria)
+    pesos_conteudos = pesos_zipf(parametros.conteudos, parametros.assimetria)
+    pesos_plataformas = pesos_zipf(parametros.plataformas, parametros.assimetria)
+    tipos = tuple(PESOS_TIPOS)
+    pesos_tipos = list(accumulate(PESOS_TIPOS.values()))
+
+    nomes_plataformas = [nome_plataforma(posicao) for posicao in posicoes_plataformas]
+    nomes_conteudos = [""] + [f"Conteúdo {id_conteudo}" for id_conteudo in ids_conteudos]
+    momento = inicio
+    texto_momento = momento.isoformat(sep=" ")
+
+    restantes = parametros.linhas
+    while restantes > 0:
+        tamanho = min(restantes, TAMANHO_BLOCO)
+        restantes -= tamanho
+
+        usuarios = aleatorio.choices(ids_usuarios, cum_weights=pesos_usuarios, k=tamanho)
+        conteudos = aleatorio.choices(ids_conteudos, cum_weights=pesos_conteudos, k=tamanho)
+        plataformas = aleatorio.choices(posicoes_plataformas, cum_weights=pesos_plataformas, k=tamanho)
+        tipos_sorteados = aleatorio.choices(tipos, cum_weights=pesos_tipos, k=tamanho)
+
+        for id_usuario, id_conteudo, plataforma, tipo in zip(usuarios, conteudos, plataformas, tipos_sorteados):
+            # Intervalo entre eventos de 0 a 2 segundos; o texto só é refeito quando o segundo muda
+            intervalo = aleatorio.randrange(3)
+            if intervalo:
+                momento += timedelta(seconds=intervalo)
+                texto_momento = momento.isoformat(sep=" ")
+
+            if tipo == "view_start":
+                duracao, comentario = aleatorio.randrange(60, 7201, 10), ""
+            elif tipo == "comment":
+                duracao, comentario = 0, aleatorio.choice(COMENTARIOS)
+            else:
+                duracao, comentario = 0, ""
+
+            yield (id_conteudo, nomes_conteudos[id_conteudo], id_usuario, texto_momento, nomes_plataformas[plataforma],
+                   tipo, duracao, comentario)
+
+
+# Escreve o CSV sintético em 'caminho_arquivo'; devolve a quantidade de linhas escritas
+def gerar_csv(caminho_arquivo: str, parametros: ParametrosGeracao) -> int:
+    escritas = 0
+    with open(caminho_arquivo, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo, lineterminator="\n")
+        escritor.writerow(COLUNAS)
+        bloco = []
+        for linha in gerar_linhas(parametros):
+            bloco.append(linha)
+            if len(bloco) == TAMANHO_BLOCO:
+                escritor.writerows(bloco)
+                escritas += len(bloco)
+                bloco = []
+        escritor.writerows(bloco)
+        escritas += len(bloco)
+    return escritas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("saida", help="caminho do CSV gerado")
+    parser.add_argument("--linhas", type=int, default=10_000)
+    parser.add_argument("--usuarios", type=int, default=100_000, help="quantidade de usuários distintos")
+    parser.add_argument("--conteudos", type=int, default=5_000, help="quantidade de conteúdos distintos")
+    parser.add_argument("--plataformas", type=int, default=8, help="quantidade de plataformas distintas")
+    parser.add_argument("--assimetria", type=float, default=1.1, help="expoente de Zipf (0 = uniforme)")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    parametros = ParametrosGeracao(args.linhas, args.usuarios, args.conteudos, args.plataformas, args.assimetria,
+                                   args.semente)
+    print(f"{gerar_csv(args.saida, parametros)} linhas escritas em '{args.saida}'")
+
+
+if __name__ == "__main__":
+    main()
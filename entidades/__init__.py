@@ -2,3 +2,4 @@ from .conteudo import Conteudo
 from .interacao import Interacao
 from .plataforma import Plataforma
 from .usuario import Usuario
+from .tipo_interacao import TipoInteracao
@@ -1,13 +1,29 @@
 from .interacao import Interacao
+from .tipo_interacao import TIPOS_ENGAJAMENTO, TipoInteracao
 from collections import Counter
 
 
 class Conteudo:
+    __slots__ = (
+        "_id_conteudo",
+        "_nome_conteudo",
+        "_interacoes",
+        "_tempo_total_consumo",
+        "_total_visualizacoes_validas",
+        "_contagem_por_tipo",
+    )
+
     def __init__(self, id_conteudo: int, nome_conteudo: str):
         self._id_conteudo: int = id_conteudo
         self._nome_conteudo: str = nome_conteudo
         self._interacoes: list[Interacao] = []
 
+        # Agregados mantidos incrementalmente a cada interação adicionada,
+        # para que os relatórios não precisem varrer a lista de interações
+        self._tempo_total_consumo: int = 0
+        self._total_visualizacoes_validas: int = 0  # interações com watch_duration_seconds > 0
+        self._contagem_por_tipo: list[int] = [0] * len(TipoInteracao)  # indexada pelo código do tipo
+
     # Getters e Setters
     @property
     def id_conteudo(self) -> int:
@@ -29,58 +45,113 @@ class Conteudo:
     def interacoes(self):
         return self._interacoes
 
+    @property
+    def tempo_total_consumo(self) -> int:
+        return self._tempo_total_consumo
+
+    @property
+    def total_visualizacoes_validas(self) -> int:
+        return self._total_visualizacoes_validas
+
+    @property
+    def contagem_por_tipo(self) -> dict[str, int]:
+        return {tipo.texto: quantidade for tipo, quantidade in zip(TipoInteracao, self._contagem_por_tipo) if quantidade}
+
+    # Contagem de cada tipo, na ordem dos códigos de TipoInteracao
+    @property
+    def contagem_por_codigo(self) -> tuple[int, ...]:
+        return tuple(self._contagem_por_tipo)
+
+    @property
+    def total_comentarios(self) -> int:
+        return self._contagem_por_tipo[TipoInteracao.COMMENT]
+
+    @property
+    def total_engajamentos(self) -> int:
+        return sum(self._contagem_por_tipo[tipo] for tipo in TIPOS_ENGAJAMENTO)
+
+    @property
+    def total_interacoes(self) -> int:
+        return len(self._interacoes)
+
     # Método de interação
     """
-    Adiciona uma nova interação à lista de interações do conteúdo.
+    Adiciona uma nova interação à lista de interações do conteúdo e atualiza os agregados.
 
     - Melhor caso (Ω): O(1), inserção direta no fim da lista.
     - Caso médio (Θ): O(1), para lista dinâmica bem gerenciada.
     - Pior caso (O): O(1), constante em listas Python.
 
-    Justificativa: o método apenas usa `append`, que é O(1) na prática com listas Python.
+    Justificativa: o método usa `append`, que é O(1) na prática com listas Python,
+    e os agregados são atualizados com um número constante de operações.
     """
     def adicionar_interacao(self, interacao: Interacao) -> None:
         self._interacoes.append(interacao)
+        self._acumular_agregados(interacao.codigo_tipo, interacao.watch_duration_seconds)
 
-    # Métodos de interação
-    def adicionar_interacao(self, interacao: Interacao) -> None:
-        self._interacoes.append(interacao)
+    """
+    Troca a lista de objetos Interacao por uma visão do armazenamento colunar do sistema.
+    A partir daí, as interações devem ser registradas com `adicionar_indice_colunar`.
+
+    - Complexidade: O(1), apenas substitui a referência.
+    """
+    def usar_visao_colunar(self, visao) -> None:
+        self._interacoes = visao
 
     """
-    Conta as ocorrências de cada tipo de interação usando Counter.
+    Adiciona uma interação já gravada no armazenamento colunar, pelo índice da sua linha.
+
+    - Melhor caso (Ω): O(1), append do índice na visão.
+    - Caso médio (Θ): O(1), idem, mais a atualização dos agregados.
+    - Pior caso (O): O(1), idem.
 
-    - Melhor caso (Ω): O(n), onde n é o número de interações.
-    - Caso médio (Θ): O(n), para varrer todos os itens uma vez.
-    - Pior caso (O): O(n), se todas as interações forem de tipos diferentes.
+    Justificativa: nenhum objeto Interacao é criado; só o índice (8 bytes) é guardado.
+    """
+    def adicionar_indice_colunar(self, indice: int, codigo_tipo: int, watch_duration_seconds: int) -> None:
+        self._interacoes.adicionar_indice(indice)
+        self._acumular_agregados(codigo_tipo, watch_duration_seconds)
+
+    # Restaura os agregados salvos em um snapshot (ver analise.snapshot), sem reprocessar as interações
+    def restaurar_agregados(self, tempo_total_consumo: int, total_visualizacoes_validas: int,
+                            contagem_por_tipo: dict[str, int]) -> None:
+        self._tempo_total_consumo = tempo_total_consumo
+        self._total_visualizacoes_validas = total_visualizacoes_validas
+        self._contagem_por_tipo = [contagem_por_tipo.get(tipo.texto, 0) for tipo in TipoInteracao]
+
+    def _acumular_agregados(self, codigo_tipo: int, duracao: int) -> None:
+        self._tempo_total_consumo += duracao
+        if duracao > 0:
+            self._total_visualizacoes_validas += 1
+        self._contagem_por_tipo[codigo_tipo] += 1
 
-    Justificativa: o método percorre todas as interações uma vez e agrupa por tipo.
+    """
+    Retorna a contagem de cada tipo de interação como Counter.
+
+    - Melhor caso (Ω): O(1), nenhuma interação cadastrada.
+    - Caso médio (Θ): O(k), onde k é o número de tipos distintos de interação.
+    - Pior caso (O): O(k), com k limitado aos tipos válidos de Interacao.
+
+    Justificativa: a contagem é mantida incrementalmente em `adicionar_interacao`; aqui só é copiada.
     """
     def calcular_contagem_por_tipo_interacao(self) -> dict:
         # Caso nao tenha interações cadastradas, retorna um dicionario vazio
         if not self._interacoes:
             return {}
 
-        # Criando uma lista em que vai ser iterado na coluna de tipo de interação
-        # Daí, o que vai ter de retorno é algo como: ['view_start', 'like', 'like', 'comment']
-        tipos = [interacao.tipo_interacao for interacao in self.interacoes]
-
-        # O counter é o responsável por transformar a lista acima em um dicionário
-        # Então o resultado vai ser algo como: {'view_start': 1, 'like': 2, 'comment': 1}
-        return Counter(tipos)
+        # O resultado vai ser algo como: {'view_start': 1, 'like': 2, 'comment': 1}
+        return Counter(self.contagem_por_tipo)
     
     """
     Calcula a quantidade de interações do tipo 'like', 'comment' ou 'share'.
 
-    - Melhor caso (Ω): O(n), se todas forem do tipo engajamento.
-    - Caso médio (Θ): O(n), onde n é o número de interações.
-    - Pior caso (O): O(n), se nenhuma for de engajamento.
+    - Melhor caso (Ω): O(1), leitura dos agregados.
+    - Caso médio (Θ): O(1), idem.
+    - Pior caso (O): O(1), idem.
 
-    Justificativa: percorre toda a lista verificando o tipo de cada interação.
+    Justificativa: a contagem por tipo já é mantida incrementalmente; basta somar três entradas.
     """
     def calcular_total_interacoes_engajamento(self) -> str:
-        interacoes = {"like", "comment", "share"}
-
-        engajamentos = sum(1 for i in self.interacoes if i.tipo_interacao in interacoes)
+        engajamentos = self.total_engajamentos
 
         if not engajamentos:
             relatorio = f"\n➡️   {self.nome_conteudo}\n"
@@ -118,20 +189,15 @@ class Conteudo:
     """
     Soma os tempos de consumo (watch_duration_seconds) das interações.
 
-    - Melhor caso (Ω): O(n), se todas tiverem tempo válido.
-    - Caso médio (Θ): O(n), onde n é o número de interações.
-    - Pior caso (O): O(n), se muitas interações forem descartadas.
+    - Melhor caso (Ω): O(1), leitura do agregado.
+    - Caso médio (Θ): O(1), idem.
+    - Pior caso (O): O(1), idem.
 
-    Justificativa: filtra e soma linearmente os tempos válidos.
+    Justificativa: o tempo total é acumulado em `adicionar_interacao`; como a duração nunca é negativa,
+    a soma de todas as interações é igual à soma das interações com tempo válido.
     """
     def calcular_tempo_total_consumo(self) -> str:
-        tempo_assistido_conteudo = 0
-
-        # Laço para armazenar em uma variável os segundos de tempo assistido
-        # Em qque o tempo seja maior do que 0 segundos
-        for interacao in self.interacoes:
-            if interacao.watch_duration_seconds > 0:
-                tempo_assistido_conteudo += interacao.watch_duration_seconds
+        tempo_assistido_conteudo = self._tempo_total_consumo
 
         # Enviando para o método de converter e formatar o tmepo assistido de conteúdo
         tempo_assistido_conteudo = self.converter_segundos_para_hms(
@@ -147,19 +213,14 @@ class Conteudo:
     """
     Calcula o tempo médio de consumo com base nas interações com tempo válido (>0).
 
-    - Melhor caso (Ω): O(n), onde todas as interações têm tempo > 0.
-    - Caso médio (Θ): O(n), iteração completa e média simples.
-    - Pior caso (O): O(n), se nenhuma interação for válida e divisão lançar exceção (mas aqui não lança por len>0).
+    - Melhor caso (Ω): O(1), leitura dos agregados.
+    - Caso médio (Θ): O(1), uma divisão simples.
+    - Pior caso (O): O(1), se nenhuma interação for válida a divisão lança ZeroDivisionError.
 
-    Justificativa: percorre toda a lista de interações, filtra, soma e divide.
+    Justificativa: tempo total e quantidade de visualizações válidas são mantidos incrementalmente.
     """
     def calcular_media_tempo_consumo(self) -> str:
-        tempo = [
-            interacoes.watch_duration_seconds
-            for interacoes in self.interacoes
-            if interacoes.watch_duration_seconds > 0
-        ]
-        media_tempo_consumo = sum(tempo) / len(tempo)
+        media_tempo_consumo = self._tempo_total_consumo / self._total_visualizacoes_validas
         media_tempo_consumo = self.converter_segundos_para_hms(media_tempo_consumo)
 
         relatorio = (
@@ -1,6 +1,9 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from estruturas_dados.conversor_timestamp import epoch_para_datetime, timestamp_para_epoch
+from .tipo_interacao import TEXTOS_TIPO_INTERACAO, TIPOS_ENGAJAMENTO, TipoInteracao
+
 
 if TYPE_CHECKING:
     from .conteudo import Conteudo
@@ -8,15 +11,27 @@ if TYPE_CHECKING:
 
 
 class Interacao:
-    TIPOS_INTERACAO_VALIDOS = {"view_start", "like", "share", "comment"}
+    TIPOS_INTERACAO_VALIDOS = TEXTOS_TIPO_INTERACAO
+
+    # Sem __dict__ por instância: no modo de objetos existe uma Interacao por linha do CSV,
+    # e os atributos em slots ocupam bem menos memória (ver benchmarks/benchmark_memoria.py)
+    __slots__ = (
+        "_conteudo_associado",
+        "_id_usuario",
+        "_plataforma_interacao",
+        "_timestamp_epoch",
+        "_tipo_interacao",
+        "_watch_duration_seconds",
+        "_comment_text",
+    )
 
     def __init__(
         self,
         conteudo_associado: "Conteudo",
         id_usuario: str,
-        timestamp_interacao: str,
+        timestamp_interacao: str | datetime | int,
         plataforma_interacao: "Plataforma",
-        tipo_interacao: str,
+        tipo_interacao: str | TipoInteracao,
         watch_duration_seconds: str,
         comment_text: str = "",
     ) -> None:
@@ -24,16 +39,11 @@ class Interacao:
         self._id_usuario = int(id_usuario)
         self._plataforma_interacao = plataforma_interacao
 
-        if isinstance(timestamp_interacao, str):
-            self._timestamp_interacao = datetime.fromisoformat(timestamp_interacao)
-        else:
-            self._timestamp_interacao = timestamp_interacao
+        # Guardado em segundos desde 1970 (UTC); o datetime só é montado quando a propriedade é lida
+        self._timestamp_epoch = timestamp_para_epoch(timestamp_interacao)
 
-        if tipo_interacao not in self.TIPOS_INTERACAO_VALIDOS:
-            raise ValueError(
-                f"Tipo de interação '{tipo_interacao}' inválido. Permitidos: {self.TIPOS_INTERACAO_VALIDOS}"
-            )
-        self._tipo_interacao = tipo_interacao
+        # Guardado como código (membro de TipoInteracao), e não como uma string nova por linha
+        self._tipo_interacao = TipoInteracao.de_texto(tipo_interacao)
 
         self._watch_duration_seconds = max(0, int(watch_duration_seconds or 0))
         self._comment_text = (comment_text or "").strip()
@@ -55,11 +65,21 @@ class Interacao:
         return self._plataforma_interacao
 
     @property
-    def timestamp_interacao(self):
-        return self._timestamp_interacao
+    def timestamp_interacao(self) -> datetime:
+        return epoch_para_datetime(self._timestamp_epoch)
+
+    @property
+    def timestamp_epoch(self) -> int:
+        return self._timestamp_epoch
 
+    # Texto do tipo, como no CSV (sempre o mesmo objeto str para cada tipo)
     @property
     def tipo_interacao(self):
+        return self._tipo_interacao.texto
+
+    # Código do tipo, para comparações entre inteiros nos relatórios
+    @property
+    def codigo_tipo(self) -> TipoInteracao:
         return self._tipo_interacao
 
     @property
@@ -71,10 +91,10 @@ class Interacao:
         return self._comment_text
 
     def is_engajamento(self):
-        return self._tipo_interacao in {"like", "share", "comment"}
+        return self._tipo_interacao in TIPOS_ENGAJAMENTO
 
     def is_comentario(self):
-        return self._tipo_interacao == "comment" and bool(self._comment_text)
+        return self._tipo_interacao is TipoInteracao.COMMENT and bool(self._comment_text)
 
     def __str__(self):
         relatorio = f"Interação do tipo: '{self.tipo_interacao}'\n"
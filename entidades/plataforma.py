@@ -1,38 +1,109 @@
+from .tipo_interacao import TIPOS_ENGAJAMENTO, TipoInteracao
+
+
 class Plataforma:
+    __slots__ = (
+        "_id_plataforma",
+        "_nome_plataforma",
+        "_total_interacoes",
+        "_tempo_total_consumo",
+        "_total_visualizacoes_validas",
+        "_contagem_por_tipo",
+    )
+
     # Construtor
     def __init__(self, id_plataforma: int, nome_plataforma: str) -> None:
-        self.__id_plataforma = id_plataforma
-        self.__nome_plataforma = nome_plataforma
+        self._id_plataforma = id_plataforma
+        self._nome_plataforma = nome_plataforma
+
+        # Agregados mantidos incrementalmente a cada interação registrada na plataforma
+        self._total_interacoes: int = 0
+        self._tempo_total_consumo: int = 0
+        self._total_visualizacoes_validas: int = 0  # interações com watch_duration_seconds > 0
+        self._contagem_por_tipo: list[int] = [0] * len(TipoInteracao)  # indexada pelo código do tipo
 
     # Getters e Setters
 
     # Property para nome_plataforma
     @property
     def nome_plataforma(self):
-        return self.__nome_plataforma
+        return self._nome_plataforma
 
     @nome_plataforma.setter
     def nome_plataforma(self, novo_nome):
         """Define o nome da plataforma, garantindo que não seja vazio."""
         if not novo_nome.strip():
             raise ValueError("O nome da plataforma não pode ser vazio.")
-        self.__nome_plataforma = novo_nome.strip()
+        self._nome_plataforma = novo_nome.strip()
 
     # Property para id_plataforma
     @property
     def id_plataforma(self):
-        return self.__id_plataforma
+        return self._id_plataforma
 
     @id_plataforma.setter
     def id_plataforma(self, novo_id):
         """Define o ID da plataforma, garantindo que seja um inteiro não negativo."""
         if novo_id is not None and (not isinstance(novo_id, int) or novo_id < 0):
             raise ValueError("O ID da plataforma deve ser um inteiro não negativo.")
-        self.__id_plataforma = novo_id
+        self._id_plataforma = novo_id
 
     @property
     def nome_plataforma(self) -> str:
-        return self.__nome_plataforma
+        return self._nome_plataforma
+
+    @property
+    def total_interacoes(self) -> int:
+        return self._total_interacoes
+
+    @property
+    def tempo_total_consumo(self) -> int:
+        return self._tempo_total_consumo
+
+    @property
+    def total_visualizacoes_validas(self) -> int:
+        return self._total_visualizacoes_validas
+
+    @property
+    def contagem_por_tipo(self) -> dict[str, int]:
+        return {tipo.texto: quantidade for tipo, quantidade in zip(TipoInteracao, self._contagem_por_tipo) if quantidade}
+
+    @property
+    def total_comentarios(self) -> int:
+        return self._contagem_por_tipo[TipoInteracao.COMMENT]
+
+    @property
+    def total_engajamentos(self) -> int:
+        return sum(self._contagem_por_tipo[tipo] for tipo in TIPOS_ENGAJAMENTO)
+
+    # Métodos
+    """
+    Contabiliza uma interação ocorrida na plataforma, sem armazenar o objeto.
+
+    - Melhor caso (Ω): O(1), atualização direta dos contadores.
+    - Caso médio (Θ): O(1), idem.
+    - Pior caso (O): O(1), idem.
+
+    Justificativa: apenas soma e incrementa contadores; nenhuma estrutura cresce com o número de interações.
+    """
+    def registrar_interacao(self, interacao) -> None:
+        self.contabilizar_interacao(interacao.codigo_tipo, interacao.watch_duration_seconds)
+
+    # Mesma contabilização, a partir dos campos já extraídos (usado pelo armazenamento colunar)
+    def contabilizar_interacao(self, codigo_tipo: int, watch_duration_seconds: int) -> None:
+        self._total_interacoes += 1
+        self._tempo_total_consumo += watch_duration_seconds
+        if watch_duration_seconds > 0:
+            self._total_visualizacoes_validas += 1
+        self._contagem_por_tipo[codigo_tipo] += 1
+
+    # Restaura os agregados salvos em um snapshot (ver analise.snapshot), sem reprocessar as interações
+    def restaurar_agregados(self, total_interacoes: int, tempo_total_consumo: int,
+                            total_visualizacoes_validas: int, contagem_por_tipo: dict[str, int]) -> None:
+        self._total_interacoes = total_interacoes
+        self._tempo_total_consumo = tempo_total_consumo
+        self._total_visualizacoes_validas = total_visualizacoes_validas
+        self._contagem_por_tipo = [contagem_por_tipo.get(tipo.texto, 0) for tipo in TipoInteracao]
 
     # Metodos Magicos
 
@@ -44,22 +115,22 @@ class Plataforma:
 
     def __repr__(self):
         """Retorna uma representação legível da plataforma."""
-        return f"Plataforma(id={self.__id_plataforma}, nome='{self.__nome_plataforma}')"
+        return f"Plataforma(id={self._id_plataforma}, nome='{self._nome_plataforma}')"
 
     def __eq__(self, other):
         """Compara plataformas com base no nome."""
         return (
             isinstance(other, Plataforma)
-            and self.__nome_plataforma == other.__nome_plataforma
+            and self._nome_plataforma == other._nome_plataforma
         )
 
     def __hash__(self):
         """Permite uso de Plataforma como chave em dicionários/sets."""
-        return hash(self.__nome_plataforma)
+        return hash(self._nome_plataforma)
 
     # Metodo magico para comparação de plataformas para ordenação
     def __lt__(self, other):
         """Compara plataformas com base no nome para ordenação."""
         if not isinstance(other, Plataforma):
             return NotImplemented
-        return self.__nome_plataforma < other.__nome_plataforma
\ No newline at end of file
+        return self._nome_plataforma < other._nome_plataforma
\ No newline at end of file
@@ -0,0 +1,39 @@
+from enum import IntEnum
+
+
+# Tipos de interação codificados como inteiros pequenos.
+# O código de cada tipo é a sua posição nos contadores por tipo das entidades e na coluna 'codigos_tipo'
+# do armazenamento colunar; o texto (como aparece no CSV) é o nome do membro em minúsculas.
+class TipoInteracao(IntEnum):
+    VIEW_START = 0
+    LIKE = 1
+    SHARE = 2
+    COMMENT = 3
+
+    @property
+    def texto(self) -> str:
+        return _TEXTOS[self]
+
+    # Complexidade: Θ(1) - consulta em dicionário.
+    # Converte o texto do CSV (ou um TipoInteracao) no membro correspondente; lança ValueError se for inválido.
+    @classmethod
+    def de_texto(cls, texto) -> "TipoInteracao":
+        if isinstance(texto, TipoInteracao):
+            return texto
+        tipo = _POR_TEXTO.get(texto) if isinstance(texto, str) else None
+        if tipo is None:
+            raise ValueError(f"Tipo de interação '{texto}' inválido. Permitidos: {TEXTOS_TIPO_INTERACAO}")
+        return tipo
+
+    def __str__(self) -> str:
+        return self.texto
+
+
+_TEXTOS = {tipo: tipo.name.lower() for tipo in TipoInteracao}
+_POR_TEXTO = {texto: tipo for tipo, texto in _TEXTOS.items()}
+
+# Textos aceitos no campo 'tipo_interacao' do CSV
+TEXTOS_TIPO_INTERACAO = set(_POR_TEXTO)
+
+# Tipos de interação considerados como engajamento ativo
+TIPOS_ENGAJAMENTO = (TipoInteracao.LIKE, TipoInteracao.SHARE, TipoInteracao.COMMENT)
@@ -1,17 +1,54 @@
+from .tipo_interacao import TipoInteracao
+
+
 class Usuario:
+    __slots__ = (
+        "_id_usuario",
+        "_interacoes_realizadas",
+        "_tempo_total_consumo",
+        "_total_visualizacoes_validas",
+        "_contagem_por_tipo",
+    )
+
     # Construtor
     def __init__(self, id_usuario: int) -> None:
-        self.__id_usuario: int = id_usuario
-        self.__interacoes_realizadas: list = []  # lista com objetos Interacao
+        self._id_usuario: int = id_usuario
+        self._interacoes_realizadas: list = []  # lista com objetos Interacao
+
+        # Agregados mantidos incrementalmente a cada interação registrada,
+        # para que os relatórios não precisem varrer a lista de interações
+        self._tempo_total_consumo: int = 0
+        self._total_visualizacoes_validas: int = 0  # interações com watch_duration_seconds > 0
+        self._contagem_por_tipo: list[int] = [0] * len(TipoInteracao)  # indexada pelo código do tipo
 
     # Getters e setters
     @property
     def id_usuario(self):
-        return self.__id_usuario
+        return self._id_usuario
 
     @property
     def interacoes_realizadas(self):
-        return self.__interacoes_realizadas
+        return self._interacoes_realizadas
+
+    @property
+    def tempo_total_consumo(self) -> int:
+        return self._tempo_total_consumo
+
+    @property
+    def total_visualizacoes_validas(self) -> int:
+        return self._total_visualizacoes_validas
+
+    @property
+    def contagem_por_tipo(self) -> dict[str, int]:
+        return {tipo.texto: quantidade for tipo, quantidade in zip(TipoInteracao, self._contagem_por_tipo) if quantidade}
+
+    @property
+    def total_comentarios(self) -> int:
+        return self._contagem_por_tipo[TipoInteracao.COMMENT]
+
+    @property
+    def total_interacoes(self) -> int:
+        return len(self._interacoes_realizadas)
 
     # Métodos
     """
@@ -21,10 +58,47 @@ class Usuario:
     - Caso médio (Θ): O(1), operação constante típica de `list.append()`.
     - Pior caso (O): O(1), mesmo em caso de listas grandes (não exige realocação visível em Python).
 
-    Justificativa: a operação de adicionar ao final da lista é constante em listas Python dinâmicas.
+    Justificativa: a operação de adicionar ao final da lista é constante em listas Python dinâmicas,
+    e a atualização dos agregados (tempo total, visualizações válidas e contagem por tipo) também é O(1).
     """
     def registrar_interacao(self, interacao):
-        self.__interacoes_realizadas.append(interacao)
+        self._interacoes_realizadas.append(interacao)
+        self._acumular_agregados(interacao.codigo_tipo, interacao.watch_duration_seconds)
+
+    """
+    Troca a lista de objetos Interacao por uma visão do armazenamento colunar do sistema.
+    A partir daí, as interações devem ser registradas com `registrar_indice_colunar`.
+
+    - Complexidade: O(1), apenas substitui a referência.
+    """
+    def usar_visao_colunar(self, visao) -> None:
+        self._interacoes_realizadas = visao
+
+    """
+    Registra uma interação já gravada no armazenamento colunar, pelo índice da sua linha.
+
+    - Melhor caso (Ω): O(1), append do índice na visão.
+    - Caso médio (Θ): O(1), idem, mais a atualização dos agregados.
+    - Pior caso (O): O(1), idem.
+
+    Justificativa: nenhum objeto Interacao é criado; só o índice (8 bytes) é guardado.
+    """
+    def registrar_indice_colunar(self, indice: int, codigo_tipo: int, watch_duration_seconds: int) -> None:
+        self._interacoes_realizadas.adicionar_indice(indice)
+        self._acumular_agregados(codigo_tipo, watch_duration_seconds)
+
+    # Restaura os agregados salvos em um snapshot (ver analise.snapshot), sem reprocessar as interações
+    def restaurar_agregados(self, tempo_total_consumo: int, total_visualizacoes_validas: int,
+                            contagem_por_tipo: dict[str, int]) -> None:
+        self._tempo_total_consumo = tempo_total_consumo
+        self._total_visualizacoes_validas = total_visualizacoes_validas
+        self._contagem_por_tipo = [contagem_por_tipo.get(tipo.texto, 0) for tipo in TipoInteracao]
+
+    def _acumular_agregados(self, codigo_tipo: int, duracao: int) -> None:
+        self._tempo_total_consumo += duracao
+        if duracao > 0:
+            self._total_visualizacoes_validas += 1
+        self._contagem_por_tipo[codigo_tipo] += 1
 
     """
     Filtra as interações realizadas por tipo.
@@ -33,13 +107,17 @@ class Usuario:
     - Caso médio (Θ): O(n), onde n é o número de interações.
     - Pior caso (O): O(n), se nenhuma for do tipo buscado.
 
-    Justificativa: percorre todas as interações verificando seu tipo.
+    Justificativa: percorre todas as interações verificando seu tipo (comparação entre códigos inteiros).
     """
     def obter_interacoes_por_tipo(
         self, tipo_desejado: str
     ) -> list:  # filtra interacoes_realizadas
+        try:
+            codigo = TipoInteracao.de_texto(tipo_desejado)
+        except ValueError:
+            return []
         return [
-            i for i in self.interacoes_realizadas if i.tipo_interacao == tipo_desejado
+            i for i in self.interacoes_realizadas if i.codigo_tipo == codigo
         ]
 
     """
@@ -94,12 +172,12 @@ class Usuario:
 
     # Métodos mágicos
     def __str__(self):
-        interacoes_formatadas = "\n".join(str(i) for i in self.__interacoes_realizadas)
+        interacoes_formatadas = "\n".join(str(i) for i in self._interacoes_realizadas)
         """Retorna o id do usuário e interações como string formatada"""
         return (
-            f"ID do Usuário:{self.__id_usuario}\nInterações:\n{interacoes_formatadas}"
+            f"ID do Usuário:{self._id_usuario}\nInterações:\n{interacoes_formatadas}"
         )
 
     def __repr__(self):
         """Retorna uma representação legível do usuário"""
-        return f"Usuário(id={self.__id_usuario}, interações='{self.__interacoes_realizadas}')"
+        return f"Usuário(id={self._id_usuario}, interações='{self._interacoes_realizadas}')"
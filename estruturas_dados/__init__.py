@@ -1,2 +1,6 @@
 from .fila import Fila
 from .arvore_binaria_busca import ArvoreBinariaBusca
+from .selecao_top_k import selecionar_top_k
+from .armazenamento_colunar import ArmazenamentoColunar, VisaoInteracoes
+from .indice_temporal import IndiceTemporal
+from .tabela_simbolos import TabelaSimbolos
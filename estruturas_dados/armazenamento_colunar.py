@@ -0,0 +1,222 @@
+# Armazenamento colunar das interações: em vez de um objeto Interacao por linha do CSV,
+# cada campo fica em um array tipado (módulo 'array'), e a i-ésima posição de todos os arrays forma a linha i.
+# Os comentários ficam em uma tabela de símbolos separada (textos repetidos são guardados uma vez só).
+from array import array
+
+from entidades.tipo_interacao import TipoInteracao
+# Conversões usadas na coluna de timestamps (importadas daqui pelo restante do projeto)
+from .conversor_timestamp import datetime_para_epoch, epoch_para_datetime
+from .tabela_simbolos import TabelaSimbolos
+
+# O código de cada tipo de interação (TipoInteracao) é a sua posição nesta tupla
+TIPOS_INTERACAO = tuple(tipo.texto for tipo in TipoInteracao)
+CODIGOS_TIPO_INTERACAO = {tipo.texto: tipo for tipo in TipoInteracao}
+
+# Índice usado na coluna de comentários para linhas sem texto
+SEM_COMENTARIO = -1
+
+# Nome e typecode (módulo 'array') de cada coluna; todos os tamanhos são fixos entre plataformas
+TIPOS_COLUNAS = {
+    "ids_conteudo": "q",
+    "ids_usuario": "q",
+    "timestamps": "q",
+    "codigos_plataforma": "I",
+    "codigos_tipo": "B",
+    "duracoes": "q",
+    "indices_comentario": "i",
+}
+COLUNAS = tuple(TIPOS_COLUNAS)
+
+class ArmazenamentoColunar:
+    def __init__(self) -> None:
+        self._ids_conteudo: array = array("q")
+        self._ids_usuario: array = array("q")
+        self._timestamps: array = array("q")  # segundos desde 1970-01-01 (UTC)
+        self._codigos_plataforma: array = array("I")
+        self._codigos_tipo: array = array("B")
+        self._duracoes: array = array("q")
+        self._indices_comentario: array = array("i")  # posição na tabela de comentários, ou SEM_COMENTARIO
+
+        self._comentarios: TabelaSimbolos = TabelaSimbolos()
+
+        # False quando as colunas são memoryviews somente leitura (por exemplo, de um snapshot mapeado em memória)
+        self._gravavel: bool = True
+
+    """
+    Cria um armazenamento a partir de colunas já prontas (arrays ou memoryviews), sem copiá-las.
+
+    Args:
+        colunas (dict): mapeia o nome de cada coluna (ver COLUNAS) para um objeto com protocolo de buffer.
+        comentarios (list[str]): tabela de comentários, indexada pela coluna 'indices_comentario'.
+
+    - Complexidade: O(1), apenas guarda as referências. Se as colunas forem somente leitura,
+      a primeira chamada a `adicionar` as copia para arrays (O(n), uma única vez).
+    """
+    @classmethod
+    def de_colunas(cls, colunas: dict, comentarios: list[str]) -> "ArmazenamentoColunar":
+        armazenamento = cls()
+        for nome in COLUNAS:
+            setattr(armazenamento, f"_{nome}", colunas[nome])
+        armazenamento._comentarios = TabelaSimbolos(comentarios)
+        armazenamento._gravavel = all(isinstance(colunas[nome], array) for nome in COLUNAS)
+        return armazenamento
+
+    # Converte colunas somente leitura em arrays, para permitir novas linhas (cópia única, O(n))
+    def _garantir_gravavel(self) -> None:
+        for nome in COLUNAS:
+            coluna = getattr(self, f"_{nome}")
+            if not isinstance(coluna, array):
+                setattr(self, f"_{nome}", array(TIPOS_COLUNAS[nome], coluna))
+        self._gravavel = True
+
+    # Complexidade:
+    # Pior caso:   O(1) amortizado - cada array cresce ao fim, como uma lista Python.
+    # Melhor caso: Ω(1) - idem.
+    # Caso médio:  Θ(1) - a internação do comentário é uma consulta em dicionário.
+    # --------------------------------------------------------------------------------------------
+    # Lança OverflowError/TypeError se algum valor não couber na sua coluna; nesse caso, nenhuma coluna é alterada.
+    def adicionar(
+        self,
+        id_conteudo: int,
+        id_usuario: int,
+        timestamp_epoch: int,
+        codigo_plataforma: int,
+        codigo_tipo: int,
+        duracao: int,
+        comentario: str = "",
+    ) -> int:
+        if not self._gravavel:
+            self._garantir_gravavel()
+
+        indice = len(self._ids_conteudo)
+
+        try:
+            self._ids_conteudo.append(id_conteudo)
+            self._ids_usuario.append(id_usuario)
+            self._timestamps.append(timestamp_epoch)
+            self._codigos_plataforma.append(codigo_plataforma)
+            self._codigos_tipo.append(codigo_tipo)
+            self._duracoes.append(duracao)
+            self._indices_comentario.append(self._internar_comentario(comentario))
+        except (OverflowError, TypeError):
+            # Valor que não cabe no typecode da coluna: desfaz os appends já feitos,
+            # para que todas as colunas continuem com o mesmo número de linhas
+            self._descartar_a_partir_de(indice)
+            raise
+
+        return indice
+
+    # Complexidade: O(1) - remove no máximo uma posição do fim de cada coluna.
+    def _descartar_a_partir_de(self, indice: int) -> None:
+        for nome in COLUNAS:
+            coluna = getattr(self, f"_{nome}")
+            del coluna[indice:]
+
+    # Complexidade: Θ(1) - consulta/inserção em dicionário.
+    def _internar_comentario(self, comentario: str) -> int:
+        if not comentario:
+            return SEM_COMENTARIO
+        return self._comentarios.codificar(comentario)
+
+    # Complexidade: Θ(1) - leitura direta de uma posição de cada coluna.
+    # Retorna (id_conteudo, id_usuario, timestamp_epoch, codigo_plataforma, codigo_tipo, duracao, comentario).
+    def linha(self, indice: int) -> tuple:
+        return (
+            self._ids_conteudo[indice],
+            self._ids_usuario[indice],
+            self._timestamps[indice],
+            self._codigos_plataforma[indice],
+            self._codigos_tipo[indice],
+            self._duracoes[indice],
+            self.comentario(indice),
+        )
+
+    def comentario(self, indice: int) -> str:
+        posicao = self._indices_comentario[indice]
+        return "" if posicao == SEM_COMENTARIO else self._comentarios.decodificar(posicao)
+
+    # Acesso às colunas completas (sem cópia)
+    @property
+    def ids_conteudo(self) -> array:
+        return self._ids_conteudo
+
+    @property
+    def ids_usuario(self) -> array:
+        return self._ids_usuario
+
+    @property
+    def timestamps(self) -> array:
+        return self._timestamps
+
+    @property
+    def codigos_plataforma(self) -> array:
+        return self._codigos_plataforma
+
+    @property
+    def codigos_tipo(self) -> array:
+        return self._codigos_tipo
+
+    @property
+    def duracoes(self) -> array:
+        return self._duracoes
+
+    @property
+    def indices_comentario(self) -> array:
+        return self._indices_comentario
+
+    @property
+    def comentarios(self) -> list[str]:
+        return self._comentarios.simbolos
+
+    def __len__(self) -> int:
+        return len(self._ids_conteudo)
+
+
+class VisaoInteracoes:
+    """
+    Visão das interações de um único usuário ou conteúdo dentro do ArmazenamentoColunar.
+
+    Guarda apenas os índices das linhas (8 bytes por interação) e se comporta como uma sequência:
+    ao ser indexada ou iterada, materializa objetos Interacao sob demanda através da função
+    'materializar' recebida do sistema. Para agregações, 'valores' lê a coluna diretamente, sem criar objetos.
+    """
+
+    def __init__(self, armazenamento: ArmazenamentoColunar, materializar) -> None:
+        self._armazenamento = armazenamento
+        self._materializar = materializar
+        self._indices: array = array("q")
+
+    # Usa uma sequência de índices já pronta (por exemplo, uma fatia de um snapshot), sem copiá-la
+    def usar_indices(self, indices) -> None:
+        self._indices = indices
+
+    # Complexidade: O(1) amortizado - append no array de índices
+    # (se os índices vierem de um buffer somente leitura, são copiados para um array na primeira inserção).
+    def adicionar_indice(self, indice: int) -> None:
+        if not isinstance(self._indices, array):
+            self._indices = array("q", self._indices)
+        self._indices.append(indice)
+
+    @property
+    def indices(self):
+        return self._indices
+
+    # Complexidade: O(k) - percorre as k linhas da visão, lendo apenas a coluna pedida.
+    def valores(self, coluna: str):
+        dados = getattr(self._armazenamento, coluna)
+        return (dados[indice] for indice in self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __bool__(self) -> bool:
+        return len(self._indices) > 0
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return [self._materializar(indice) for indice in self._indices[posicao]]
+        return self._materializar(self._indices[posicao])
+
+    def __iter__(self):
+        for indice in self._indices:
+            yield self._materializar(indice)
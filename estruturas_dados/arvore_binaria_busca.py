@@ -1,47 +1,258 @@
-from bintrees import AVLTree
+from bisect import bisect_left, bisect_right, insort
+
+# Índice ordenado por chave, com a mesma interface da antiga árvore AVL (bintrees).
+# Estrutura híbrida: um dicionário (tabela hash) guarda chave -> elemento, o que dá busca em O(1),
+# e uma lista ordenada de chaves, dividida em blocos de até 2 * CARGA_BLOCO chaves, dá o percurso em ordem crescente
+# e as consultas por faixa de chaves (intervalo, piso, teto, paginação) por busca binária: primeiro nos máximos
+# dos blocos, depois dentro do bloco.
+# Como os IDs costumam chegar em ordem crescente, a maioria das inserções apenas acrescenta a chave ao último bloco.
+# Inserções fora de ordem e remoções ficam pendentes até a próxima consulta ordenada, que as aplica uma a uma
+# (insort/del em um único bloco, O(log n + CARGA_BLOCO) cada) ou, se forem muitas, reconstrói os blocos de uma vez.
+
+# Chaves por bloco ao reconstruir; um bloco com mais do que o dobro disso é dividido em blocos desse tamanho
+CARGA_BLOCO = 1000
+
+# Com mais de 1/FRACAO_RECONSTRUCAO das chaves pendentes, reconstruir os blocos (O(n log n)) sai mais barato
+# do que posicionar as pendentes uma a uma; o custo fica amortizado em O(log n) por alteração
+FRACAO_RECONSTRUCAO = 16
 
 
 class ArvoreBinariaBusca:
     def __init__(self) -> None:
-        self._arvore_binaria: AVLTree = AVLTree()
+        self._elementos: dict[int, object] = {}
+        # Chaves em ordem crescente, em blocos; _maximos[i] é a maior chave de _blocos[i] (busca binária entre blocos)
+        self._blocos: list[list[int]] = []
+        self._maximos: list[int] = []
+        # Chaves novas menores que a maior chave dos blocos, ainda não posicionadas
+        self._chaves_pendentes: list[int] = []
+        # Chaves removidas do dicionário que ainda constam nos blocos ou nas pendentes
+        self._chaves_removidas: set[int] = set()
+        # Muda a cada alteração dos blocos; 'intervalo' a compara para se reposicionar depois de cada elemento
+        self._versao_blocos = 0
 
     # Complexidade:
-    # Pior caso:   O(log n) - mesmo em situações mais desfavoráveis, a árvore se ajusta para manter a altura e organização controladas, mantendo a inserção eficiente.
-    # Melhor caso: Ω(log n) - a chave é inserida em uma parte já balanceada da árvore sem necessidade de reorganização, o que mantém a eficiência da inserção.
-    # Caso médio:  Θ(log n) - a chave é inserida normalmente e a árvore realiza algumas rotações para se redistribuir, garantindo que a altura continue próxima a logaritmo do número de nós.
+    # Pior caso:   O(1) - inserção no dicionário e append no último bloco ou nas chaves pendentes;
+    #                     o posicionamento de uma chave fora de ordem fica para a próxima consulta ordenada.
+    # Melhor caso: Ω(1) - a chave já existe e apenas o elemento é substituído.
+    # Caso médio:  Θ(1) - idem ao pior caso.
     def inserir_elemento(self, chave: int, elemento: object) -> None:
-        self._arvore_binaria.insert(chave, elemento)
+        if chave in self._chaves_removidas:
+            # A chave ainda está nos blocos ou nas pendentes (remoção pendente): basta cancelar a remoção
+            self._chaves_removidas.discard(chave)
+        elif chave not in self._elementos:
+            maximos = self._maximos
+            if maximos and chave < maximos[-1]:
+                self._chaves_pendentes.append(chave)
+            elif maximos:
+                # Caminho da carga com IDs crescentes: o último bloco pode passar do limite aqui, e é dividido na
+                # próxima consulta ordenada. Acrescentar ao fim não desloca nenhuma posição, então a versão não muda.
+                self._blocos[-1].append(chave)
+                maximos[-1] = chave
+            else:
+                self._blocos.append([chave])
+                maximos.append(chave)
+        self._elementos[chave] = elemento
 
     # Complexidade:
-    # Pior caso:   O(log n) - mesmo removendo nós que exigem vários ajustes, a árvore garante que a operação seja eficiente devido ao autobalanceamento.
-    # Melhor caso: Ω(log n) - o nó a ser removido precisa de poucas reorganizações para manter o balanceamento.
-    # Caso médio:  Θ(log n) - a remoção envolve buscar o nó e realizar algumas reorganizações para rebalancear a árvore.
+    # Pior caso:   O(1) - remoção no dicionário; a chave só é marcada como removida.
+    # Melhor caso: Ω(1) - idem.
+    # Caso médio:  Θ(1) - idem; a chave sai do seu bloco (O(log n + CARGA_BLOCO)) na próxima consulta ordenada.
+    # --------------------------------------------------------------------------------------------
+    # Assim como na AVLTree, remover uma chave inexistente gera KeyError.
     def remover_elemento(self, chave: int) -> None:
-        self._arvore_binaria.remove(chave)
+        del self._elementos[chave]
+        self._chaves_removidas.add(chave)
 
     # Complexidade:
-    # Pior caso:   O(log n) - a estrutura mantém a altura controlada devido o autobalanceamento, garantindo que seja eficiente mesmo no pior caso.
-    # Melhor caso: Ω(1) - o elemento buscado está na raiz ou próximo dela, o que permite que a busca seja muito rápida.
-    # Caso médio:  Θ(log n) - a busca percorre um caminho proporcional à altura da árvore balanceada.
+    # Pior caso:   O(n) - muitas chaves colidindo no mesmo bucket da tabela hash (não ocorre com IDs inteiros).
+    # Melhor caso: Ω(1) - acesso direto pela chave.
+    # Caso médio:  Θ(1) - consulta em dicionário, sem exceções quando a chave não existe.
+    def get(self, chave: int, padrao: object | None = None) -> object | None:
+        return self._elementos.get(chave, padrao)
+
+    # Complexidade: igual a 'get'.
     # --------------------------------------------------------------------------------------------
     # Usando dicas de tipo, a partir da versão 3.10, é possível definir os possíveis retornos com o pipe (|).
     # Caso fosse em versões anteriores à 3.10, seria necessário importar 'Union' da biblioteca 'typing', daí o a dica de retorno seria: Union[Conteudo, None].
     def buscar_elemento(self, chave: int) -> object | None:
-        # É extremamente necessário que seja implementado um try-except para o caso de tentativa de localização de chave pois ao não localizar a chave solicitada,
-        # é retornado um 'raise' (instrução para gerar uma exceção).
-        try:
-            return self._arvore_binaria.get_value(chave)
-        except Exception:
-            return None
+        return self._elementos.get(chave)
 
     # Complexidade:
-    # Pior caso:   O(n) - visita todos os nós, independentemente do tamanho e distribuição da árvore.
-    # Melhor caso: Ω(n) - mesmo no melhor cenário, é necessário visitar todos os nós da árvore.
-    # Caso médio:  Θ(n) - percorre todos os nós com custo constante por visita.
+    # Pior caso:   O(n log n) - muitas alterações pendentes (mais de n / FRACAO_RECONSTRUCAO) e os blocos são reconstruídos.
+    # Melhor caso: Ω(n) - sem alterações pendentes; cada elemento é visitado uma vez.
+    # Caso médio:  Θ(n + m (log n + CARGA_BLOCO)) - as m alterações pendentes são aplicadas nos blocos antes do percurso.
     def percurso_in_order(self) -> list:
-        conteudos: list = []
+        self._aplicar_pendentes()
+
+        elementos = self._elementos
+        return [elementos[chave] for bloco in self._blocos for chave in bloco]
+
+    # Complexidade:
+    # Pior caso:   O(log n + k) - buscas binárias do início da faixa e visita das k chaves dentro dela, mais as
+    #                             alterações pendentes (amortizado O(log n + CARGA_BLOCO) por inserção/remoção feita
+    #                             desde a última consulta ordenada).
+    # Melhor caso: Ω(log n) - faixa vazia, sem alterações pendentes.
+    # Caso médio:  Θ(log n + k) - idem ao pior caso.
+    # --------------------------------------------------------------------------------------------
+    # Gerador preguiçoso dos elementos com inicio <= chave <= fim, em ordem crescente de chave.
+    # Limites None deixam a faixa aberta. Elementos removidos durante a iteração são pulados; se os blocos mudarem
+    # entre dois elementos, a iteração continua a partir da última chave devolvida.
+    def intervalo(self, inicio: int | None = None, fim: int | None = None):
+        self._aplicar_pendentes()
+        elementos = self._elementos
+
+        indice_bloco, posicao = (0, 0) if inicio is None else self._localizar(inicio, apos=False)
+        versao = self._versao_blocos
+        while indice_bloco < len(self._blocos):
+            bloco = self._blocos[indice_bloco]
+            if posicao >= len(bloco):
+                indice_bloco, posicao = indice_bloco + 1, 0
+                continue
+
+            chave = bloco[posicao]
+            if fim is not None and chave > fim:
+                return
+            elemento = elementos.get(chave, _AUSENTE)
+            if elemento is not _AUSENTE:
+                yield elemento
+
+            if self._versao_blocos != versao:
+                versao = self._versao_blocos
+                indice_bloco, posicao = self._localizar(chave, apos=True)
+            else:
+                posicao += 1
+
+    # Complexidade: O(log n) - buscas binárias (mais as alterações pendentes, como em 'intervalo').
+    # Retorna o elemento de maior chave <= 'chave', ou None se não existir.
+    def piso(self, chave: int) -> object | None:
+        self._aplicar_pendentes()
+        indice_bloco, posicao = self._localizar(chave, apos=True)
+        if posicao > 0:
+            return self._elementos[self._blocos[indice_bloco][posicao - 1]]
+        if indice_bloco > 0:
+            return self._elementos[self._blocos[indice_bloco - 1][-1]]
+        return None
+
+    # Complexidade: O(log n) - buscas binárias (mais as alterações pendentes, como em 'intervalo').
+    # Retorna o elemento de menor chave >= 'chave', ou None se não existir.
+    def teto(self, chave: int) -> object | None:
+        self._aplicar_pendentes()
+        indice_bloco, posicao = self._localizar(chave, apos=False)
+        if indice_bloco < len(self._blocos):
+            return self._elementos[self._blocos[indice_bloco][posicao]]
+        return None
+
+    # Complexidade: O(log n + k) - buscas binárias do cursor e cópia dos k elementos da página
+    # (mais as alterações pendentes, como em 'intervalo').
+    # --------------------------------------------------------------------------------------------
+    # Paginação por cursor: retorna até 'limite' elementos com chave > 'apos' (ou desde o início, se None)
+    # e o cursor da próxima página (a última chave devolvida), ou None quando não houver mais elementos.
+    # Como o cursor é uma chave, e não uma posição, inserções e remoções entre páginas não duplicam nem pulam elementos.
+    def pagina(self, apos: int | None = None, limite: int = 100) -> tuple[list, int | None]:
+        if limite <= 0:
+            raise ValueError("O limite da página deve ser maior que zero.")
+
+        self._aplicar_pendentes()
+        blocos = self._blocos
+        indice_bloco, posicao = (0, 0) if apos is None else self._localizar(apos, apos=True)
+
+        chaves_pagina = []
+        while len(chaves_pagina) < limite and indice_bloco < len(blocos):
+            bloco = blocos[indice_bloco]
+            fim_fatia = posicao + limite - len(chaves_pagina)
+            chaves_pagina.extend(bloco[posicao:fim_fatia])
+            if fim_fatia < len(bloco):
+                posicao = fim_fatia
+            else:
+                indice_bloco, posicao = indice_bloco + 1, 0
+
+        proximo = chaves_pagina[-1] if chaves_pagina and indice_bloco < len(blocos) else None
+        return [self._elementos[chave] for chave in chaves_pagina], proximo
+
+    # (bloco, posição) da primeira chave >= 'chave' (ou > 'chave', com apos=True); (len(blocos), 0) se não houver.
+    def _localizar(self, chave: int, apos: bool) -> tuple[int, int]:
+        indice_bloco = bisect_left(self._maximos, chave)
+        if indice_bloco == len(self._blocos):
+            return indice_bloco, 0
+        bloco = self._blocos[indice_bloco]
+        posicao = bisect_right(bloco, chave) if apos else bisect_left(bloco, chave)
+        if posicao == len(bloco):
+            return indice_bloco + 1, 0
+        return indice_bloco, posicao
+
+    # Complexidade: O(log n + CARGA_BLOCO) - busca binária do bloco e insort nele (divisão do bloco, se encher).
+    def _posicionar(self, chave: int) -> None:
+        indice_bloco = bisect_left(self._maximos, chave)
+        if indice_bloco == len(self._blocos):
+            # Maior que todas (a maior chave dos blocos foi retirada antes): fim do último bloco, ou um bloco novo
+            if self._blocos:
+                self._blocos[-1].append(chave)
+                self._maximos[-1] = chave
+            else:
+                self._blocos.append([chave])
+                self._maximos.append(chave)
+            indice_bloco = len(self._blocos) - 1
+        else:
+            insort(self._blocos[indice_bloco], chave)
+        self._dividir_bloco(indice_bloco)
+
+    # Divide o bloco em partes de CARGA_BLOCO chaves se ele tiver mais do que o dobro disso
+    def _dividir_bloco(self, indice_bloco: int) -> None:
+        bloco = self._blocos[indice_bloco]
+        if len(bloco) > 2 * CARGA_BLOCO:
+            partes = [bloco[i:i + CARGA_BLOCO] for i in range(0, len(bloco), CARGA_BLOCO)]
+            self._blocos[indice_bloco:indice_bloco + 1] = partes
+            self._maximos[indice_bloco:indice_bloco + 1] = [parte[-1] for parte in partes]
+
+    # Complexidade: O(log n + CARGA_BLOCO) - busca binária do bloco e remoção nele; blocos vazios são descartados.
+    def _retirar(self, chave: int) -> None:
+        indice_bloco, posicao = self._localizar(chave, apos=False)
+        if indice_bloco == len(self._blocos) or self._blocos[indice_bloco][posicao] != chave:
+            return
+        bloco = self._blocos[indice_bloco]
+        del bloco[posicao]
+        if not bloco:
+            del self._blocos[indice_bloco]
+            del self._maximos[indice_bloco]
+        elif posicao == len(bloco):
+            self._maximos[indice_bloco] = bloco[-1]
+
+    # Leva aos blocos as inserções fora de ordem e as remoções feitas desde a última consulta ordenada.
+    # Os blocos são listas novas a cada reconstrução e, nas alterações pontuais, _versao_blocos muda:
+    # iterações de 'intervalo' em andamento se reposicionam pela última chave devolvida.
+    def _aplicar_pendentes(self) -> None:
+        if self._blocos and len(self._blocos[-1]) > 2 * CARGA_BLOCO:
+            self._dividir_bloco(len(self._blocos) - 1)
+            self._versao_blocos += 1
+
+        pendentes, removidas = self._chaves_pendentes, self._chaves_removidas
+        if not pendentes and not removidas:
+            return
+
+        elementos = self._elementos
+        if (len(pendentes) + len(removidas)) * FRACAO_RECONSTRUCAO > len(elementos):
+            chaves = [chave for bloco in self._blocos for chave in bloco if chave in elementos]
+            chaves.extend(chave for chave in pendentes if chave in elementos)
+            # Timsort: as chaves dos blocos já formam uma sequência ordenada
+            chaves.sort()
+            self._blocos = [chaves[i:i + CARGA_BLOCO] for i in range(0, len(chaves), CARGA_BLOCO)]
+            self._maximos = [bloco[-1] for bloco in self._blocos]
+        else:
+            for chave in removidas:
+                self._retirar(chave)
+            for chave in pendentes:
+                if chave in elementos:
+                    self._posicionar(chave)
+
+        self._chaves_pendentes = []
+        removidas.clear()
+        self._versao_blocos += 1
+
+    def __contains__(self, chave: int) -> bool:
+        return chave in self._elementos
+
+    def __len__(self) -> int:
+        return len(self._elementos)
 
-        for _, elemento in self._arvore_binaria.items():
-            conteudos.append(elemento)
 
-        return conteudos
+_AUSENTE = object()
@@ -0,0 +1,36 @@
+# Conversão de timestamps para segundos desde 1970-01-01 (epoch), o formato guardado pelas interações.
+# O texto do CSV é lido por datetime.fromisoformat (implementado em C, reconhece direto o layout 'AAAA-MM-DD HH:MM:SS')
+# e o epoch sai de aritmética inteira sobre o ordinal do dia, sem as operações com timedelta; o datetime lido é
+# descartado logo em seguida, e só volta a ser montado (epoch_para_datetime) quando alguém o pede.
+# Ver benchmarks/benchmark_timestamps.py.
+from datetime import datetime, timedelta, timezone
+
+_EPOCA = datetime(1970, 1, 1)
+_ORDINAL_EPOCA = _EPOCA.toordinal()
+
+
+# Complexidade: O(1) - conversão aritmética direta.
+# Datas sem fuso horário são tratadas como UTC, para que a conversão não dependa do fuso da máquina.
+# Frações de segundo são descartadas.
+def datetime_para_epoch(momento: datetime) -> int:
+    if momento.tzinfo is not None:
+        momento = momento.astimezone(timezone.utc)
+    return ((momento.toordinal() - _ORDINAL_EPOCA) * 86400
+            + momento.hour * 3600 + momento.minute * 60 + momento.second)
+
+
+# Complexidade: O(1) - conversão aritmética direta (inversa de 'datetime_para_epoch').
+def epoch_para_datetime(segundos: int) -> datetime:
+    return _EPOCA + timedelta(seconds=segundos)
+
+
+# Complexidade: O(1) - ver datetime_para_epoch.
+# Aceita o texto do CSV, um datetime ou um epoch já convertido (int); lança ValueError/TypeError se for inválido.
+def timestamp_para_epoch(valor) -> int:
+    if isinstance(valor, str):
+        return datetime_para_epoch(datetime.fromisoformat(valor))
+    if isinstance(valor, datetime):
+        return datetime_para_epoch(valor)
+    if isinstance(valor, int) and not isinstance(valor, bool):
+        return valor
+    raise TypeError(f"Timestamp do tipo {type(valor).__name__} inválido.")
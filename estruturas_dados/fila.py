@@ -1,29 +1,127 @@
 # Para o caso desta classe (Fila), será utilizada a estrutura de dados 'deque' de forma que se comporte como uma fila (Queue).
+# A fila pode ter uma capacidade máxima e é segura para uso entre threads: produtores (leitores de CSV, conexões de rede)
+# e o consumidor que atualiza as árvores podem rodar em threads diferentes. Com a fila cheia, 'enfileirar' espera
+# por espaço (backpressure), e a memória ocupada pelas linhas pendentes fica limitada à capacidade.
+import asyncio
+import threading
 from collections import deque
+from time import monotonic
 
 
 class Fila:
-    def __init__(self):
+    def __init__(self, capacidade: int | None = None):
+        if capacidade is not None and capacidade < 1:
+            raise ValueError("A capacidade da fila deve ser um inteiro positivo.")
+
         self._fila: deque = deque()
+        self._capacidade = capacidade
+        self._fechada = False
+
+        # Uma única trava, com duas condições: uma acorda consumidores (fila não vazia), a outra produtores (fila não cheia)
+        self._trava = threading.Lock()
+        self._nao_vazia = threading.Condition(self._trava)
+        self._nao_cheia = threading.Condition(self._trava)
+
+    @property
+    def capacidade(self) -> int | None:
+        return self._capacidade
+
+    @property
+    def fechada(self) -> bool:
+        return self._fechada
 
     # Complexidade:
-    # Pior caso:   O(1) - sempre enfileira ao fim da fila
+    # Pior caso:   O(1) - sempre enfileira ao fim da fila (sem contar a espera por espaço, se a fila estiver cheia)
     # Melhor caso: Ω(1) - idem, operação constante
     # Caso médio:  Θ(1) - sempre constante, independentemente do tamanho da fila
-    def enfileirar(self, linha_csv) -> None:
-        self._fila.append(linha_csv)
+    # --------------------------------------------------------------------------------------------
+    # Com a fila cheia, espera até haver espaço; com 'bloquear=False' (ou após 'timeout' segundos) lança TimeoutError.
+    # Enfileirar em uma fila fechada lança ValueError.
+    def enfileirar(self, linha_csv, bloquear: bool = True, timeout: float | None = None) -> None:
+        with self._nao_cheia:
+            self._aguardar_espaco(bloquear, timeout)
+            self._fila.append(linha_csv)
+            self._nao_vazia.notify()
+
+    # Mesmo que 'enfileirar', para corrotinas: com a fila cheia, a espera acontece em uma thread auxiliar,
+    # sem bloquear o laço de eventos
+    async def enfileirar_async(self, linha_csv) -> None:
+        try:
+            self.enfileirar(linha_csv, bloquear=False)
+        except TimeoutError:
+            await asyncio.get_running_loop().run_in_executor(None, self.enfileirar, linha_csv)
 
     # Complexidade:
     # Pior caso:   O(1) - sempre desenfileira o primeiro da fila
     # Melhor caso: Ω(1) - idem, operação constante
     # Caso médio:  Θ(1) - sempre constante, independentemente do tamanho da fila
-    def desenfileirar(self) -> str:
-        # Verificação se a fila está vazia ou não. Se estiver, não será realizada operação alguma.
-        if self.esta_vazia():
-            return "Não foi possível remover elemento. Fila vazia."
+    # --------------------------------------------------------------------------------------------
+    # Sem bloqueio, retorna a mensagem de fila vazia se não houver elementos.
+    # Com 'bloquear=True', espera por um elemento: após 'timeout' segundos sem nenhum lança TimeoutError, como
+    # 'enfileirar' com a fila cheia, e com a fila fechada e vazia lança ValueError.
+    def desenfileirar(self, bloquear: bool = False, timeout: float | None = None) -> str:
+        with self._nao_vazia:
+            if bloquear and not self._aguardar_elemento(timeout):
+                raise TimeoutError("Fila vazia.")
+            if bloquear and not self._fila:
+                raise ValueError("Não é possível desenfileirar de uma fila fechada e vazia.")
 
-        # Retorna o elemento a ser removido e a remove o elemento ao mesmo tempo
-        return self._fila.popleft()
+            # Verificação se a fila está vazia ou não. Se estiver, não será realizada operação alguma.
+            if not self._fila:
+                return "Não foi possível remover elemento. Fila vazia."
+
+            # Retorna o elemento a ser removido e a remove o elemento ao mesmo tempo
+            elemento = self._fila.popleft()
+            self._nao_cheia.notify()
+            return elemento
+
+    # Complexidade:
+    # Pior caso:   O(k) - remove até k elementos do início da fila
+    # Melhor caso: Ω(1) - fila vazia, retorna uma lista vazia
+    # Caso médio:  Θ(k) - uma única aquisição da trava para o lote inteiro
+    # --------------------------------------------------------------------------------------------
+    # Retorna uma lista com até 'tamanho' elementos, na ordem da fila (vazia se não houver elementos).
+    # Com 'bloquear=True', espera até haver ao menos um elemento, a fila ser fechada ou o 'timeout' expirar.
+    def desenfileirar_lote(self, tamanho: int, bloquear: bool = False, timeout: float | None = None) -> list:
+        if tamanho < 1:
+            raise ValueError("O tamanho do lote deve ser um inteiro positivo.")
+
+        with self._nao_vazia:
+            if bloquear:
+                self._aguardar_elemento(timeout)
+
+            fila = self._fila
+            lote = [fila.popleft() for _ in range(min(tamanho, len(fila)))]
+            if lote:
+                self._nao_cheia.notify(len(lote))
+            return lote
+
+    # Complexidade: O(n) no total, para os n elementos consumidos.
+    # --------------------------------------------------------------------------------------------
+    # Itera pelos elementos da fila, removendo-os, até ela ficar vazia.
+    # Com 'bloquear=True', continua esperando por novos elementos até a fila ser fechada (ver 'fechar').
+    def drenar(self, bloquear: bool = False):
+        while True:
+            for elemento in self.desenfileirar_lote(1024, bloquear=bloquear):
+                yield elemento
+            if self._esgotada(bloquear):
+                return
+
+    # Mesmo que 'drenar', entregando os elementos em listas de até 'tamanho_lote'
+    def drenar_lotes(self, tamanho_lote: int, bloquear: bool = False):
+        while True:
+            lote = self.desenfileirar_lote(tamanho_lote, bloquear=bloquear)
+            if lote:
+                yield lote
+            if self._esgotada(bloquear):
+                return
+
+    # Indica que nenhum elemento novo será enfileirado: consumidores bloqueados terminam depois de esvaziar a fila
+    def fechar(self) -> None:
+        with self._trava:
+            self._fechada = True
+            self._nao_vazia.notify_all()
+            self._nao_cheia.notify_all()
 
     # Complexidade:
     # Pior caso:   O(1) - verificação do estado (constante) através da função len(), que por sua vez é constante
@@ -31,3 +129,36 @@ class Fila:
     # Caso médio:  Θ(1) - sempre constante, independentemente do estado da fila
     def esta_vazia(self) -> bool:
         return len(self._fila) == 0
+
+    def esta_cheia(self) -> bool:
+        return self._capacidade is not None and len(self._fila) >= self._capacidade
+
+    def __len__(self) -> int:
+        return len(self._fila)
+
+    # Chamados com a trava adquirida
+    def _aguardar_espaco(self, bloquear: bool, timeout: float | None) -> None:
+        if self._fechada:
+            raise ValueError("Não é possível enfileirar em uma fila fechada.")
+        if self._capacidade is None or len(self._fila) < self._capacidade:
+            return
+        if not bloquear:
+            raise TimeoutError("Fila cheia.")
+
+        prazo = None if timeout is None else monotonic() + timeout
+        while len(self._fila) >= self._capacidade and not self._fechada:
+            restante = None if prazo is None else prazo - monotonic()
+            if restante is not None and restante <= 0:
+                raise TimeoutError("Fila cheia.")
+            self._nao_cheia.wait(restante)
+        if self._fechada:
+            raise ValueError("Não é possível enfileirar em uma fila fechada.")
+
+    # Retorna False se o 'timeout' expirou sem elementos e sem a fila ser fechada
+    def _aguardar_elemento(self, timeout: float | None) -> bool:
+        return bool(self._nao_vazia.wait_for(lambda: self._fila or self._fechada, timeout))
+
+    # Sem bloqueio, o consumo termina quando a fila esvazia; com bloqueio, quando ela também estiver fechada
+    def _esgotada(self, bloquear: bool) -> bool:
+        with self._trava:
+            return not self._fila and (not bloquear or self._fechada)
@@ -0,0 +1,76 @@
+# Índice temporal: epochs (segundos desde 1970-01-01, UTC) em um array ordenado, com uma referência paralela por entrada
+# (o objeto Interacao, no modo padrão, ou o índice da linha no ArmazenamentoColunar).
+# Consultas por janela [inicio, fim) localizam as pontas por busca binária e visitam apenas as entradas dentro dela.
+# Como as interações costumam chegar em ordem cronológica, quase toda inserção é um append; entradas fora de ordem
+# marcam o índice para ser reordenado (de forma estável) na próxima consulta.
+from array import array
+from bisect import bisect_left
+
+
+class IndiceTemporal:
+    def __init__(self, tipo_referencia: str | None = None) -> None:
+        self._epochs: array = array("q")
+        # Com 'tipo_referencia' (typecode do módulo array), as referências são guardadas em um array compacto
+        self._tipo_referencia = tipo_referencia
+        self._referencias = array(tipo_referencia) if tipo_referencia else []
+        self._em_ordem: bool = True
+
+    # Complexidade:
+    # Pior caso:   O(1) amortizado - append nos dois arrays; a reordenação, se necessária, fica para a consulta.
+    # Melhor caso: Ω(1) - idem.
+    # Caso médio:  Θ(1) - idem.
+    def adicionar(self, epoch: int, referencia) -> None:
+        if self._epochs and epoch < self._epochs[-1]:
+            self._em_ordem = False
+        self._epochs.append(epoch)
+        self._referencias.append(referencia)
+
+    # Complexidade:
+    # Pior caso:   O(log n + k) - duas buscas binárias e visita das k entradas da janela
+    #                             (mais O(n log n) uma única vez, se houve inserções fora de ordem).
+    # Melhor caso: Ω(log n) - janela vazia.
+    # Caso médio:  Θ(log n + k) - idem ao pior caso, com o índice já ordenado.
+    # --------------------------------------------------------------------------------------------
+    # Gerador das referências com inicio <= epoch < fim, em ordem cronológica (empates na ordem de chegada).
+    # Limites None deixam a janela aberta.
+    def intervalo(self, inicio: int | None = None, fim: int | None = None):
+        posicao, limite = self._limites(inicio, fim)
+        referencias = self._referencias
+        for indice in range(posicao, limite):
+            yield referencias[indice]
+
+    # Mesmo que 'intervalo', devolvendo pares (epoch, referencia)
+    def itens_intervalo(self, inicio: int | None = None, fim: int | None = None):
+        posicao, limite = self._limites(inicio, fim)
+        epochs = self._epochs
+        referencias = self._referencias
+        for indice in range(posicao, limite):
+            yield epochs[indice], referencias[indice]
+
+    # Complexidade: O(log n) - apenas as duas buscas binárias.
+    def contar(self, inicio: int | None = None, fim: int | None = None) -> int:
+        posicao, limite = self._limites(inicio, fim)
+        return limite - posicao
+
+    def _limites(self, inicio: int | None, fim: int | None) -> tuple[int, int]:
+        self._ordenar()
+        posicao = 0 if inicio is None else bisect_left(self._epochs, inicio)
+        limite = len(self._epochs) if fim is None else bisect_left(self._epochs, fim)
+        return posicao, max(posicao, limite)
+
+    # Reordena as entradas por epoch (ordenação estável de uma permutação, O(n log n)).
+    # Cria arrays novos em vez de ordenar no lugar, para não afetar iterações em andamento.
+    def _ordenar(self) -> None:
+        if self._em_ordem:
+            return
+
+        epochs = self._epochs
+        ordem = sorted(range(len(epochs)), key=epochs.__getitem__)
+
+        self._epochs = array("q", [epochs[i] for i in ordem])
+        referencias = [self._referencias[i] for i in ordem]
+        self._referencias = array(self._tipo_referencia, referencias) if self._tipo_referencia else referencias
+        self._em_ordem = True
+
+    def __len__(self) -> int:
+        return len(self._epochs)
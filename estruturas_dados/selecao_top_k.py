@@ -0,0 +1,37 @@
+# Seleção dos k maiores elementos de uma coleção, em ordem decrescente.
+# Substitui o padrão "ordenar tudo com Quick Sort, inverter e fatiar" usado nos relatórios:
+# o heap de tamanho k evita tanto o O(n²) do Quick Sort com muitos empates quanto a recursão profunda.
+from heapq import heappush, heapreplace
+
+
+# Complexidade:
+# Pior caso:   O(n log k) - cada elemento pode substituir o menor item do heap, com custo O(log k).
+# Melhor caso: Ω(n)       - os k primeiros já são os maiores, e os demais só são comparados com o topo do heap.
+# Caso médio:  Θ(n log k) - percorre os n elementos mantendo um heap de no máximo k itens.
+# Espaço:      O(k)       - apenas o heap com os k candidatos é mantido.
+# --------------------------------------------------------------------------------------------
+# O desempate é estável: entre elementos com a mesma chave, vence o que aparece primeiro em 'elementos'.
+# Como as árvores são percorridas em ordem de ID, isso significa que, em caso de empate, o menor ID vem antes.
+# Se k for None, retorna todos os elementos ordenados de forma decrescente (O(n log n), também estável).
+def selecionar_top_k(elementos, k: int | None = None, key=lambda x: x) -> list:
+    if k is None:
+        # 'sorted' com reverse=True preserva a ordem original dos empates
+        return sorted(elementos, key=key, reverse=True)
+
+    if k <= 0:
+        return []
+
+    # Heap mínimo de tuplas (chave, -posição, elemento): o topo é sempre o pior candidato atual.
+    # A posição negativa faz com que, em caso de empate, o elemento mais antigo seja considerado "maior",
+    # e garante que o próprio elemento nunca precise ser comparado.
+    heap: list = []
+    for posicao, elemento in enumerate(elementos):
+        candidato = (key(elemento), -posicao, elemento)
+
+        if len(heap) < k:
+            heappush(heap, candidato)
+        elif candidato > heap[0]:
+            heapreplace(heap, candidato)
+
+    heap.sort(reverse=True)
+    return [elemento for _, _, elemento in heap]
@@ -0,0 +1,48 @@
+# Tabela de símbolos (codificação por dicionário): cada texto distinto recebe um código inteiro sequencial
+# e é guardado uma única vez. Linhas que repetem o mesmo texto passam a compartilhar o mesmo objeto str
+# (ou a guardar apenas o código), então a memória não cresce com as repetições.
+
+
+class TabelaSimbolos:
+    def __init__(self, simbolos: list[str] | None = None) -> None:
+        # Com uma lista já pronta (por exemplo, lida de um snapshot), ela é usada sem cópia
+        # e o índice reverso só é montado na primeira codificação
+        self._simbolos: list[str] = simbolos if simbolos is not None else []
+        self._codigos: dict[str, int] | None = None if simbolos else {}
+
+    # Complexidade:
+    # Pior caso:   O(n) - apenas na primeira chamada após criar a tabela a partir de uma lista (monta o índice reverso).
+    # Melhor caso: Ω(1) - texto já registrado.
+    # Caso médio:  Θ(1) - consulta/inserção em dicionário.
+    def codificar(self, simbolo: str) -> int:
+        codigos = self._codigos
+        if codigos is None:
+            codigos = self._codigos = {texto: codigo for codigo, texto in enumerate(self._simbolos)}
+
+        codigo = codigos.get(simbolo)
+        if codigo is None:
+            codigo = codigos[simbolo] = len(self._simbolos)
+            self._simbolos.append(simbolo)
+        return codigo
+
+    # Complexidade: Θ(1) - acesso por posição.
+    def decodificar(self, codigo: int) -> str:
+        return self._simbolos[codigo]
+
+    # Complexidade: Θ(1) - como 'codificar'.
+    # Retorna o objeto str guardado na tabela para este texto (o mesmo objeto para todas as repetições).
+    def internar(self, simbolo: str) -> str:
+        return self._simbolos[self.codificar(simbolo)]
+
+    # Lista dos textos, na ordem dos códigos (sem cópia)
+    @property
+    def simbolos(self) -> list[str]:
+        return self._simbolos
+
+    def __contains__(self, simbolo: str) -> bool:
+        if self._codigos is None:
+            return simbolo in self._simbolos
+        return simbolo in self._codigos
+
+    def __len__(self) -> int:
+        return len(self._simbolos)
@@ -1,5 +1,7 @@
+import argparse
 import os
 from analise.sistema import SistemaAnaliseEngajamento
+from analise.instrumentacao import exibir_instrumentacao
 
 def limpar_tela():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -13,10 +15,19 @@ def mostrar_menu():
     print("4️⃣  Relatório: conteúdos mais engajados")
     print("5️⃣  Relatório: comentários por conteúdo")
     print("6️⃣  Sair 🚪")
+    print("7️⃣  Instrumentação: contadores e tempos por fase")
     print("="*35)
 
+def ler_argumentos():
+    parser = argparse.ArgumentParser(description="Análise de Engajamento Globotech")
+    parser.add_argument("--instrumentacao", nargs="?", const="", metavar="ARQUIVO_JSON",
+                        help="liga a instrumentação desde o início; se ARQUIVO_JSON for informado, "
+                             "o resumo é gravado nele ao sair")
+    return parser.parse_args()
+
 def main():
-    sistema = SistemaAnaliseEngajamento()
+    args = ler_argumentos()
+    sistema = SistemaAnaliseEngajamento(instrumentacao=args.instrumentacao is not None)
     caminho_csv = ""
 
     while True:
@@ -54,9 +65,20 @@ def main():
             input("⬆️ Pressione Enter para continuar...")
 
         elif opcao == "6":
+            if args.instrumentacao and sistema.instrumentacao is not None:
+                exibir_instrumentacao(sistema.instrumentacao.resumo(), formato="json", destino=args.instrumentacao)
+                print(f"📈 Instrumentação gravada em '{args.instrumentacao}'")
             print("👋 Até a próxima!")
             break
 
+        elif opcao == "7":
+            if sistema.instrumentacao is None:
+                sistema.ativar_instrumentacao()
+                print("📈 Instrumentação ligada: as próximas cargas e relatórios serão medidos.")
+            else:
+                exibir_instrumentacao(sistema.instrumentacao.resumo())
+            input("⬆️ Pressione Enter para continuar...")
+
         else:
             input("❗ Opção inválida! Pressione Enter para tentar novamente...")
 
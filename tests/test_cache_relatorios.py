@@ -0,0 +1,46 @@
+"""
+Resultados devolvidos pelo cache de relatórios: alterar o que uma chamada recebeu não afeta as seguintes.
+
+Uso (a partir da raiz do projeto):
+    python -m unittest tests.test_cache_relatorios
+"""
+import contextlib
+import io
+import unittest
+
+from analise.sistema import SistemaAnaliseEngajamento
+
+CAMINHO_CSV = "interacoes_globo.csv"
+
+
+class TestCacheRelatorios(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sistema = SistemaAnaliseEngajamento()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.sistema.processar_interacoes_csv(CAMINHO_CSV, modo="streaming")
+
+    def test_alterar_lista_devolvida_nao_afeta_o_cache(self) -> None:
+        esperado = list(self.sistema.calcular_atividade_usuarios(top_n=3))
+        resultado = self.sistema.calcular_atividade_usuarios(top_n=3)
+        resultado.append("junk")
+        resultado[0] = None
+        self.assertEqual(self.sistema.calcular_atividade_usuarios(top_n=3), esperado)
+        self.assertNotIn("junk", self.sistema.calcular_atividade_usuarios(top_n=3))
+
+    def test_alterar_listas_aninhadas_nao_afeta_o_cache(self) -> None:
+        comentarios = self.sistema.calcular_comentarios_por_conteudo()
+        esperado = [(id_conteudo, nome, list(lista)) for id_conteudo, nome, lista in comentarios]
+        for _, _, lista in comentarios:
+            lista.append("junk")
+        self.assertEqual(self.sistema.calcular_comentarios_por_conteudo(), esperado)
+
+        secoes = self.sistema.calcular_secoes_analiticas()
+        esperado_secoes = {nome: list(linhas) for nome, linhas in secoes.items()}
+        for linhas in secoes.values():
+            linhas.clear()
+        secoes["junk"] = []
+        self.assertEqual(self.sistema.calcular_secoes_analiticas(), esperado_secoes)
+
+
+if __name__ == "__main__":
+    unittest.main()
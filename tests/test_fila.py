@@ -0,0 +1,43 @@
+"""
+Remoção da Fila com e sem bloqueio, quando ela está vazia.
+
+Uso (a partir da raiz do projeto):
+    python -m unittest tests.test_fila
+"""
+import threading
+import unittest
+
+from estruturas_dados.fila import Fila
+
+MENSAGEM_FILA_VAZIA = "Não foi possível remover elemento. Fila vazia."
+
+
+class TestFila(unittest.TestCase):
+    def test_sem_bloqueio_retorna_a_mensagem_de_fila_vazia(self) -> None:
+        self.assertEqual(Fila().desenfileirar(), MENSAGEM_FILA_VAZIA)
+
+    def test_com_bloqueio_lanca_timeout_error_quando_o_prazo_expira(self) -> None:
+        fila = Fila()
+        with self.assertRaises(TimeoutError):
+            fila.desenfileirar(bloquear=True, timeout=0.01)
+
+        # Um elemento igual à mensagem legada continua distinguível do prazo expirado
+        fila.enfileirar(MENSAGEM_FILA_VAZIA)
+        self.assertEqual(fila.desenfileirar(bloquear=True, timeout=0.01), MENSAGEM_FILA_VAZIA)
+
+    def test_com_bloqueio_espera_por_um_elemento(self) -> None:
+        fila = Fila()
+        threading.Timer(0.01, fila.enfileirar, ("linha",)).start()
+        self.assertEqual(fila.desenfileirar(bloquear=True, timeout=5), "linha")
+
+    def test_com_bloqueio_lanca_value_error_com_a_fila_fechada_e_vazia(self) -> None:
+        fila = Fila()
+        fila.enfileirar("linha")
+        fila.fechar()
+        self.assertEqual(fila.desenfileirar(bloquear=True), "linha")
+        with self.assertRaises(ValueError):
+            fila.desenfileirar(bloquear=True, timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Ingestão incremental de um CSV que cresce por acréscimo, comparada à leitura do arquivo inteiro no modo streaming.
+
+Uso (a partir da raiz do projeto):
+    python -m unittest tests.test_ingestao_incremental
+"""
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+from analise.sistema import SistemaAnaliseEngajamento
+from benchmarks.gerador_sintetico import COLUNAS
+
+
+def _conteudo_csv(linhas: int) -> bytes:
+    saida = io.StringIO()
+    escritor = csv.writer(saida, lineterminator="\n")
+    escritor.writerow(COLUNAS)
+    for i in range(linhas):
+        # Comentários com quebras de linha e aspas: o registro do CSV ocupa várias linhas físicas
+        escritor.writerow((i % 20 + 1, f"Conteúdo {i % 20 + 1}", i % 300 + 1,
+                           f"2024-10-20 10:{i // 60 % 60:02d}:{i % 60:02d}", "Globoplay", "comment", 0,
+                           f'primeira linha {i}\nsegunda "linha"\r\nfim'))
+    return saida.getvalue().encode("utf-8")
+
+
+class TestIngestaoIncremental(unittest.TestCase):
+    def setUp(self) -> None:
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        self.caminho_arquivo = os.path.join(diretorio.name, "interacoes.csv")
+        self.dados = _conteudo_csv(3_000)
+
+    def _processar(self, sistema: SistemaAnaliseEngajamento, modo: str) -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return sistema.processar_interacoes_csv(self.caminho_arquivo, modo=modo)
+
+    def _comentarios_streaming(self) -> list:
+        with open(self.caminho_arquivo, "wb") as arquivo:
+            arquivo.write(self.dados)
+        sistema = SistemaAnaliseEngajamento(capacidade_cache_relatorios=0)
+        self.assertEqual(self._processar(sistema, "streaming"), 3_000)
+        return sistema.calcular_comentarios_por_conteudo()
+
+    def test_comentarios_com_quebra_de_linha(self):
+        esperado = self._comentarios_streaming()
+
+        sistema = SistemaAnaliseEngajamento(capacidade_cache_relatorios=0)
+        self.assertEqual(self._processar(sistema, "incremental"), 3_000)
+        self.assertEqual(sistema.linhas_rejeitadas, 0)
+        self.assertEqual(sistema.calcular_comentarios_por_conteudo(), esperado)
+
+    def test_acrescimos_cortando_registros_e_cabecalho(self):
+        esperado = self._comentarios_streaming()
+
+        # Começa vazio; cada acréscimo pode terminar no meio do cabeçalho, de uma linha ou de um campo entre aspas
+        open(self.caminho_arquivo, "wb").close()
+        sistema = SistemaAnaliseEngajamento(capacidade_cache_relatorios=0)
+        lidas = self._processar(sistema, "incremental")
+        for inicio in range(0, len(self.dados), 7_777):
+            with open(self.caminho_arquivo, "ab") as arquivo:
+                arquivo.write(self.dados[inicio:inicio + 7_777])
+            lidas += self._processar(sistema, "incremental")
+
+        self.assertEqual(lidas, 3_000)
+        self.assertEqual(sistema.linhas_rejeitadas, 0)
+        self.assertEqual(sistema.calcular_comentarios_por_conteudo(), esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
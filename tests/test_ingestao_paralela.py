@@ -0,0 +1,71 @@
+"""
+Paridade entre a leitura paralela (intervalos de bytes convertidos em processos) e a leitura serial do CSV.
+
+Uso (a partir da raiz do projeto):
+    python -m unittest tests.test_ingestao_paralela
+"""
+import csv
+import os
+import tempfile
+import unittest
+
+from analise.ingestao_arquivos import abrir_csv
+from analise.ingestao_paralela import converter_csv_em_paralelo
+from analise.sistema import SistemaAnaliseEngajamento, converter_linha_csv
+from benchmarks.gerador_sintetico import COLUNAS
+
+# Caracteres que str.splitlines() trata como quebra de linha, mas o csv.reader não
+SEPARADORES_UNICODE = ("\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+
+
+def _gerar_csv(caminho_arquivo: str, linhas: int) -> None:
+    with open(caminho_arquivo, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo, lineterminator="\n")
+        escritor.writerow(COLUNAS)
+        for i in range(linhas):
+            tipo = ("view_start", "comment", "like")[i % 3]
+            comentario = ""
+            if tipo == "comment":
+                separador = SEPARADORES_UNICODE[i % len(SEPARADORES_UNICODE)]
+                comentario = f"comentário {i}{separador}continua"
+            escritor.writerow((i % 50 + 1, f"Conteúdo {i % 50 + 1}", i % 700 + 1,
+                               f"2024-10-20 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}", "Globoplay", tipo,
+                               120 if tipo == "view_start" else 0, comentario))
+
+
+class TestParidadeIngestaoParalela(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._diretorio = tempfile.TemporaryDirectory()
+        cls.caminho_arquivo = os.path.join(cls._diretorio.name, "interacoes.csv")
+        _gerar_csv(cls.caminho_arquivo, 6_000)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._diretorio.cleanup()
+
+    def test_conversao_igual_a_serial_com_varios_intervalos(self):
+        with abrir_csv(self.caminho_arquivo) as arquivo_csv:
+            serial = [converter_linha_csv(linha) for linha in csv.DictReader(arquivo_csv)]
+
+        paralelo = [resultado
+                    for resultados in converter_csv_em_paralelo(self.caminho_arquivo, num_processos=2,
+                                                                tamanho_intervalo=16 * 1024)
+                    for resultado in resultados]
+
+        self.assertEqual(paralelo, serial)
+
+    def test_relatorios_iguais_aos_do_modo_streaming(self):
+        resultados = {}
+        for modo in ("streaming", "paralelo"):
+            sistema = SistemaAnaliseEngajamento(capacidade_cache_relatorios=0)
+            lidas = sistema.processar_interacoes_csv(self.caminho_arquivo, modo=modo, num_processos=2)
+            resultados[modo] = (lidas, sistema.linhas_rejeitadas, sistema.calcular_comentarios_por_conteudo(),
+                                sistema.calcular_conteudos_mais_engajados())
+
+        self.assertEqual(resultados["streaming"][:2], (6_000, 0))
+        self.assertEqual(resultados["paralelo"], resultados["streaming"])
+
+
+if __name__ == "__main__":
+    unittest.main()
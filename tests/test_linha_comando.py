@@ -0,0 +1,35 @@
+"""
+Saída da linha de comando (python -m analise) com vários relatórios em json ou csv.
+
+Uso (a partir da raiz do projeto):
+    python -m unittest tests.test_linha_comando
+"""
+import contextlib
+import io
+import json
+import unittest
+
+from analise.__main__ import SAIDA_SUCESSO, main
+
+CAMINHO_CSV = "interacoes_globo.csv"
+
+
+class TestLinhaComando(unittest.TestCase):
+    def test_varios_relatorios_json_formam_um_unico_documento(self) -> None:
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            codigo = main([CAMINHO_CSV, "--silencioso", "--formato", "json", "--top-n", "3",
+                           "--relatorios", "atividade_usuarios,secoes_analiticas"])
+        self.assertEqual(codigo, SAIDA_SUCESSO)
+        documento = json.loads(saida.getvalue())
+        self.assertEqual(list(documento), ["atividade_usuarios", "secoes_analiticas"])
+        self.assertEqual(len(documento["atividade_usuarios"]["atividade_usuarios"]), 3)
+
+    def test_varios_relatorios_csv_exigem_saida(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as contexto:
+            main([CAMINHO_CSV, "--silencioso", "--formato", "csv", "--relatorios", "todos"])
+        self.assertEqual(contexto.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()